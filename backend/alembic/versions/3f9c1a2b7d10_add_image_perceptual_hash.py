@@ -0,0 +1,28 @@
+"""add image perceptual hash
+
+Revision ID: 3f9c1a2b7d10
+Revises: d42a4bc96954
+Create Date: 2026-10-19 09:12:04.118532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c1a2b7d10'
+down_revision: Union[str, None] = 'd42a4bc96954'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('images', sa.Column('perceptual_hash', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('images', 'perceptual_hash')
@@ -0,0 +1,28 @@
+"""add image placeholder color
+
+Revision ID: 8b2e6d4f1c37
+Revises: 3f9c1a2b7d10
+Create Date: 2026-10-19 10:03:41.552907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e6d4f1c37'
+down_revision: Union[str, None] = '3f9c1a2b7d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('images', sa.Column('placeholder_color', sa.String(length=7), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('images', 'placeholder_color')
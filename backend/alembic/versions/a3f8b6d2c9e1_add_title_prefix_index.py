@@ -0,0 +1,40 @@
+"""add title prefix index
+
+Revision ID: a3f8b6d2c9e1
+Revises: f1c6d3a8e2b7
+Create Date: 2026-10-19 23:27:05.841392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f8b6d2c9e1'
+down_revision: Union[str, None] = 'f1c6d3a8e2b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # text_pattern_ops still serves equality, so the plain lower(title) index is replaced rather than duplicated
+    op.drop_index('ix_articles_project_id_lower_title', table_name='articles')
+    op.create_index(
+        'ix_articles_project_id_lower_title', 'articles', ['project_id', sa.text('lower(title) text_pattern_ops')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_articles_project_id_updated_at', 'articles', ['project_id', 'updated_at', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_articles_project_id_updated_at', table_name='articles')
+    op.drop_index('ix_articles_project_id_lower_title', table_name='articles')
+    op.create_index(
+        'ix_articles_project_id_lower_title', 'articles', ['project_id', sa.text('lower(title)')], unique=False
+    )
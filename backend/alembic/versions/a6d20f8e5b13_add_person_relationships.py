@@ -0,0 +1,90 @@
+"""add person relationships
+
+Revision ID: a6d20f8e5b13
+Revises: f3b7c2d19a64
+Create Date: 2026-10-19 16:20:37.561904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d20f8e5b13'
+down_revision: Union[str, None] = 'f3b7c2d19a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_articles_project_id_lower_title', 'articles', ['project_id', sa.text('lower(title)')], unique=False
+    )
+
+    op.create_table(
+        'person_relationships',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('source_article_id', sa.Integer(), nullable=False),
+        sa.Column('target_article_id', sa.Integer(), nullable=True),
+        sa.Column('target_name', sa.String(), nullable=False),
+        sa.Column('relationship_type', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['source_article_id'], ['persons.article_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['target_article_id'], ['persons.article_id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        op.f('ix_person_relationships_source_article_id'), 'person_relationships', ['source_article_id'], unique=False
+    )
+    op.create_index(
+        op.f('ix_person_relationships_target_article_id'), 'person_relationships', ['target_article_id'], unique=False
+    )
+    op.create_index(
+        op.f('ix_person_relationships_relationship_type'), 'person_relationships', ['relationship_type'], unique=False
+    )
+    op.create_index(
+        'ix_person_relationships_project_target_name',
+        'person_relationships',
+        ['project_id', sa.text('lower(target_name)')],
+        unique=False,
+    )
+
+    # Backfill from the JSONB relationship lists, resolving names to the oldest person with that name
+    # in the same project
+    op.execute("""
+        WITH names AS (
+            SELECT DISTINCT ON (a.project_id, lower(a.title)) a.project_id, lower(a.title) AS name, p.article_id
+            FROM articles a
+            JOIN persons p ON p.article_id = a.id
+            ORDER BY a.project_id, lower(a.title), p.article_id
+        )
+        INSERT INTO person_relationships (project_id, source_article_id, target_article_id, target_name,
+                                          relationship_type, description, status, position)
+        SELECT a.project_id, p.article_id, t.article_id, r.rel->>'person_name',
+               lower(r.rel->>'relationship_type'), r.rel->>'description',
+               coalesce(r.rel->>'status', 'active'), r.ord - 1
+        FROM persons p
+        JOIN articles a ON a.id = p.article_id
+        CROSS JOIN LATERAL jsonb_array_elements(
+            CASE WHEN jsonb_typeof(p.person_data->'relationships') = 'array'
+                 THEN p.person_data->'relationships' ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS r(rel, ord)
+        LEFT JOIN names t ON t.project_id = a.project_id AND t.name = lower(r.rel->>'person_name')
+        WHERE coalesce(r.rel->>'person_name', '') <> '' AND coalesce(r.rel->>'relationship_type', '') <> ''
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_person_relationships_project_target_name', table_name='person_relationships')
+    op.drop_index(op.f('ix_person_relationships_relationship_type'), table_name='person_relationships')
+    op.drop_index(op.f('ix_person_relationships_target_article_id'), table_name='person_relationships')
+    op.drop_index(op.f('ix_person_relationships_source_article_id'), table_name='person_relationships')
+    op.drop_table('person_relationships')
+    op.drop_index('ix_articles_project_id_lower_title', table_name='articles')
@@ -0,0 +1,71 @@
+"""add article change versions
+
+Revision ID: b4e7d1f9c2a6
+Revises: a3f8b6d2c9e1
+Create Date: 2026-10-20 10:14:37.502816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e7d1f9c2a6'
+down_revision: Union[str, None] = 'a3f8b6d2c9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Each transaction that writes a project's articles takes the next project_stats.article_version
+# once, on its first article row, and stamps it on every article it writes. Taking it locks the
+# stats row until commit, so versions become visible in order: once a version is committed, every
+# row with a lower one is too. updated_at cannot give that, as it is the transaction start time.
+FUNCTION_BODY = """
+    DECLARE
+        setting text := 'mythos.article_version_' || NEW.project_id;
+        version bigint := nullif(current_setting(setting, true), '')::bigint;
+    BEGIN
+        IF version IS NULL THEN
+            UPDATE project_stats SET article_version = article_version + 1
+            WHERE project_id = NEW.project_id
+            RETURNING article_version INTO version;
+            IF FOUND THEN
+                PERFORM set_config(setting, version::text, true);
+            END IF;
+        END IF;
+        NEW.change_version := coalesce(version, 0);
+        RETURN NEW;
+    END;
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'project_stats', sa.Column('article_version', sa.BigInteger(), server_default='0', nullable=False)
+    )
+    op.add_column('articles', sa.Column('change_version', sa.BigInteger(), server_default='0', nullable=False))
+    op.create_index(
+        'ix_articles_project_id_change_version', 'articles', ['project_id', 'change_version'], unique=False
+    )
+
+    op.execute(f"""
+        CREATE FUNCTION articles_change_version() RETURNS trigger AS $$
+        {FUNCTION_BODY}
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        'CREATE TRIGGER articles_change_version BEFORE INSERT OR UPDATE ON articles '
+        'FOR EACH ROW EXECUTE FUNCTION articles_change_version()'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER IF EXISTS articles_change_version ON articles')
+    op.execute('DROP FUNCTION IF EXISTS articles_change_version()')
+    op.drop_index('ix_articles_project_id_change_version', table_name='articles')
+    op.drop_column('articles', 'change_version')
+    op.drop_column('project_stats', 'article_version')
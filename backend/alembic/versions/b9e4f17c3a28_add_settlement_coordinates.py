@@ -0,0 +1,58 @@
+"""add settlement coordinates
+
+Revision ID: b9e4f17c3a28
+Revises: a6d20f8e5b13
+Create Date: 2026-10-19 17:41:09.224187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e4f17c3a28'
+down_revision: Union[str, None] = 'a6d20f8e5b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('settlements', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('settlements', sa.Column('longitude', sa.Float(), nullable=True))
+
+    # Copy coordinates out of settlement_data where both are numbers within range. The
+    # casts sit inside CASE because WHERE and AND give no guarantee of evaluation order
+    op.execute("""
+        UPDATE settlements s
+        SET latitude = c.lat, longitude = c.lng
+        FROM (
+            SELECT id,
+                   CASE WHEN jsonb_typeof(settlement_data->'coordinates'->'lat') = 'number' THEN
+                       CASE WHEN abs((settlement_data->'coordinates'->>'lat')::numeric) <= 90
+                            THEN (settlement_data->'coordinates'->>'lat')::float8 END
+                   END AS lat,
+                   CASE WHEN jsonb_typeof(settlement_data->'coordinates'->'lng') = 'number' THEN
+                       CASE WHEN abs((settlement_data->'coordinates'->>'lng')::numeric) <= 180
+                            THEN (settlement_data->'coordinates'->>'lng')::float8 END
+                   END AS lng
+            FROM settlements
+        ) c
+        WHERE c.id = s.id
+          AND c.lat IS NOT NULL
+          AND c.lng IS NOT NULL
+    """)
+
+    op.create_index(
+        'ix_settlements_location', 'settlements', [sa.text('point(longitude, latitude)')],
+        unique=False, postgresql_using='gist',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_settlements_location', table_name='settlements', postgresql_using='gist')
+    op.drop_column('settlements', 'longitude')
+    op.drop_column('settlements', 'latitude')
@@ -0,0 +1,182 @@
+"""add location hierarchy
+
+Revision ID: c2a8e5f71d94
+Revises: b9e4f17c3a28
+Create Date: 2026-10-19 18:52:16.705342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2a8e5f71d94'
+down_revision: Union[str, None] = 'b9e4f17c3a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Per-project backfill: region nodes from settlement regions, settlement nodes under
+# them, place nodes for person locations, the links, and finally the closure rows
+BACKFILL_STATEMENTS = [
+    """
+    INSERT INTO locations (project_id, name, location_type)
+    SELECT DISTINCT ON (lower(btrim(s.region))) :project_id, btrim(s.region), 'region'
+    FROM settlements s
+    JOIN articles a ON a.id = s.article_id
+    WHERE a.project_id = :project_id
+      AND btrim(coalesce(s.region, '')) <> ''
+      AND NOT EXISTS (
+          SELECT 1 FROM locations l
+          WHERE l.project_id = :project_id AND l.article_id IS NULL AND lower(l.name) = lower(btrim(s.region))
+      )
+    ORDER BY lower(btrim(s.region)), btrim(s.region)
+    """,
+    """
+    WITH regions AS (
+        SELECT DISTINCT ON (lower(name)) lower(name) AS key, id
+        FROM locations
+        WHERE project_id = :project_id AND article_id IS NULL
+        ORDER BY lower(name), id
+    )
+    INSERT INTO locations (project_id, name, location_type, article_id, parent_id)
+    SELECT :project_id, a.title, 'settlement', a.id, r.id
+    FROM settlements s
+    JOIN articles a ON a.id = s.article_id
+    LEFT JOIN regions r ON r.key = lower(btrim(s.region))
+    WHERE a.project_id = :project_id
+      AND NOT EXISTS (SELECT 1 FROM locations l WHERE l.article_id = a.id)
+    """,
+    """
+    UPDATE settlements s SET location_id = l.id
+    FROM locations l
+    WHERE l.article_id = s.article_id AND l.project_id = :project_id AND s.location_id IS DISTINCT FROM l.id
+    """,
+    """
+    INSERT INTO locations (project_id, name, location_type)
+    SELECT DISTINCT ON (lower(n.name)) :project_id, n.name, 'place'
+    FROM persons p
+    JOIN articles a ON a.id = p.article_id
+    CROSS JOIN LATERAL (VALUES (btrim(p.current_location)), (btrim(p.person_data->>'birthplace'))) n(name)
+    WHERE a.project_id = :project_id
+      AND coalesce(n.name, '') <> ''
+      AND NOT EXISTS (
+          SELECT 1 FROM locations l WHERE l.project_id = :project_id AND lower(l.name) = lower(n.name)
+      )
+    ORDER BY lower(n.name), n.name
+    """,
+    """
+    WITH names AS (
+        SELECT DISTINCT ON (lower(name)) lower(name) AS key, id
+        FROM locations
+        WHERE project_id = :project_id
+        ORDER BY lower(name), article_id IS NULL, id
+    )
+    UPDATE persons p SET location_id = x.location_id, birthplace_id = x.birthplace_id
+    FROM (
+        SELECT pe.id, current.id AS location_id, birth.id AS birthplace_id
+        FROM persons pe
+        JOIN articles a ON a.id = pe.article_id
+        LEFT JOIN names current ON current.key = lower(btrim(pe.current_location))
+        LEFT JOIN names birth ON birth.key = lower(btrim(pe.person_data->>'birthplace'))
+        WHERE a.project_id = :project_id
+    ) x
+    WHERE x.id = p.id
+      AND (p.location_id IS DISTINCT FROM x.location_id OR p.birthplace_id IS DISTINCT FROM x.birthplace_id)
+    """,
+    """
+    WITH RECURSIVE tree(ancestor_id, descendant_id, depth) AS (
+        SELECT id, id, 0 FROM locations WHERE project_id = :project_id
+        UNION ALL
+        SELECT tree.ancestor_id, l.id, tree.depth + 1
+        FROM tree
+        JOIN locations l ON l.parent_id = tree.descendant_id
+        WHERE tree.depth < 1000
+    )
+    INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+    SELECT ancestor_id, descendant_id, depth FROM tree
+    """,
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'locations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('location_type', sa.String(), nullable=False),
+        sa.Column('parent_id', sa.Integer(), nullable=True),
+        sa.Column('article_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['parent_id'], ['locations.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('article_id'),
+    )
+    op.create_index(op.f('ix_locations_id'), 'locations', ['id'], unique=False)
+    op.create_index(op.f('ix_locations_project_id'), 'locations', ['project_id'], unique=False)
+    op.create_index(op.f('ix_locations_parent_id'), 'locations', ['parent_id'], unique=False)
+    op.create_index(
+        'ix_locations_project_id_lower_name', 'locations', ['project_id', sa.text('lower(name)')], unique=False
+    )
+
+    op.create_table(
+        'location_closure',
+        sa.Column('ancestor_id', sa.Integer(), nullable=False),
+        sa.Column('descendant_id', sa.Integer(), nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['ancestor_id'], ['locations.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['descendant_id'], ['locations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id'),
+    )
+    op.create_index(op.f('ix_location_closure_descendant_id'), 'location_closure', ['descendant_id'], unique=False)
+
+    op.add_column('persons', sa.Column('location_id', sa.Integer(), nullable=True))
+    op.add_column('persons', sa.Column('birthplace_id', sa.Integer(), nullable=True))
+    op.add_column('settlements', sa.Column('location_id', sa.Integer(), nullable=True))
+
+    connection = op.get_bind()
+    project_ids = connection.execute(sa.text('SELECT id FROM projects ORDER BY id')).scalars().all()
+    for project_id in project_ids:
+        for statement in BACKFILL_STATEMENTS:
+            connection.execute(sa.text(statement), {'project_id': project_id})
+
+    # Constraints and indexes go on after the backfill so it doesn't maintain them row by row
+    op.create_foreign_key(
+        'persons_location_id_fkey', 'persons', 'locations', ['location_id'], ['id'], ondelete='SET NULL'
+    )
+    op.create_foreign_key(
+        'persons_birthplace_id_fkey', 'persons', 'locations', ['birthplace_id'], ['id'], ondelete='SET NULL'
+    )
+    op.create_foreign_key(
+        'settlements_location_id_fkey', 'settlements', 'locations', ['location_id'], ['id'], ondelete='SET NULL'
+    )
+    op.create_index(op.f('ix_persons_location_id'), 'persons', ['location_id'], unique=False)
+    op.create_index(op.f('ix_persons_birthplace_id'), 'persons', ['birthplace_id'], unique=False)
+    op.create_index(op.f('ix_settlements_location_id'), 'settlements', ['location_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_settlements_location_id'), table_name='settlements')
+    op.drop_index(op.f('ix_persons_birthplace_id'), table_name='persons')
+    op.drop_index(op.f('ix_persons_location_id'), table_name='persons')
+    op.drop_constraint('settlements_location_id_fkey', 'settlements', type_='foreignkey')
+    op.drop_constraint('persons_birthplace_id_fkey', 'persons', type_='foreignkey')
+    op.drop_constraint('persons_location_id_fkey', 'persons', type_='foreignkey')
+    op.drop_column('settlements', 'location_id')
+    op.drop_column('persons', 'birthplace_id')
+    op.drop_column('persons', 'location_id')
+    op.drop_index(op.f('ix_location_closure_descendant_id'), table_name='location_closure')
+    op.drop_table('location_closure')
+    op.drop_index('ix_locations_project_id_lower_name', table_name='locations')
+    op.drop_index(op.f('ix_locations_parent_id'), table_name='locations')
+    op.drop_index(op.f('ix_locations_project_id'), table_name='locations')
+    op.drop_index(op.f('ix_locations_id'), table_name='locations')
+    op.drop_table('locations')
@@ -0,0 +1,28 @@
+"""index image file path
+
+Revision ID: c5d71e0a9f42
+Revises: 8b2e6d4f1c37
+Create Date: 2026-10-19 11:27:15.304611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d71e0a9f42'
+down_revision: Union[str, None] = '8b2e6d4f1c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_images_file_path'), 'images', ['file_path'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_images_file_path'), table_name='images')
@@ -0,0 +1,180 @@
+"""add timeline events
+
+Revision ID: d5e8b1c4a7f3
+Revises: c2a8e5f71d94
+Create Date: 2026-10-19 20:14:37.518204
+
+"""
+import re
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e8b1c4a7f3'
+down_revision: Union[str, None] = 'c2a8e5f71d94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# A frozen copy of the default calendar's date parsing as it was when this revision was
+# written, so replaying the migration does not depend on the current application code
+_MONTHS = [
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+]
+_SEASONS = {"spring": 3, "summer": 6, "autumn": 9, "fall": 9, "winter": 12}
+# (name, start year, counts backward), longest names first; 1 BC is year 0
+_ERAS = [("BCE", 1, True), ("BC", 1, True), ("CE", 0, False), ("AD", 0, False)]
+_ERA_PATTERNS = [
+    (start, reverse, re.compile(r"(?<!\w)" + name + r"(?!\w)", re.IGNORECASE)) for name, start, reverse in _ERAS
+]
+_ISO_DATE = re.compile(r"^\s*(-?\d+)-(\d{1,2})(?:-(\d{1,2}))?\s*$")
+_NUMBER = re.compile(r"(?<![\w-])(-?\d+)(?:st|nd|rd|th)?(?!\w)", re.IGNORECASE)
+_WORD = re.compile(r"[^\W\d_]+")
+_BESIDE = re.compile(r"[\s,.]*(?:of[\s,.]+)?")
+
+
+def _dated_month(text: str, numbers: list) -> tuple:
+    """(month, is a month rather than a season) for the first one named beside a number."""
+    for word in _WORD.finditer(text):
+        if not any(
+            _BESIDE.fullmatch(text[number.end():word.start()] if number.end() <= word.start()
+                              else text[word.end():number.start()])
+            for number in numbers
+        ):
+            continue
+        name = word.group().lower()
+        for number, month in enumerate(_MONTHS, start=1):
+            if name == month or (len(name) >= 3 and month.startswith(name)):
+                return number, True
+        if name in _SEASONS:
+            return _SEASONS[name], False
+    return 0, False
+
+
+def _sort_key(text: Optional[str]) -> Optional[int]:
+    """year * 10000 + month * 100 + day under the default calendar, or None if no year can be read."""
+    if not text or not text.strip():
+        return None
+    iso = _ISO_DATE.match(text)
+    if iso:
+        year, month, day = int(iso.group(1)), int(iso.group(2)), int(iso.group(3) or 0)
+    else:
+        era = None
+        for start, reverse, pattern in _ERA_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                era = (start, reverse)
+                text = text[:match.start()] + " " + text[match.end():]
+                break
+        matches = list(_NUMBER.finditer(text))
+        if not matches:
+            return None
+        numbers = [int(match.group(1)) for match in matches]
+        month, named = _dated_month(text, matches)
+        if named and era is None and len(numbers) == 1 and abs(numbers[0]) <= 31:
+            return None
+        year_index = next((i for i in reversed(range(len(numbers))) if abs(numbers[i]) > 31), len(numbers) - 1)
+        year = numbers.pop(year_index)
+        day = numbers[0] if month and numbers else 0
+        if era is not None:
+            year = era[0] - year if era[1] else era[0] + year
+    if abs(year) >= 10 ** 14 or not 0 <= month <= 99:
+        return None
+    if not 0 <= day < 100:
+        day = 0
+    return year * 10000 + month * 100 + day
+
+
+# Events from every person (birth, important dates not repeating birth/death, death)
+# and settlement (founding date)
+BACKFILL_STATEMENTS = [
+    r"""
+    INSERT INTO timeline_events (project_id, article_id, kind, label, date_text, position)
+    SELECT a.project_id, p.article_id, e.kind, e.label, e.date_text, e.position
+    FROM persons p
+    JOIN articles a ON a.id = p.article_id
+    CROSS JOIN LATERAL (
+        SELECT btrim(p.person_data->>'birth_date', E' \t\n\r') AS birth,
+               btrim(p.person_data->>'death_date', E' \t\n\r') AS death
+    ) d
+    CROSS JOIN LATERAL (
+        SELECT 'birth', 'Birth', d.birth, 0
+        UNION ALL
+        SELECT 'event', i.item->>'event', btrim(i.item->>'date', E' \t\n\r'), i.position::integer
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(p.person_data->'important_dates') = 'array'
+                 THEN p.person_data->'important_dates' ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS i(item, position)
+        WHERE NOT coalesce(
+            (lower(btrim(i.item->>'event', E' \t\n\r')) = 'birth' AND btrim(i.item->>'date', E' \t\n\r') = d.birth)
+            OR (lower(btrim(i.item->>'event', E' \t\n\r')) = 'death' AND btrim(i.item->>'date', E' \t\n\r') = d.death),
+            false
+        )
+        UNION ALL
+        SELECT 'death', 'Death', d.death, 0
+    ) e(kind, label, date_text, position)
+    WHERE coalesce(e.date_text, '') <> ''
+      AND coalesce(e.label, '') <> ''
+    """,
+    r"""
+    INSERT INTO timeline_events (project_id, article_id, kind, label, date_text, position)
+    SELECT a.project_id, s.article_id, 'founded', 'Founded', btrim(s.settlement_data->>'founded_date', E' \t\n\r'), 0
+    FROM settlements s
+    JOIN articles a ON a.id = s.article_id
+    WHERE coalesce(btrim(s.settlement_data->>'founded_date', E' \t\n\r'), '') <> ''
+    """,
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('calendar', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.create_table(
+        'timeline_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('label', sa.String(), nullable=False),
+        sa.Column('date_text', sa.String(), nullable=False),
+        sa.Column('sort_key', sa.BigInteger(), nullable=True),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+    connection = op.get_bind()
+    for statement in BACKFILL_STATEMENTS:
+        connection.execute(sa.text(statement))
+
+    # No project has a calendar yet, so every date is keyed with the default one
+    dates = connection.execute(sa.text('SELECT DISTINCT date_text FROM timeline_events')).scalars().all()
+    if dates:
+        connection.execute(
+            sa.text("""
+                UPDATE timeline_events t SET sort_key = k.sort_key
+                FROM unnest(:dates, :sort_keys) AS k(date_text, sort_key)
+                WHERE t.date_text = k.date_text
+            """).bindparams(
+                sa.bindparam('dates', list(dates), type_=postgresql.ARRAY(sa.String())),
+                sa.bindparam('sort_keys', [_sort_key(date) for date in dates], type_=postgresql.ARRAY(sa.BigInteger())),
+            )
+        )
+
+    op.create_index(op.f('ix_timeline_events_article_id'), 'timeline_events', ['article_id'], unique=False)
+    op.create_index(
+        'ix_timeline_events_project_id_sort_key', 'timeline_events', ['project_id', 'sort_key', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_timeline_events_project_id_sort_key', table_name='timeline_events')
+    op.drop_index(op.f('ix_timeline_events_article_id'), table_name='timeline_events')
+    op.drop_table('timeline_events')
+    op.drop_column('projects', 'calendar')
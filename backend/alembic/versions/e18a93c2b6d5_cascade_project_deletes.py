@@ -0,0 +1,49 @@
+"""cascade project deletes
+
+Revision ID: e18a93c2b6d5
+Revises: c5d71e0a9f42
+Create Date: 2026-10-19 12:41:09.871204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e18a93c2b6d5'
+down_revision: Union[str, None] = 'c5d71e0a9f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, constraint, local column, referent table, ON DELETE action)
+FOREIGN_KEYS = [
+    ('articles', 'articles_project_id_fkey', 'project_id', 'projects', 'CASCADE'),
+    ('articles', 'articles_header_image_id_fkey', 'header_image_id', 'images', 'SET NULL'),
+    ('images', 'images_project_id_fkey', 'project_id', 'projects', 'CASCADE'),
+    ('persons', 'persons_article_id_fkey', 'article_id', 'articles', 'CASCADE'),
+    ('settlements', 'settlements_article_id_fkey', 'article_id', 'articles', 'CASCADE'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Cascades scan the referencing columns, so they need indexes
+    op.create_index(op.f('ix_articles_project_id'), 'articles', ['project_id'], unique=False)
+    op.create_index(op.f('ix_articles_header_image_id'), 'articles', ['header_image_id'], unique=False)
+
+    for table, constraint, column, referent, ondelete in FOREIGN_KEYS:
+        op.drop_constraint(constraint, table, type_='foreignkey')
+        op.create_foreign_key(constraint, table, referent, [column], ['id'], ondelete=ondelete)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, constraint, column, referent, _ in FOREIGN_KEYS:
+        op.drop_constraint(constraint, table, type_='foreignkey')
+        op.create_foreign_key(constraint, table, referent, [column], ['id'])
+
+    op.drop_index(op.f('ix_articles_header_image_id'), table_name='articles')
+    op.drop_index(op.f('ix_articles_project_id'), table_name='articles')
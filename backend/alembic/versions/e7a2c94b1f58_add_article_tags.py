@@ -0,0 +1,143 @@
+"""add article tags
+
+Revision ID: e7a2c94b1f58
+Revises: d5e8b1c4a7f3
+Create Date: 2026-10-19 21:03:52.140976
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a2c94b1f58'
+down_revision: Union[str, None] = 'd5e8b1c4a7f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Normalized tag keys of an article's content: distinct, lower-cased and trimmed
+TAG_KEYS_FUNCTION = r"""
+    CREATE FUNCTION article_tag_keys(content jsonb) RETURNS SETOF text AS $$
+        SELECT DISTINCT lower(btrim(tag, E' \t\n\r'))
+        FROM jsonb_array_elements_text(
+            CASE WHEN jsonb_typeof(content->'tags') = 'array' THEN content->'tags' ELSE '[]'::jsonb END
+        ) AS t(tag)
+        WHERE btrim(tag, E' \t\n\r') <> ''
+    $$ LANGUAGE sql IMMUTABLE
+"""
+
+# article_tags follows articles.content->'tags', and project_tag_counts follows
+# article_tags, in the same transaction as the article writes. All triggers are
+# statement-level with transition tables so bulk imports and clones stay set-based;
+# deletes reach article_tags through its ON DELETE CASCADE foreign key.
+TRIGGER_FUNCTIONS = {
+    'article_tags_articles_inserted': """
+        INSERT INTO article_tags (article_id, tag, project_id)
+        SELECT n.id, k.tag, n.project_id
+        FROM new_rows n
+        CROSS JOIN LATERAL article_tag_keys(n.content) AS k(tag);
+    """,
+    # Only articles whose tags or project changed are touched
+    'article_tags_articles_updated': """
+        DELETE FROM article_tags t
+        USING new_rows n JOIN old_rows o ON o.id = n.id
+        WHERE t.article_id = n.id
+          AND (n.content->'tags' IS DISTINCT FROM o.content->'tags' OR n.project_id IS DISTINCT FROM o.project_id)
+          AND (
+              n.project_id IS DISTINCT FROM o.project_id
+              OR NOT EXISTS (SELECT 1 FROM article_tag_keys(n.content) AS k(tag) WHERE k.tag = t.tag)
+          );
+        INSERT INTO article_tags (article_id, tag, project_id)
+        SELECT n.id, k.tag, n.project_id
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        CROSS JOIN LATERAL article_tag_keys(n.content) AS k(tag)
+        WHERE n.content->'tags' IS DISTINCT FROM o.content->'tags' OR n.project_id IS DISTINCT FROM o.project_id
+        ON CONFLICT (article_id, tag) DO NOTHING;
+    """,
+    # Rows are visited in key order so concurrent writers lock counters in the same order
+    'article_tags_counted_inserted': """
+        INSERT INTO project_tag_counts AS c (project_id, tag, article_count)
+        SELECT project_id, tag, count(*) FROM new_rows GROUP BY project_id, tag ORDER BY project_id, tag
+        ON CONFLICT (project_id, tag) DO UPDATE SET article_count = c.article_count + EXCLUDED.article_count;
+    """,
+    'article_tags_counted_deleted': """
+        UPDATE project_tag_counts c SET article_count = c.article_count - d.n
+        FROM (SELECT project_id, tag, count(*) AS n FROM old_rows GROUP BY project_id, tag) d
+        WHERE c.project_id = d.project_id AND c.tag = d.tag;
+        DELETE FROM project_tag_counts c
+        USING (SELECT DISTINCT project_id, tag FROM old_rows) d
+        WHERE c.project_id = d.project_id AND c.tag = d.tag AND c.article_count <= 0;
+    """,
+}
+
+# (trigger, table, timing and events, transition tables)
+STATEMENT_TRIGGERS = [
+    ('article_tags_articles_inserted', 'articles', 'AFTER INSERT', 'NEW TABLE AS new_rows'),
+    ('article_tags_articles_updated', 'articles', 'AFTER UPDATE', 'OLD TABLE AS old_rows NEW TABLE AS new_rows'),
+    ('article_tags_counted_inserted', 'article_tags', 'AFTER INSERT', 'NEW TABLE AS new_rows'),
+    ('article_tags_counted_deleted', 'article_tags', 'AFTER DELETE', 'OLD TABLE AS old_rows'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'article_tags',
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.Column('tag', sa.String(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('article_id', 'tag'),
+    )
+    op.create_table(
+        'project_tag_counts',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('tag', sa.String(), nullable=False),
+        sa.Column('article_count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id', 'tag'),
+    )
+
+    # Lock articles so no tag change slips in between the backfill and the triggers
+    op.execute('LOCK TABLE articles IN SHARE ROW EXCLUSIVE MODE')
+
+    op.execute(TAG_KEYS_FUNCTION)
+    for name, body in TRIGGER_FUNCTIONS.items():
+        op.execute(f"""
+            CREATE FUNCTION {name}() RETURNS trigger AS $$
+            BEGIN
+                {body}
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+    for name, table, timing, transition in STATEMENT_TRIGGERS:
+        op.execute(
+            f'CREATE TRIGGER {name} {timing} ON {table} REFERENCING {transition} '
+            f'FOR EACH STATEMENT EXECUTE FUNCTION {name}()'
+        )
+
+    # The counting triggers are already in place, so this also fills project_tag_counts
+    op.execute("""
+        INSERT INTO article_tags (article_id, tag, project_id)
+        SELECT a.id, k.tag, a.project_id
+        FROM articles a
+        CROSS JOIN LATERAL article_tag_keys(a.content) AS k(tag)
+    """)
+    op.create_index('ix_article_tags_tag_project_id', 'article_tags', ['tag', 'project_id', 'article_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _, _ in STATEMENT_TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name} ON {table}')
+    for name in TRIGGER_FUNCTIONS:
+        op.execute(f'DROP FUNCTION IF EXISTS {name}()')
+    op.execute('DROP FUNCTION IF EXISTS article_tag_keys(jsonb)')
+    op.drop_index('ix_article_tags_tag_project_id', table_name='article_tags')
+    op.drop_table('project_tag_counts')
+    op.drop_table('article_tags')
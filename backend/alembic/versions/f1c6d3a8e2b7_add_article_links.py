@@ -0,0 +1,87 @@
+"""add article links
+
+Revision ID: f1c6d3a8e2b7
+Revises: e7a2c94b1f58
+Create Date: 2026-10-19 22:41:18.306127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6d3a8e2b7'
+down_revision: Union[str, None] = 'e7a2c94b1f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# [[Target]] or [[Target|label]]; the target may not contain brackets or a pipe
+LINK_PATTERN = r"\[\[([^][|]+)(?:\|[^][]*)?\]\]"
+
+# Links from every article's content; title links resolve to the oldest article with
+# that title in the same project, ID links to the article if it is in the same project
+BACKFILL_STATEMENT = r"""
+    WITH found AS (
+        SELECT DISTINCT ON (a.id, k.target_key)
+               a.id AS source_article_id, a.project_id, k.target_key, k.target_id, t.target_title
+        FROM articles a
+        CROSS JOIN LATERAL regexp_matches(
+            concat_ws(E'\n', a.content->>'main_content', a.content->>'sidebar_content',
+                      a.content->>'footer_content', a.content->>'summary'),
+            :pattern, 'g'
+        ) WITH ORDINALITY AS m(groups, position)
+        CROSS JOIN LATERAL (SELECT btrim(m.groups[1], E' \t\n\r') AS target_title) t
+        CROSS JOIN LATERAL (
+            SELECT substring(lower(t.target_title) FROM '^id:\s*([0-9]{1,9})$')::integer AS target_id
+        ) i
+        CROSS JOIN LATERAL (
+            SELECT coalesce('id:' || i.target_id, lower(t.target_title)) AS target_key, i.target_id
+        ) k
+        WHERE t.target_title <> ''
+        ORDER BY a.id, k.target_key, m.position
+    ),
+    titles AS (
+        SELECT DISTINCT ON (project_id, lower(title)) project_id, lower(title) AS target_key, id
+        FROM articles
+        ORDER BY project_id, lower(title), id
+    )
+    INSERT INTO article_links (source_article_id, target_key, project_id, target_article_id, target_title)
+    SELECT f.source_article_id, f.target_key, f.project_id, coalesce(b.id, t.id), f.target_title
+    FROM found f
+    LEFT JOIN articles b ON b.id = f.target_id AND b.project_id = f.project_id
+    LEFT JOIN titles t ON t.project_id = f.project_id AND t.target_key = f.target_key AND f.target_id IS NULL
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'article_links',
+        sa.Column('source_article_id', sa.Integer(), nullable=False),
+        sa.Column('target_key', sa.String(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('target_article_id', sa.Integer(), nullable=True),
+        sa.Column('target_title', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['source_article_id'], ['articles.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['target_article_id'], ['articles.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('source_article_id', 'target_key'),
+    )
+
+    op.get_bind().execute(sa.text(BACKFILL_STATEMENT), {'pattern': LINK_PATTERN})
+
+    op.create_index(
+        'ix_article_links_target_article_id', 'article_links', ['target_article_id', 'source_article_id'], unique=False
+    )
+    op.create_index(
+        'ix_article_links_project_id_target_key', 'article_links', ['project_id', 'target_key'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_article_links_project_id_target_key', table_name='article_links')
+    op.drop_index('ix_article_links_target_article_id', table_name='article_links')
+    op.drop_table('article_links')
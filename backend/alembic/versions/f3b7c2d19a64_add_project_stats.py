@@ -0,0 +1,216 @@
+"""add project stats
+
+Revision ID: f3b7c2d19a64
+Revises: e18a93c2b6d5
+Create Date: 2026-10-19 15:02:44.318520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b7c2d19a64'
+down_revision: Union[str, None] = 'e18a93c2b6d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Counters are adjusted by triggers in the same transaction as the rows they count.
+# Inserts and deletes use statement-level triggers with transition tables, so bulk
+# imports and clones cost one UPDATE per project rather than one per row.
+TRIGGER_FUNCTIONS = {
+    'project_stats_projects_inserted': """
+        INSERT INTO project_stats (project_id)
+        SELECT id FROM new_rows
+        ON CONFLICT (project_id) DO NOTHING;
+    """,
+    'project_stats_articles_inserted': """
+        UPDATE project_stats s SET article_count = s.article_count + d.n
+        FROM (SELECT project_id, count(*) AS n FROM new_rows GROUP BY project_id) d
+        WHERE s.project_id = d.project_id;
+    """,
+    'project_stats_articles_deleted': """
+        UPDATE project_stats s SET article_count = s.article_count - d.n
+        FROM (SELECT project_id, count(*) AS n FROM old_rows GROUP BY project_id) d
+        WHERE s.project_id = d.project_id;
+    """,
+    'project_stats_persons_inserted': """
+        UPDATE project_stats s SET person_count = s.person_count + d.n
+        FROM (
+            SELECT a.project_id, count(*) AS n
+            FROM new_rows p JOIN articles a ON a.id = p.article_id
+            GROUP BY a.project_id
+        ) d
+        WHERE s.project_id = d.project_id;
+    """,
+    # Persons deleted by an article delete cascade no longer see their article;
+    # those are counted by project_stats_article_subtypes_deleted instead
+    'project_stats_persons_deleted': """
+        UPDATE project_stats s SET person_count = s.person_count - d.n
+        FROM (
+            SELECT a.project_id, count(*) AS n
+            FROM old_rows p JOIN articles a ON a.id = p.article_id
+            GROUP BY a.project_id
+        ) d
+        WHERE s.project_id = d.project_id;
+    """,
+    'project_stats_settlements_inserted': """
+        UPDATE project_stats s SET settlement_count = s.settlement_count + d.n
+        FROM (
+            SELECT a.project_id, count(*) AS n
+            FROM new_rows st JOIN articles a ON a.id = st.article_id
+            GROUP BY a.project_id
+        ) d
+        WHERE s.project_id = d.project_id;
+    """,
+    'project_stats_settlements_deleted': """
+        UPDATE project_stats s SET settlement_count = s.settlement_count - d.n
+        FROM (
+            SELECT a.project_id, count(*) AS n
+            FROM old_rows st JOIN articles a ON a.id = st.article_id
+            GROUP BY a.project_id
+        ) d
+        WHERE s.project_id = d.project_id;
+    """,
+    'project_stats_images_inserted': """
+        UPDATE project_stats s
+        SET image_count = s.image_count + d.n, image_bytes = s.image_bytes + d.bytes
+        FROM (SELECT project_id, count(*) AS n, sum(file_size) AS bytes FROM new_rows GROUP BY project_id) d
+        WHERE s.project_id = d.project_id;
+    """,
+    'project_stats_images_deleted': """
+        UPDATE project_stats s
+        SET image_count = s.image_count - d.n, image_bytes = s.image_bytes - d.bytes
+        FROM (SELECT project_id, count(*) AS n, sum(file_size) AS bytes FROM old_rows GROUP BY project_id) d
+        WHERE s.project_id = d.project_id;
+    """,
+}
+
+# Row-level functions for rarer changes: article deletes (whose persons and
+# settlements are still visible BEFORE the cascade runs) and updates that move
+# rows between projects or change an image's size.
+ROW_TRIGGER_FUNCTIONS = {
+    'project_stats_article_subtypes_deleted': """
+        -- Skip when the whole project is being deleted; its stats row goes with it
+        IF EXISTS (SELECT 1 FROM projects WHERE id = OLD.project_id) THEN
+            UPDATE project_stats
+            SET person_count = person_count - (SELECT count(*) FROM persons WHERE article_id = OLD.id),
+                settlement_count = settlement_count - (SELECT count(*) FROM settlements WHERE article_id = OLD.id)
+            WHERE project_id = OLD.project_id;
+        END IF;
+        RETURN OLD;
+    """,
+    'project_stats_article_moved': """
+        UPDATE project_stats
+        SET article_count = article_count + CASE WHEN project_id = NEW.project_id THEN 1 ELSE -1 END,
+            person_count = person_count
+                + CASE WHEN project_id = NEW.project_id THEN 1 ELSE -1 END
+                * (SELECT count(*) FROM persons WHERE article_id = NEW.id),
+            settlement_count = settlement_count
+                + CASE WHEN project_id = NEW.project_id THEN 1 ELSE -1 END
+                * (SELECT count(*) FROM settlements WHERE article_id = NEW.id)
+        WHERE project_id IN (OLD.project_id, NEW.project_id);
+        RETURN NULL;
+    """,
+    'project_stats_image_changed': """
+        UPDATE project_stats SET image_count = image_count - 1, image_bytes = image_bytes - OLD.file_size
+        WHERE project_id = OLD.project_id;
+        UPDATE project_stats SET image_count = image_count + 1, image_bytes = image_bytes + NEW.file_size
+        WHERE project_id = NEW.project_id;
+        RETURN NULL;
+    """,
+}
+
+# (trigger, table, timing and events, function)
+STATEMENT_TRIGGERS = [
+    ('project_stats_projects_inserted', 'projects', 'AFTER INSERT', 'NEW TABLE AS new_rows'),
+    ('project_stats_articles_inserted', 'articles', 'AFTER INSERT', 'NEW TABLE AS new_rows'),
+    ('project_stats_articles_deleted', 'articles', 'AFTER DELETE', 'OLD TABLE AS old_rows'),
+    ('project_stats_persons_inserted', 'persons', 'AFTER INSERT', 'NEW TABLE AS new_rows'),
+    ('project_stats_persons_deleted', 'persons', 'AFTER DELETE', 'OLD TABLE AS old_rows'),
+    ('project_stats_settlements_inserted', 'settlements', 'AFTER INSERT', 'NEW TABLE AS new_rows'),
+    ('project_stats_settlements_deleted', 'settlements', 'AFTER DELETE', 'OLD TABLE AS old_rows'),
+    ('project_stats_images_inserted', 'images', 'AFTER INSERT', 'NEW TABLE AS new_rows'),
+    ('project_stats_images_deleted', 'images', 'AFTER DELETE', 'OLD TABLE AS old_rows'),
+]
+
+# (trigger, table, timing and events, WHEN condition)
+ROW_TRIGGERS = [
+    ('project_stats_article_subtypes_deleted', 'articles', 'BEFORE DELETE', None),
+    (
+        'project_stats_article_moved', 'articles', 'AFTER UPDATE OF project_id',
+        'OLD.project_id IS DISTINCT FROM NEW.project_id',
+    ),
+    (
+        'project_stats_image_changed', 'images', 'AFTER UPDATE OF project_id, file_size',
+        'OLD.project_id IS DISTINCT FROM NEW.project_id OR OLD.file_size IS DISTINCT FROM NEW.file_size',
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'project_stats',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('article_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('person_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('settlement_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('image_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('image_bytes', sa.BigInteger(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id'),
+    )
+
+    # Lock the counted tables so no rows slip in between the backfill and the triggers
+    op.execute('LOCK TABLE projects, articles, persons, settlements, images IN SHARE ROW EXCLUSIVE MODE')
+
+    for name, body in TRIGGER_FUNCTIONS.items():
+        op.execute(f"""
+            CREATE FUNCTION {name}() RETURNS trigger AS $$
+            BEGIN
+                {body}
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+    for name, body in ROW_TRIGGER_FUNCTIONS.items():
+        op.execute(f"""
+            CREATE FUNCTION {name}() RETURNS trigger AS $$
+            BEGIN
+                {body}
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+
+    for name, table, timing, transition in STATEMENT_TRIGGERS:
+        op.execute(
+            f'CREATE TRIGGER {name} {timing} ON {table} REFERENCING {transition} '
+            f'FOR EACH STATEMENT EXECUTE FUNCTION {name}()'
+        )
+    for name, table, timing, condition in ROW_TRIGGERS:
+        when = f' WHEN ({condition})' if condition else ''
+        op.execute(f'CREATE TRIGGER {name} {timing} ON {table} FOR EACH ROW{when} EXECUTE FUNCTION {name}()')
+
+    op.execute("""
+        INSERT INTO project_stats (project_id, article_count, person_count, settlement_count, image_count, image_bytes)
+        SELECT p.id,
+               (SELECT count(*) FROM articles a WHERE a.project_id = p.id),
+               (SELECT count(*) FROM persons pe JOIN articles a ON a.id = pe.article_id WHERE a.project_id = p.id),
+               (SELECT count(*) FROM settlements s JOIN articles a ON a.id = s.article_id WHERE a.project_id = p.id),
+               (SELECT count(*) FROM images i WHERE i.project_id = p.id),
+               (SELECT coalesce(sum(i.file_size), 0) FROM images i WHERE i.project_id = p.id)
+        FROM projects p
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _, _ in ROW_TRIGGERS + STATEMENT_TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name} ON {table}')
+    for name in list(ROW_TRIGGER_FUNCTIONS) + list(TRIGGER_FUNCTIONS):
+        op.execute(f'DROP FUNCTION IF EXISTS {name}()')
+    op.drop_table('project_stats')
@@ -1,7 +1,12 @@
 from fastapi import APIRouter
-from app.api.api_v1.endpoints import projects, articles, images
+from app.api.api_v1.endpoints import projects, articles, images, jobs, locations, metrics, persons, settlements
 
 api_router = APIRouter()
 api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
 api_router.include_router(articles.router, prefix="/articles", tags=["articles"])
-api_router.include_router(images.router, prefix="/images", tags=["images"])
\ No newline at end of file
+api_router.include_router(images.router, prefix="/images", tags=["images"])
+api_router.include_router(persons.router, prefix="/persons", tags=["persons"])
+api_router.include_router(settlements.router, prefix="/settlements", tags=["settlements"])
+api_router.include_router(locations.router, prefix="/locations", tags=["locations"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
\ No newline at end of file
@@ -1,16 +1,79 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Optional
-from app.schemas.article import Article, ArticleCreate, ArticleUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from typing import List, Optional, Union
+from app.api.deps import get_batch_ids
+from app.core.http_cache import check_conditional, json_payload_response, latest, make_etag
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.schemas.article import (
+    Article, ArticleCreate, ArticleFields, ArticleReference, ArticleSummary, ArticleUpdate, ArticleViewEnum,
+    RelatedArticle, TagMatchEnum, TypedArticle,
+)
+from app.schemas.converters import to_typed_article
+from app.services.article_service import InvalidFieldsError
 from app.services.container import get_services, ServiceContainer
 
+_article_list_adapter = TypeAdapter(List[Article])
+_summary_list_adapter = TypeAdapter(List[ArticleSummary])
+
 router = APIRouter()
 
 
-@router.get("/", response_model=List[Article])
-def get_articles(project_id: Optional[int] = None, skip: int = 0, limit: int = 100, services: ServiceContainer = Depends(get_services)):
-    """Get all articles, optionally filtered by project"""
-    articles = services.articles.get_articles(project_id=project_id, skip=skip, limit=limit)
-    return articles
+# Every view is serialized in the handler, so the union only documents the three shapes
+@router.get("/", response_model=Union[List[Article], List[ArticleSummary], List[ArticleFields]])
+def get_articles(
+    request: Request,
+    response: Response,
+    project_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 100,
+    include_header_image: bool = False,
+    view: ArticleViewEnum = Query(ArticleViewEnum.FULL, description="'summary' returns ArticleSummary rows"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. title,summary"),
+    tag: Optional[List[str]] = Query(None, description="Only articles with this tag; repeat for several"),
+    match: TagMatchEnum = Query(TagMatchEnum.ALL, description="'all' requires every tag, 'any' at least one"),
+    services: ServiceContainer = Depends(get_services),
+):
+    """
+    Get all articles, optionally filtered by project and tags and with header image details embedded.
+
+    - **view**: `summary` returns lightweight `ArticleSummary` rows without article bodies
+    - **fields**: return only these fields, as `ArticleFields` rows (JSONB content keys are extracted in the database)
+    - **tag**: tags are matched case-insensitively through the article_tags index
+    """
+    match_all = match == TagMatchEnum.ALL
+    count, updated_at, image_count, image_updated_at = services.articles.get_articles_version(project_id)
+    etag = make_etag(
+        "articles", project_id, skip, limit, include_header_image, view.value, fields, tag, match.value,
+        count, updated_at, image_count, image_updated_at,
+    )
+    last_modified = latest(updated_at, image_updated_at if include_header_image else None)
+    not_modified = check_conditional(request, response, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    if fields:
+        try:
+            rows = services.articles.get_article_fields(
+                [field.strip() for field in fields.split(",") if field.strip()],
+                project_id=project_id, skip=skip, limit=limit, tags=tag, match_all=match_all,
+            )
+        except InvalidFieldsError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return json_payload_response(to_json(rows), response)
+
+    if view == ArticleViewEnum.SUMMARY:
+        summaries = services.articles.get_article_summaries(
+            project_id=project_id, skip=skip, limit=limit, tags=tag, match_all=match_all
+        )
+        return json_payload_response(_summary_list_adapter.dump_json(summaries), response)
+
+    articles = services.articles.get_articles(
+        project_id=project_id, skip=skip, limit=limit, include_header_image=include_header_image,
+        tags=tag, match_all=match_all,
+    )
+    payload = _article_list_adapter.dump_json(_article_list_adapter.validate_python(articles, from_attributes=True))
+    return json_payload_response(payload, response)
 
 
 @router.post("/", response_model=Article)
@@ -19,13 +82,86 @@ def create_article(article: ArticleCreate, services: ServiceContainer = Depends(
     return services.articles.create_article(article)
 
 
+@router.get("/batch", response_model=BatchResponse[Article])
+def get_articles_batch(
+    ids: List[int] = Depends(get_batch_ids),
+    include_header_image: bool = False,
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get many articles by ID in one query; results follow the order of ids"""
+    return BatchResponse[Article].from_results(ids, services.articles.get_articles_by_ids(ids, include_header_image))
+
+
+@router.post("/batch", response_model=BatchResponse[Article])
+def post_articles_batch(
+    batch: BatchRequest,
+    include_header_image: bool = False,
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get many articles by ID, for ID lists too long for a query string"""
+    return BatchResponse[Article].from_results(
+        batch.ids, services.articles.get_articles_by_ids(batch.ids, include_header_image)
+    )
+
+
 @router.get("/{article_id}", response_model=Article)
-def get_article(article_id: int, services: ServiceContainer = Depends(get_services)):
-    """Get a specific article by ID"""
-    article = services.articles.get_article(article_id=article_id)
+def get_article(
+    article_id: int,
+    request: Request,
+    response: Response,
+    include_header_image: bool = False,
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get a specific article by ID, optionally with header image details embedded"""
+    version = services.articles.get_article_version(article_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Article not found")
+    _, updated_at, image_updated_at = version
+    etag = make_etag("article", article_id, include_header_image, updated_at, image_updated_at)
+    last_modified = latest(updated_at, image_updated_at if include_header_image else None)
+    not_modified = check_conditional(request, response, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    payload = services.articles.get_article_json(article_id, version, include_header_image=include_header_image)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return json_payload_response(payload, response)
+
+
+@router.get("/{article_id}/typed", response_model=TypedArticle)
+def get_typed_article(article_id: int, services: ServiceContainer = Depends(get_services)):
+    """Get an article with its person or settlement details and header image in a single query"""
+    article = services.articles.get_typed_article(article_id)
     if article is None:
         raise HTTPException(status_code=404, detail="Article not found")
-    return article
+    return to_typed_article(article)
+
+
+@router.get("/{article_id}/backlinks", response_model=List[ArticleReference])
+def get_article_backlinks(
+    article_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get the articles whose content links to this one ("what links here")"""
+    if services.articles.get_article_version(article_id) is None:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return services.articles.get_backlinks(article_id, skip, limit)
+
+
+@router.get("/{article_id}/related", response_model=List[RelatedArticle])
+def get_related_articles(
+    article_id: int,
+    limit: int = Query(10, ge=1, le=100),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get the articles in the same project whose text is most similar to this one"""
+    related = services.articles.get_related_articles(article_id, limit)
+    if related is None:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return related
 
 
 @router.put("/{article_id}", response_model=Article)
@@ -2,12 +2,23 @@
 Image API endpoints.
 """
 
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile, File, Form, Query
 from fastapi.responses import FileResponse
 
+from app.api.deps import get_batch_ids
+from app.core.http_cache import check_conditional, make_etag
+from app.schemas.batch import BatchRequest, BatchResponse
+
 from app.services.image_service import ImageService, ImageStorageError
-from app.schemas.image import ImageResponse, ImageListResponse, ImageUpdate, ImageUploadResponse
+from app.schemas.image import (
+    ImageResponse,
+    ImageListResponse,
+    ImageStorageUsage,
+    ImageUpdate,
+    ImageUploadResponse,
+    SimilarImagesResponse,
+)
 from app.core.config import settings
 from app.services.container import get_services, ServiceContainer
 
@@ -70,6 +81,8 @@ async def upload_image(
 @router.get("/project/{project_id}", response_model=ImageListResponse)
 def get_project_images(
     project_id: int,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     services: ServiceContainer = Depends(get_services)
@@ -82,17 +95,85 @@ def get_project_images(
     - **limit**: Maximum number of items to return
     """
     image_service = services.images
+    count, updated_at = image_service.get_images_version(project_id)
+    etag = make_etag("images", project_id, skip, limit, count, updated_at)
+    not_modified = check_conditional(request, response, etag, updated_at)
+    if not_modified:
+        return not_modified
+
     return image_service.get_images_by_project(project_id, skip, limit)
 
 
+@router.get("/project/{project_id}/similar/{image_id}", response_model=SimilarImagesResponse)
+def get_similar_images(
+    project_id: int,
+    image_id: int,
+    max_distance: int = Query(10, ge=0, le=64),
+    limit: int = Query(20, ge=1, le=200),
+    services: ServiceContainer = Depends(get_services)
+):
+    """
+    Find near-duplicate images in a project (re-exports, crops, resaves).
+    
+    - **project_id**: ID of the project
+    - **image_id**: ID of the image to compare against
+    - **max_distance**: Maximum Hamming distance between perceptual hashes
+    - **limit**: Maximum number of matches to return
+    """
+    image_service = services.images
+    try:
+        similar = image_service.find_similar_images(project_id, image_id, max_distance, limit)
+    except ImageStorageError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if similar is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    return similar
+
+
+@router.get("/batch", response_model=BatchResponse[ImageResponse])
+def get_images_batch(ids: List[int] = Depends(get_batch_ids), services: ServiceContainer = Depends(get_services)):
+    """
+    Get many images by ID in one query; results follow the order of ids.
+    
+    - **ids**: Comma-separated image IDs
+    """
+    images = services.images.get_images_by_ids(ids)
+    found = {image_id: ImageResponse.from_orm(image) for image_id, image in images.items()}
+    return BatchResponse[ImageResponse].from_results(ids, found)
+
+
+@router.post("/batch", response_model=BatchResponse[ImageResponse])
+def post_images_batch(batch: BatchRequest, services: ServiceContainer = Depends(get_services)):
+    """
+    Get many images by ID, for ID lists too long for a query string.
+    
+    - **ids**: Image IDs to fetch
+    """
+    images = services.images.get_images_by_ids(batch.ids)
+    found = {image_id: ImageResponse.from_orm(image) for image_id, image in images.items()}
+    return BatchResponse[ImageResponse].from_results(batch.ids, found)
+
+
 @router.get("/{image_id}", response_model=ImageResponse)
-def get_image(image_id: int, services: ServiceContainer = Depends(get_services)):
+def get_image(
+    image_id: int, request: Request, response: Response, services: ServiceContainer = Depends(get_services)
+):
     """
     Get image details by ID.
     
     - **image_id**: ID of the image
     """
     image_service = services.images
+    version = image_service.get_image_version(image_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    _, updated_at = version
+    not_modified = check_conditional(request, response, make_etag("image", image_id, updated_at), updated_at)
+    if not_modified:
+        return not_modified
+
     image = image_service.get_image(image_id)
     
     if not image:
@@ -129,6 +210,31 @@ def get_image_file(filename: str, services: ServiceContainer = Depends(get_servi
     )
 
 
+@router.get("/{filename}/thumbnail")
+def get_image_thumbnail(filename: str, services: ServiceContainer = Depends(get_services)):
+    """
+    Get a downscaled thumbnail of an image by filename.
+    Thumbnails are generated on first request and cached on disk.
+    
+    - **filename**: Filename of the image
+    """
+    image_service = services.images
+    image = image_service.get_image_by_filename(filename)
+    
+    if not image:
+        raise HTTPException(status_code=404, detail="Image not found")
+    
+    if image.is_s3_stored:
+        raise HTTPException(status_code=400, detail="S3 images should be accessed via their S3 URL")
+    
+    try:
+        thumbnail_path = image_service.get_thumbnail_path(image)
+    except ImageStorageError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return FileResponse(path=thumbnail_path, media_type="image/webp")
+
+
 @router.put("/{image_id}", response_model=ImageResponse)
 def update_image(
     image_id: int,
@@ -165,7 +271,7 @@ def delete_image(image_id: int, services: ServiceContainer = Depends(get_service
     return {"message": "Image deleted successfully"}
 
 
-@router.get("/project/{project_id}/storage")
+@router.get("/project/{project_id}/storage", response_model=ImageStorageUsage)
 def get_project_storage_usage(project_id: int, services: ServiceContainer = Depends(get_services)):
     """
     Get storage usage statistics for a project.
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, HTTPException
+from app.schemas.job import JobResponse
+from app.services.jobs import job_runner
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: str):
+    """Get the status of a background job"""
+    job = job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse(
+        id=job.id,
+        name=job.name,
+        status=job.status.value,
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+    )
@@ -0,0 +1,87 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List
+from app.schemas.location import Location, LocationCreate, LocationMemberPage, LocationUpdate
+from app.services.container import get_services, ServiceContainer
+from app.services.location_service import InvalidLocationError
+
+router = APIRouter()
+
+
+def _require_location(location_id: int, services: ServiceContainer) -> Location:
+    location = services.locations.get_location(location_id)
+    if location is None:
+        raise HTTPException(status_code=404, detail="Location not found")
+    return location
+
+
+@router.get("/", response_model=List[Location])
+def get_locations(project_id: int, services: ServiceContainer = Depends(get_services)):
+    """Get a project's location hierarchy as a flat list in tree order (each location after its parent)"""
+    return services.locations.get_locations(project_id)
+
+
+@router.post("/", response_model=Location)
+def create_location(location: LocationCreate, services: ServiceContainer = Depends(get_services)):
+    """Create a new location"""
+    try:
+        return services.locations.create_location(location)
+    except InvalidLocationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/{location_id}", response_model=Location)
+def get_location(location_id: int, services: ServiceContainer = Depends(get_services)):
+    """Get a specific location by ID"""
+    return _require_location(location_id, services)
+
+
+@router.put("/{location_id}", response_model=Location)
+def update_location(location_id: int, location: LocationUpdate, services: ServiceContainer = Depends(get_services)):
+    """Rename or move a location; everything inside it moves along"""
+    try:
+        updated = services.locations.update_location(location_id, location)
+    except InvalidLocationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if updated is None:
+        raise HTTPException(status_code=404, detail="Location not found")
+    return updated
+
+
+@router.delete("/{location_id}")
+def delete_location(location_id: int, services: ServiceContainer = Depends(get_services)):
+    """Delete a location; the locations inside it move up to its parent"""
+    if not services.locations.delete_location(location_id):
+        raise HTTPException(status_code=404, detail="Location not found")
+    return {"message": "Location deleted successfully"}
+
+
+@router.get("/{location_id}/ancestors", response_model=List[Location])
+def get_location_ancestors(location_id: int, services: ServiceContainer = Depends(get_services)):
+    """Get the locations enclosing a location, outermost first"""
+    _require_location(location_id, services)
+    return services.locations.get_ancestors(location_id)
+
+
+@router.get("/{location_id}/persons", response_model=LocationMemberPage)
+def get_location_persons(
+    location_id: int,
+    birthplace: bool = Query(False, description="Match where persons were born instead of where they live"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get the persons living anywhere within a location, including all locations inside it"""
+    _require_location(location_id, services)
+    return services.locations.get_persons_within(location_id, skip, limit, birthplace)
+
+
+@router.get("/{location_id}/settlements", response_model=LocationMemberPage)
+def get_location_settlements(
+    location_id: int,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get the settlements anywhere within a location"""
+    _require_location(location_id, services)
+    return services.locations.get_settlements_within(location_id, skip, limit)
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+from app.core.cache import entity_cache
+from app.schemas.metrics import CacheStatsResponse
+
+router = APIRouter()
+
+
+@router.get("/cache", response_model=CacheStatsResponse)
+def get_cache_stats():
+    """Get hit/miss/eviction counters for this worker's payload cache and the shared tier"""
+    return CacheStatsResponse(**entity_cache.stats())
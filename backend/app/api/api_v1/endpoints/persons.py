@@ -0,0 +1,113 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+from app.api.deps import get_batch_ids
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.schemas.converters import person_to_schema
+from app.schemas.person import (
+    GenderEnum, LifeStatusEnum, Person, PersonNetwork, PersonPath, PersonRelationshipEdge, PersonSearchResponse,
+)
+from app.services.container import get_services, ServiceContainer
+
+router = APIRouter()
+
+
+def _batch_response(ids: List[int], services: ServiceContainer) -> BatchResponse[Person]:
+    persons = services.people.get_persons_by_article_ids(ids)
+    found = {article_id: person_to_schema(person) for article_id, person in persons.items()}
+    return BatchResponse[Person].from_results(ids, found)
+
+
+@router.get("/batch", response_model=BatchResponse[Person])
+def get_persons_batch(ids: List[int] = Depends(get_batch_ids), services: ServiceContainer = Depends(get_services)):
+    """Get many persons by article ID in one query; results follow the order of ids"""
+    return _batch_response(ids, services)
+
+
+@router.post("/batch", response_model=BatchResponse[Person])
+def post_persons_batch(batch: BatchRequest, services: ServiceContainer = Depends(get_services)):
+    """Get many persons by article ID, for ID lists too long for a query string"""
+    return _batch_response(batch.ids, services)
+
+
+@router.get("/search", response_model=PersonSearchResponse)
+def search_persons(
+    project_id: int,
+    name: Optional[str] = Query(None, description="Match persons whose name contains this text"),
+    race: List[str] = Query([]),
+    gender: List[GenderEnum] = Query([]),
+    life_status: List[LifeStatusEnum] = Query([]),
+    occupation: List[str] = Query([]),
+    current_location: List[str] = Query([]),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    services: ServiceContainer = Depends(get_services),
+):
+    """
+    Search persons in a project by facets, returning the page, the total and per-facet counts in one query.
+
+    Repeat a facet parameter to match any of several values (e.g. `race=Elf&race=Dwarf`).
+    """
+    selected = {
+        "race": race,
+        "gender": [value.value for value in gender],
+        "life_status": [value.value for value in life_status],
+        "occupation": occupation,
+        "current_location": current_location,
+    }
+    persons, total, facets = services.people.search_persons(project_id, selected, name, skip, limit)
+    return PersonSearchResponse(items=[person_to_schema(person) for person in persons], total=total, facets=facets)
+
+
+def _require_person(article_id: int, services: ServiceContainer) -> None:
+    if not services.people.person_exists(article_id):
+        raise HTTPException(status_code=404, detail="Person not found")
+
+
+@router.get("/{person_id}/relationships", response_model=List[PersonRelationshipEdge])
+def get_person_relationships(
+    person_id: int,
+    types: List[str] = Query([], description="Only these relationship types"),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get a person's relationships in both directions (person IDs are article IDs)"""
+    _require_person(person_id, services)
+    return services.people.get_relationships(person_id, types)
+
+
+@router.get("/{person_id}/network", response_model=PersonNetwork)
+def get_person_network(
+    person_id: int,
+    depth: int = Query(2, ge=1, le=4, description="Maximum number of relationships away"),
+    types: List[str] = Query([], description="Only follow these relationship types"),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get everyone within depth relationships of a person and the relationships among them"""
+    _require_person(person_id, services)
+    return services.people.get_network(person_id, depth, types)
+
+
+@router.get("/{person_id}/family-tree", response_model=PersonNetwork)
+def get_person_family_tree(
+    person_id: int,
+    depth: int = Query(3, ge=1, le=6),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get a person's relatives reachable through family relationships"""
+    _require_person(person_id, services)
+    return services.people.get_family_tree(person_id, depth)
+
+
+@router.get("/{person_id}/path/{other_id}", response_model=PersonPath)
+def get_person_path(
+    person_id: int,
+    other_id: int,
+    max_depth: int = Query(6, ge=1, le=10),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get the shortest chain of relationships connecting two persons"""
+    _require_person(person_id, services)
+    _require_person(other_id, services)
+    path = services.people.find_path(person_id, other_id, max_depth)
+    if path is None:
+        raise HTTPException(status_code=404, detail="No relationship path found")
+    return path
@@ -1,14 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
-from app.schemas.project import Project, ProjectCreate, ProjectUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from app.core.http_cache import check_conditional, json_payload_response, make_etag
+from app.schemas.article import ArticleReference, TagCount
+from app.schemas.project import (
+    Project, ProjectCreate, ProjectUpdate, ProjectClone, ProjectImportResult, ProjectOverview, ProjectStats, TimelinePage,
+)
 from app.services.container import get_services, ServiceContainer
+from app.services.project_export_service import ProjectExportService
+from app.services.project_import_service import ProjectImportService, ProjectImportError
+from app.services.project_overview_service import ProjectOverviewService
+from app.services.project_service import InvalidCalendarError
+from app.services.timeline_service import InvalidTimelineQueryError
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[Project])
-def get_projects(skip: int = 0, limit: int = 100, services: ServiceContainer = Depends(get_services)):
+def get_projects(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    services: ServiceContainer = Depends(get_services),
+):
     """Get all projects"""
+    count, updated_at = services.projects.get_projects_version()
+    etag = make_etag("projects", skip, limit, count, updated_at)
+    not_modified = check_conditional(request, response, etag, updated_at)
+    if not_modified:
+        return not_modified
+
     projects = services.projects.get_projects(skip=skip, limit=limit)
     return projects
 
@@ -16,16 +38,48 @@ def get_projects(skip: int = 0, limit: int = 100, services: ServiceContainer = D
 @router.post("/", response_model=Project)
 def create_project(project: ProjectCreate, services: ServiceContainer = Depends(get_services)):
     """Create a new project"""
-    return services.projects.create_project(project)
+    try:
+        return services.projects.create_project(project)
+    except InvalidCalendarError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/import", response_model=ProjectImportResult)
+def import_project(
+    file: UploadFile = File(...),
+    name: Optional[str] = Form(None),
+    services: ServiceContainer = Depends(get_services),
+):
+    """
+    Import a project export (NDJSON, gzip'd NDJSON or tar bundle) as a new project.
+
+    - **file**: Export produced by GET /projects/{id}/export
+    - **name**: Optional name for the new project (defaults to the exported name)
+    """
+    try:
+        result = ProjectImportService(services.db).import_project(file.file, project_name=name)
+    except ProjectImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ProjectImportResult(project_id=result.project_id, counts=result.counts)
 
 
 @router.get("/{project_id}", response_model=Project)
-def get_project(project_id: int, services: ServiceContainer = Depends(get_services)):
+def get_project(
+    project_id: int, request: Request, response: Response, services: ServiceContainer = Depends(get_services)
+):
     """Get a specific project by ID"""
-    project = services.projects.get_project(project_id=project_id)
-    if project is None:
+    version = services.projects.get_project_version(project_id)
+    if version is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    _, updated_at = version
+    not_modified = check_conditional(request, response, make_etag("project", project_id, updated_at), updated_at)
+    if not_modified:
+        return not_modified
+
+    payload = services.projects.get_project_json(project_id, version)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return json_payload_response(payload, response)
 
 
 @router.put("/{project_id}", response_model=Project)
@@ -36,14 +90,139 @@ def update_project(
     db_project = services.projects.get_project(project_id=project_id)
     if db_project is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    return services.projects.update_project(project_id=project_id, project_data=project)
+    try:
+        return services.projects.update_project(project_id=project_id, project_data=project)
+    except InvalidCalendarError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/{project_id}/clone", response_model=Project)
+def clone_project(
+    project_id: int,
+    clone: Optional[ProjectClone] = None,
+    services: ServiceContainer = Depends(get_services),
+):
+    """Fork a project with all of its articles, persons, settlements and images"""
+    project = services.projects.clone_project(project_id=project_id, name=clone.name if clone else None)
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return project
+
+
+@router.get("/{project_id}/stats", response_model=ProjectStats)
+def get_project_stats(project_id: int, services: ServiceContainer = Depends(get_services)):
+    """Get a project's article, person, settlement and image counts and image storage total"""
+    stats = services.projects.get_project_stats(project_id=project_id)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return stats
+
+
+@router.get("/{project_id}/overview", response_model=ProjectOverview)
+async def get_project_overview(project_id: int, recent: int = Query(10, ge=0, le=50)):
+    """
+    Get the project landing page data in one response.
+
+    Article type counts, recently edited articles, person life statuses, settlement
+    types and storage usage are queried concurrently on separate connections.
+
+    - **recent**: number of recently updated articles to include
+    """
+    overview = await ProjectOverviewService().get_overview(project_id, recent_limit=recent)
+    if overview is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return overview
+
 
+@router.get("/{project_id}/tags", response_model=List[TagCount])
+def get_project_tags(
+    project_id: int, limit: int = Query(100, ge=1, le=1000), services: ServiceContainer = Depends(get_services)
+):
+    """Get a project's most used tags and how many articles carry each, from maintained counts"""
+    if services.projects.get_project(project_id=project_id) is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return services.articles.get_tag_counts(project_id, limit)
+
+
+@router.get("/{project_id}/autocomplete", response_model=List[ArticleReference])
+def autocomplete_project_titles(
+    project_id: int,
+    q: str = Query(..., min_length=1, description="Title prefix, matched case-insensitively"),
+    limit: int = Query(10, ge=1, le=100),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get articles (including persons and settlements) whose title starts with a prefix, for typeahead"""
+    if services.projects.get_project(project_id=project_id) is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return services.articles.autocomplete_titles(project_id, q, limit)
+
+
+@router.get("/{project_id}/timeline", response_model=TimelinePage)
+def get_project_timeline(
+    project_id: int,
+    date_from: Optional[str] = Query(None, alias="from", description="Earliest date, e.g. '1400' or 'Spring 1372 DR'"),
+    date_to: Optional[str] = Query(None, alias="to", description="Latest date, inclusive of the whole period it names"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    services: ServiceContainer = Depends(get_services),
+):
+    """
+    Get person and settlement events in calendar order.
+
+    Dates are read with the project calendar. Pages are keyed on the last event
+    returned, so paging deep into long eras costs the same as the first page.
+    Events whose date has no readable year are not listed.
+    """
+    if services.projects.get_project(project_id=project_id) is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    try:
+        return services.timeline.get_timeline(project_id, date_from, date_to, cursor, limit)
+    except InvalidTimelineQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@router.delete("/{project_id}")
+
+@router.delete("/{project_id}", status_code=202)
 def delete_project(project_id: int, services: ServiceContainer = Depends(get_services)):
-    """Delete a project"""
-    db_project = services.projects.get_project(project_id=project_id)
-    if db_project is None:
+    """Delete a project; its image files are removed by a background job"""
+    job = services.projects.delete_project(project_id=project_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return {"message": "Project deleted successfully", "job_id": job.id}
+
+
+@router.get("/{project_id}/export")
+def export_project(
+    project_id: int,
+    compress: bool = False,
+    include_images: bool = False,
+    services: ServiceContainer = Depends(get_services),
+):
+    """
+    Stream a full project export as NDJSON.
+
+    - **compress**: gzip the stream
+    - **include_images**: bundle the NDJSON and local image files in a tar stream
+    """
+    project = services.projects.get_project(project_id=project_id)
+    if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
-    services.projects.delete_project(project_id=project_id)
-    return {"message": "Project deleted successfully"}
+
+    export_service = ProjectExportService()
+    if include_images:
+        body = export_service.iter_tar(project_id, compress=compress)
+        media_type = "application/gzip" if compress else "application/x-tar"
+        extension = "tar.gz" if compress else "tar"
+    elif compress:
+        body = export_service.iter_ndjson_gzip(project_id)
+        media_type = "application/gzip"
+        extension = "ndjson.gz"
+    else:
+        body = export_service.iter_ndjson(project_id)
+        media_type = "application/x-ndjson"
+        extension = "ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}.{extension}"'},
+    )
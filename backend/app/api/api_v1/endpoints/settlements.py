@@ -0,0 +1,155 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+from app.api.deps import get_batch_ids
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.schemas.converters import settlement_to_schema
+from app.schemas.settlement import (
+    GovernmentTypeEnum, PopulationCategoryEnum, Settlement, SettlementDistance, SettlementExplorerResponse,
+    SettlementMapPoint, SettlementTypeEnum, TradeComponent, TradeHub, TradeRoute,
+)
+from app.services.container import get_services, ServiceContainer
+
+router = APIRouter()
+
+
+def _batch_response(ids: List[int], services: ServiceContainer) -> BatchResponse[Settlement]:
+    settlements = services.settlements.get_settlements_by_article_ids(ids)
+    found = {article_id: settlement_to_schema(settlement) for article_id, settlement in settlements.items()}
+    return BatchResponse[Settlement].from_results(ids, found)
+
+
+@router.get("/batch", response_model=BatchResponse[Settlement])
+def get_settlements_batch(ids: List[int] = Depends(get_batch_ids), services: ServiceContainer = Depends(get_services)):
+    """Get many settlements by article ID in one query; results follow the order of ids"""
+    return _batch_response(ids, services)
+
+
+@router.post("/batch", response_model=BatchResponse[Settlement])
+def post_settlements_batch(batch: BatchRequest, services: ServiceContainer = Depends(get_services)):
+    """Get many settlements by article ID, for ID lists too long for a query string"""
+    return _batch_response(batch.ids, services)
+
+
+@router.get("/explore", response_model=SettlementExplorerResponse)
+def explore_settlements(
+    project_id: int,
+    name: Optional[str] = Query(None, description="Match settlements whose name contains this text"),
+    settlement_type: List[SettlementTypeEnum] = Query([]),
+    government_type: List[GovernmentTypeEnum] = Query([]),
+    region: List[str] = Query([]),
+    primary_industry: List[str] = Query([]),
+    population_category: List[PopulationCategoryEnum] = Query([]),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    services: ServiceContainer = Depends(get_services),
+):
+    """
+    Explore settlements in a project by facets, returning the page, the total, per-facet counts
+    and a population histogram in one query.
+
+    Repeat a facet parameter to match any of several values (e.g. `region=North&region=Coast`).
+    """
+    selected = {
+        "settlement_type": [value.value for value in settlement_type],
+        "government_type": [value.value for value in government_type],
+        "region": region,
+        "primary_industry": primary_industry,
+        "population_category": [value.value for value in population_category],
+    }
+    settlements, total, facets, histogram = services.settlements.explore_settlements(
+        project_id, selected, name, skip, limit
+    )
+    return SettlementExplorerResponse(
+        items=[settlement_to_schema(settlement) for settlement in settlements],
+        total=total,
+        facets=facets,
+        population_histogram=histogram,
+    )
+
+
+@router.get("/map", response_model=List[SettlementMapPoint])
+def get_map_settlements(
+    project_id: int,
+    south: float = Query(..., ge=-90, le=90),
+    west: float = Query(..., ge=-180, le=180),
+    north: float = Query(..., ge=-90, le=90),
+    east: float = Query(..., ge=-180, le=180),
+    limit: int = Query(1000, ge=1, le=10000),
+    services: ServiceContainer = Depends(get_services),
+):
+    """
+    Get map markers for the settlements inside a viewport, largest first.
+
+    A viewport with `west > east` crosses the antimeridian.
+    """
+    return services.settlements.get_map_settlements(project_id, south, west, north, east, limit)
+
+
+@router.get("/within", response_model=List[SettlementDistance])
+def get_settlements_within(
+    project_id: int,
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(..., gt=0),
+    limit: int = Query(100, ge=1, le=1000),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get settlements within a radius of a point, nearest first"""
+    return services.settlements.get_settlements_within(project_id, lat, lng, radius_km, limit)
+
+
+@router.get("/nearest", response_model=List[SettlementDistance])
+def get_nearest_settlements(
+    project_id: int,
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    k: int = Query(10, ge=1, le=100),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get the k settlements nearest to a point"""
+    return services.settlements.get_nearest_settlements(project_id, lat, lng, k)
+
+
+@router.get("/{settlement_id}/nearest", response_model=List[SettlementDistance])
+def get_settlements_near(
+    settlement_id: int,
+    k: int = Query(10, ge=1, le=100),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get the k settlements nearest to a settlement (by article ID); empty if it has no coordinates"""
+    settlements = services.settlements.get_settlements_near(settlement_id, k)
+    if settlements is None:
+        raise HTTPException(status_code=404, detail="Settlement not found")
+    return settlements
+
+
+@router.get("/trade/components", response_model=List[TradeComponent])
+def get_trade_components(
+    project_id: int,
+    min_size: int = Query(2, ge=1),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get the groups of settlements connected by trade routes (via nearby settlements), largest first"""
+    return services.settlements.get_trade_components(project_id, min_size)
+
+
+@router.get("/trade/hubs", response_model=List[TradeHub])
+def get_trade_hubs(
+    project_id: int,
+    limit: int = Query(20, ge=1, le=500),
+    services: ServiceContainer = Depends(get_services),
+):
+    """Get the settlements that act as trade hubs, best connected first"""
+    return services.settlements.get_trade_hubs(project_id, limit)
+
+
+@router.get("/{settlement_id}/trade-route/{other_id}", response_model=TradeRoute)
+def get_trade_route(settlement_id: int, other_id: int, services: ServiceContainer = Depends(get_services)):
+    """Get the shortest trade route between two settlements (by article ID)"""
+    for article_id in (settlement_id, other_id):
+        if not services.settlements.settlement_exists(article_id):
+            raise HTTPException(status_code=404, detail="Settlement not found")
+    route = services.settlements.get_trade_route(settlement_id, other_id)
+    if route is None:
+        raise HTTPException(status_code=404, detail="No trade route found")
+    return route
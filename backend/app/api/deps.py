@@ -0,0 +1,22 @@
+"""
+Shared FastAPI dependencies for API endpoints.
+"""
+
+from typing import List
+
+from fastapi import HTTPException, Query
+
+from app.schemas.batch import MAX_BATCH_SIZE
+
+
+def get_batch_ids(ids: str = Query(..., description="Comma-separated IDs, e.g. 1,2,3")) -> List[int]:
+    """Parse a comma-separated ``ids`` query parameter for batch endpoints."""
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be a comma-separated list of integers")
+    if not parsed:
+        raise HTTPException(status_code=400, detail="ids must not be empty")
+    if len(parsed) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SIZE} ids can be fetched at once")
+    return parsed
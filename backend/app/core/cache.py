@@ -0,0 +1,230 @@
+"""
+Caches for serialized API payloads.
+
+Entries are keyed by entity kind and ID (plus an optional variant, such as
+whether the header image is embedded) and stamped with the entity's version,
+so a lookup with a newer version is a miss even before the write path has
+invalidated it. Each worker keeps an in-process tier bounded by entry count
+(LRU) and by age (TTL); an optional shared tier (see ``app.core.shared_cache``)
+is consulted on local misses and carries invalidations between workers.
+"""
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.shared_cache import CacheBackend, RedisCacheBackend
+
+EntityKey = Tuple[str, Any]
+CacheKey = Tuple[str, Any, Hashable]
+
+
+@dataclass
+class _Entry:
+    version: Hashable
+    payload: bytes
+    expires_at: float
+
+
+@dataclass
+class CacheStats:
+    """Counters for monitoring cache effectiveness."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class PayloadCache:
+    """Thread-safe LRU + TTL cache of versioned payloads."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._variants: Dict[EntityKey, Set[Hashable]] = {}
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, id: Any, version: Hashable, variant: Hashable = None) -> Optional[bytes]:
+        """Get a payload if one is cached for exactly this version."""
+        key = (kind, id, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            if entry.version != version:
+                self._remove(key)
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.payload
+
+    def set(self, kind: str, id: Any, version: Hashable, payload: bytes, variant: Hashable = None) -> None:
+        """Store a payload for an entity version, evicting the least recently used entries if full."""
+        if self.max_entries <= 0:
+            return
+        key = (kind, id, variant)
+        with self._lock:
+            self._entries[key] = _Entry(version, payload, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            self._variants.setdefault((kind, id), set()).add(variant)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+
+    def invalidate(self, kind: str, id: Any) -> None:
+        """Drop every cached variant of an entity."""
+        with self._lock:
+            variants = self._variants.pop((kind, id), None)
+            if not variants:
+                return
+            for variant in variants:
+                self._entries.pop((kind, id, variant), None)
+            self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._variants.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the cache counters and size."""
+        with self._lock:
+            lookups = self._stats.hits + self._stats.misses
+            return {
+                "hits": self._stats.hits,
+                "misses": self._stats.misses,
+                "hit_rate": self._stats.hits / lookups if lookups else 0.0,
+                "evictions": self._stats.evictions,
+                "expirations": self._stats.expirations,
+                "invalidations": self._stats.invalidations,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def _remove(self, key: CacheKey) -> None:
+        del self._entries[key]
+        kind, id, variant = key
+        variants = self._variants.get((kind, id))
+        if variants is not None:
+            variants.discard(variant)
+            if not variants:
+                del self._variants[(kind, id)]
+
+
+class TieredCache:
+    """
+    Per-worker payload cache backed by an optional shared tier.
+
+    Writes in the service layer call ``publish_invalidation`` so that other
+    workers drop their local copies; messages from this worker are ignored
+    because its repositories have already invalidated locally.
+    """
+
+    def __init__(self, local: PayloadCache, ttl_seconds: int):
+        self.local = local
+        self.ttl_seconds = ttl_seconds
+        self.instance_id = uuid.uuid4().hex
+        self.backend: Optional[CacheBackend] = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
+        self._counters = {
+            "shared_hits": 0,
+            "shared_misses": 0,
+            "invalidations_published": 0,
+            "invalidations_received": 0,
+        }
+        self._lock = threading.Lock()
+
+    def start(self, backend: Optional[CacheBackend] = None) -> None:
+        """Attach the shared tier (configured from settings if not given) and listen for invalidations."""
+        if backend is None and settings.CACHE_REDIS_URL:
+            backend = RedisCacheBackend(settings.CACHE_REDIS_URL, channel=settings.CACHE_INVALIDATION_CHANNEL)
+        if backend is None:
+            return
+        self.stop()
+        self.backend = backend
+        self._unsubscribe = backend.subscribe(self._on_message)
+
+    def stop(self) -> None:
+        """Detach from the shared tier."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+        self._unsubscribe = None
+        self.backend = None
+
+    def get(self, kind: str, id: Any, version: Hashable, variant: Hashable = None) -> Optional[bytes]:
+        """Get a payload for this exact version from the local tier, then the shared tier."""
+        payload = self.local.get(kind, id, version, variant)
+        backend = self.backend
+        if payload is not None or backend is None:
+            return payload
+
+        payload = backend.get(self._shared_key(kind, id, version, variant))
+        self._count("shared_hits" if payload is not None else "shared_misses")
+        if payload is not None:
+            self.local.set(kind, id, version, payload, variant)
+        return payload
+
+    def set(self, kind: str, id: Any, version: Hashable, payload: bytes, variant: Hashable = None) -> None:
+        """Store a payload in both tiers."""
+        self.local.set(kind, id, version, payload, variant)
+        backend = self.backend
+        if backend is not None:
+            backend.set(self._shared_key(kind, id, version, variant), payload, self.ttl_seconds)
+
+    def publish_invalidation(self, kind: str, id: Any) -> None:
+        """Tell the other workers to drop their local copies of an entity."""
+        backend = self.backend
+        if backend is None:
+            return
+        message = json.dumps({"origin": self.instance_id, "kind": kind, "id": id})
+        backend.publish(message.encode("utf-8"))
+        self._count("invalidations_published")
+
+    def stats(self) -> Dict[str, Any]:
+        """Local tier counters plus shared tier and broadcast counters."""
+        with self._lock:
+            counters = dict(self._counters)
+        return {**self.local.stats(), "shared_enabled": self.backend is not None, **counters}
+
+    def _on_message(self, raw: bytes) -> None:
+        try:
+            message = json.loads(raw)
+        except (TypeError, ValueError):
+            return
+        if message.get("origin") == self.instance_id:
+            return
+        self.local.invalidate(message["kind"], message["id"])
+        self._count("invalidations_received")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    @staticmethod
+    def _shared_key(kind: str, id: Any, version: Hashable, variant: Hashable) -> str:
+        # Shared keys embed the version, so stale entries are never read and simply expire
+        digest = hashlib.sha1(repr(version).encode("utf-8")).hexdigest()[:16]
+        return f"mythosengine:payload:{kind}:{id}:{variant}:{digest}"
+
+
+payload_cache = PayloadCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+entity_cache = TieredCache(payload_cache, settings.CACHE_TTL_SECONDS)
@@ -37,7 +37,17 @@ class Settings(BaseSettings):
     LOCAL_IMAGES_PATH: str = "images"  # Local storage path
     MAX_IMAGE_SIZE_MB: int = 10  # Maximum image file size in MB
     ALLOWED_IMAGE_TYPES: List[str] = ["image/jpeg", "image/png", "image/gif", "image/webp"]
+    THUMBNAIL_SIZE: int = 320  # Longest edge of generated thumbnails in pixels
     
+    # Cache Settings
+    CACHE_MAX_ENTRIES: int = 2048  # Serialized article/project payloads kept per worker; 0 disables
+    CACHE_TTL_SECONDS: int = 300
+    CACHE_REDIS_URL: Optional[str] = None  # Shared cache tier across workers, e.g. redis://localhost:6379/0
+    CACHE_INVALIDATION_CHANNEL: str = "mythosengine:invalidate"
+    AUTOCOMPLETE_CACHE_PROJECTS: int = 16  # Projects whose sorted titles are kept per worker for autocomplete; 0 disables
+    RELATED_CACHE_PROJECTS: int = 4  # Projects whose article vectors are kept per worker
+    RELATED_VECTOR_DIMENSIONS: int = 256  # 4 bytes per dimension per article; fewer is faster but less precise
+
     # S3 Settings (for online hosting)
     AWS_ACCESS_KEY_ID: Optional[str] = None
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
@@ -0,0 +1,92 @@
+"""
+HTTP conditional request helpers (ETag / Last-Modified / 304 Not Modified).
+
+Endpoints compute cheap validators from a version query (e.g. ``updated_at``
+or ``count + max(updated_at)``) and check them before loading and serializing
+the full resource.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values that determine a representation."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def latest(*values: Optional[datetime]) -> Optional[datetime]:
+    """Most recent of the given timestamps, ignoring missing ones."""
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Check the request's validators; If-None-Match takes precedence over If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one-second resolution
+        return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+    return False
+
+
+def _validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def check_conditional(
+    request: Request, response: Response, etag: str, last_modified: Optional[datetime] = None
+) -> Optional[Response]:
+    """
+    Apply validators to a request.
+
+    Returns a ready 304 response when the client's copy is current; otherwise
+    sets ETag/Last-Modified on ``response`` and returns None so the endpoint
+    carries on building the body.
+    """
+    headers = _validator_headers(etag, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def json_payload_response(payload: bytes, response: Response) -> Response:
+    """Send pre-serialized JSON, carrying over the validators set on ``response``."""
+    headers = {
+        name: value
+        for name, value in response.headers.items()
+        if name in ("etag", "last-modified", "cache-control")
+    }
+    return Response(content=payload, media_type="application/json", headers=headers)
@@ -0,0 +1,165 @@
+"""
+Shared cache backends used across API workers.
+
+A backend stores payloads that every worker can read and carries invalidation
+messages between workers. ``RedisCacheBackend`` talks to any Redis-protocol
+server; ``InMemoryCacheBackend`` is a process-local stand-in for development
+and tests (several caches attached to one instance behave like separate workers).
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[bytes], None]
+
+# Backoff between attempts to (re)subscribe to the invalidation channel
+_RECONNECT_MIN_SECONDS = 1.0
+_RECONNECT_MAX_SECONDS = 30.0
+
+
+class CacheBackend(ABC):
+    """Key/value store with a broadcast channel."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a value, or None if it is missing or the backend is unavailable."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        """Store a value that expires after ``ttl_seconds``."""
+        pass
+
+    @abstractmethod
+    def publish(self, message: bytes) -> None:
+        """Broadcast a message to every subscriber, including this process."""
+        pass
+
+    @abstractmethod
+    def subscribe(self, handler: MessageHandler) -> Callable[[], None]:
+        """Deliver broadcast messages to ``handler``; returns a function that unsubscribes."""
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local backend with the same semantics as the Redis one."""
+
+    def __init__(self):
+        self._values: Dict[str, Tuple[bytes, float]] = {}
+        self._handlers: List[MessageHandler] = []
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._values.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        with self._lock:
+            self._values[key] = (value, time.monotonic() + ttl_seconds)
+
+    def publish(self, message: bytes) -> None:
+        with self._lock:
+            handlers = list(self._handlers)
+        for handler in handlers:
+            handler(message)
+
+    def subscribe(self, handler: MessageHandler) -> Callable[[], None]:
+        with self._lock:
+            self._handlers.append(handler)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if handler in self._handlers:
+                    self._handlers.remove(handler)
+
+        return unsubscribe
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend on a Redis-protocol server.
+
+    Requires the optional ``redis`` package unless a compatible ``client`` is
+    passed in. Connection errors are logged and treated as cache misses so the
+    API keeps serving from the database when the cache is down.
+    """
+
+    def __init__(self, url: Optional[str] = None, channel: str = "mythosengine:invalidate", client: Any = None):
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError("The shared cache requires the 'redis' package (pip install redis)") from e
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.channel = channel
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.client.get(key)
+        except Exception as e:
+            logger.warning("Shared cache get failed: %s", e)
+            return None
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        try:
+            self.client.set(key, value, ex=ttl_seconds)
+        except Exception as e:
+            logger.warning("Shared cache set failed: %s", e)
+
+    def publish(self, message: bytes) -> None:
+        try:
+            self.client.publish(self.channel, message)
+        except Exception as e:
+            logger.warning("Shared cache publish failed: %s", e)
+
+    def subscribe(self, handler: MessageHandler) -> Callable[[], None]:
+        # Listening happens on a background thread that reconnects on its own, so an
+        # unreachable server never blocks startup; until it connects, only this
+        # worker's own invalidations apply
+        stopped = threading.Event()
+        thread = threading.Thread(
+            target=self._listen, args=(handler, stopped), name="shared-cache-listener", daemon=True
+        )
+        thread.start()
+
+        def unsubscribe() -> None:
+            stopped.set()
+
+        return unsubscribe
+
+    def _listen(self, handler: MessageHandler, stopped: threading.Event) -> None:
+        delay = _RECONNECT_MIN_SECONDS
+        while not stopped.is_set():
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                delay = _RECONNECT_MIN_SECONDS
+                while not stopped.is_set():
+                    # get_message blocks for up to the timeout, so delivery latency stays in milliseconds
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None and message.get("type") == "message":
+                        handler(message["data"])
+            except Exception as e:
+                logger.warning("Shared cache subscription failed, retrying in %.0fs: %s", delay, e)
+                stopped.wait(delay)
+                delay = min(delay * 2, _RECONNECT_MAX_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
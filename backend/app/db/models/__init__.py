@@ -10,5 +10,15 @@ from .project import ProjectDB
 from .person import PersonDB
 from .settlement import SettlementDB
 from .image import ImageDB
+from .project_stats import ProjectStatsDB
+from .person_relationship import PersonRelationshipDB
+from .location import LocationDB, LocationClosureDB
+from .timeline_event import TimelineEventDB
+from .article_tag import ArticleTagDB, ProjectTagCountDB
+from .article_link import ArticleLinkDB
 
-__all__ = ["ArticleDB", "ProjectDB", "PersonDB", "SettlementDB", "ImageDB"]
\ No newline at end of file
+__all__ = [
+    "ArticleDB", "ProjectDB", "PersonDB", "SettlementDB", "ImageDB", "ProjectStatsDB", "PersonRelationshipDB",
+    "LocationDB", "LocationClosureDB", "TimelineEventDB", "ArticleTagDB", "ProjectTagCountDB",
+    "ArticleLinkDB",
+]
\ No newline at end of file
@@ -2,7 +2,7 @@
 Article database model for SQLAlchemy persistence.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
@@ -17,16 +17,38 @@ class ArticleDB(Base):
     title = Column(String, index=True, nullable=False)
     content = Column(JSONB, nullable=True, default={})
     article_type = Column(String, default="general", index=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
-    header_image_id = Column(Integer, ForeignKey("images.id"), nullable=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    header_image_id = Column(Integer, ForeignKey("images.id", ondelete="SET NULL"), nullable=True, index=True)
     spotify_url = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    # Set by a trigger to the project's article version of the writing transaction
+    # (see the ``add_article_change_versions`` migration)
+    change_version = Column(BigInteger, nullable=False, server_default="0")
 
     # Relationships
     project = relationship("ProjectDB", back_populates="articles")
     header_image = relationship("ImageDB", foreign_keys=[header_image_id])
-    person = relationship("PersonDB", back_populates="article", uselist=False)
-    settlement = relationship("SettlementDB", back_populates="article", uselist=False)
\ No newline at end of file
+    person = relationship(
+        "PersonDB", back_populates="article", uselist=False, cascade="all, delete-orphan", passive_deletes=True
+    )
+    settlement = relationship(
+        "SettlementDB", back_populates="article", uselist=False, cascade="all, delete-orphan", passive_deletes=True
+    )
+
+    __table_args__ = (
+        # Case-insensitive title lookups within a project (e.g. resolving names to persons);
+        # text_pattern_ops also serves LIKE 'prefix%' for title autocomplete
+        Index(
+            "ix_articles_project_id_lower_title",
+            "project_id",
+            func.lower(title).label("lower_title"),
+            postgresql_ops={"lower_title": "text_pattern_ops"},
+        ),
+        # Newest articles first, and the latest change in a project
+        Index("ix_articles_project_id_updated_at", "project_id", "updated_at", "id"),
+        # Articles written since a project version, for refreshing per-project indexes
+        Index("ix_articles_project_id_change_version", "project_id", "change_version"),
+    )
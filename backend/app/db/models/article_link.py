@@ -0,0 +1,32 @@
+"""
+Article link database model for SQLAlchemy persistence.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
+from app.db.database import Base
+
+
+class ArticleLinkDB(Base):
+    """
+    One wiki link from an article to another, derived from ``[[...]]`` references
+    in ``articles.content``.
+
+    ``target_key`` identifies the link within its source: ``id:<n>`` for links by
+    article ID, otherwise the lower-cased title. ``target_article_id`` is filled in
+    when the key matches an article in the same project.
+    """
+    __tablename__ = "article_links"
+
+    source_article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    target_key = Column(String, primary_key=True)
+    # Denormalized scope without a foreign key, as for person relationships
+    project_id = Column(Integer, nullable=False)
+    target_article_id = Column(Integer, ForeignKey("articles.id", ondelete="SET NULL"), nullable=True)
+    target_title = Column(String, nullable=False)
+
+    __table_args__ = (
+        # Backlinks: every article linking to a target, in source order
+        Index("ix_article_links_target_article_id", "target_article_id", "source_article_id"),
+        # Finds the links naming a title when an article is created, renamed or deleted
+        Index("ix_article_links_project_id_target_key", "project_id", "target_key"),
+    )
@@ -0,0 +1,36 @@
+"""
+Article tag database models for SQLAlchemy persistence.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
+from app.db.database import Base
+
+
+class ArticleTagDB(Base):
+    """
+    One tag on an article, normalized to lower case without surrounding whitespace.
+
+    Rows are derived from ``articles.content->'tags'`` by database triggers (see
+    the ``add_article_tags`` migration) whenever articles are inserted or updated,
+    so every write path keeps them current and the application only reads them.
+    """
+    __tablename__ = "article_tags"
+
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String, primary_key=True)
+    # Denormalized from the article so tag lookups can be scoped to a project from the index alone
+    project_id = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # Serves tag filters with or without a project scope
+        Index("ix_article_tags_tag_project_id", "tag", "project_id", "article_id"),
+    )
+
+
+class ProjectTagCountDB(Base):
+    """Number of articles per tag in a project, kept current by triggers on ``article_tags``."""
+    __tablename__ = "project_tag_counts"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String, primary_key=True)
+    article_count = Column(Integer, nullable=False, server_default="0")
@@ -2,7 +2,7 @@
 Image database model for SQLAlchemy persistence.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Text, ForeignKey, Boolean
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -15,7 +15,7 @@ class ImageDB(Base):
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, nullable=False, index=True)
     original_filename = Column(String, nullable=False)
-    file_path = Column(String, nullable=False)  # Local path or S3 key
+    file_path = Column(String, nullable=False, index=True)  # Local path or S3 key, may be shared by clones
     file_size = Column(Integer, nullable=False)  # Size in bytes
     mime_type = Column(String, nullable=False)
     width = Column(Integer, nullable=True)  # Image width in pixels
@@ -23,13 +23,15 @@ class ImageDB(Base):
     alt_text = Column(Text, nullable=True)  # Accessibility description
     is_s3_stored = Column(Boolean, default=False)  # True for S3, False for local
     s3_bucket = Column(String, nullable=True)  # S3 bucket name if applicable
+    perceptual_hash = Column(BigInteger, nullable=True)  # 64-bit dHash stored as signed int64
+    placeholder_color = Column(String(7), nullable=True)  # Average colour as "#rrggbb"
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     # Foreign key to project (required for quota management)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Relationships
     project = relationship("ProjectDB", back_populates="images")
\ No newline at end of file
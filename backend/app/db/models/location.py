@@ -0,0 +1,44 @@
+"""
+Location hierarchy database models for SQLAlchemy persistence.
+"""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, func
+from app.db.database import Base
+
+
+class LocationDB(Base):
+    """
+    A node in a project's location hierarchy (e.g. continent → region → settlement).
+
+    Settlement nodes carry the settlement's ``article_id``. Ancestry is also kept
+    in ``location_closure`` so subtree queries are a single indexed join.
+    """
+    __tablename__ = "locations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    name = Column(String, nullable=False)
+    location_type = Column(String, nullable=False, default="place")
+    parent_id = Column(Integer, ForeignKey("locations.id", ondelete="SET NULL"), nullable=True, index=True)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=True, unique=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Resolves the free-text region and location names stored on settlements and persons
+        Index("ix_locations_project_id_lower_name", "project_id", func.lower(name)),
+    )
+
+
+class LocationClosureDB(Base):
+    """
+    One (ancestor, descendant) pair in the location hierarchy, including each
+    node paired with itself at depth 0.
+    """
+    __tablename__ = "location_closure"
+
+    ancestor_id = Column(Integer, ForeignKey("locations.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id = Column(
+        Integer, ForeignKey("locations.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    depth = Column(Integer, nullable=False)
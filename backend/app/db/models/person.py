@@ -13,7 +13,7 @@ class PersonDB(Base):
     __tablename__ = "persons"
 
     id = Column(Integer, primary_key=True, index=True)
-    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, unique=True)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False, unique=True)
     
     # Core person data stored as JSONB for flexibility
     person_data = Column(JSONB, nullable=False, default={})
@@ -25,5 +25,9 @@ class PersonDB(Base):
     occupation = Column(String, index=True, nullable=True)
     current_location = Column(String, index=True, nullable=True)
 
+    # Location hierarchy nodes matching current_location and person_data["birthplace"]
+    location_id = Column(Integer, ForeignKey("locations.id", ondelete="SET NULL"), nullable=True, index=True)
+    birthplace_id = Column(Integer, ForeignKey("locations.id", ondelete="SET NULL"), nullable=True, index=True)
+
     # Relationships
     article = relationship("ArticleDB", back_populates="person")
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Person relationship database model for SQLAlchemy persistence.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Text, func
+from app.db.database import Base
+
+
+class PersonRelationshipDB(Base):
+    """
+    One relationship edge between persons, derived from ``persons.person_data``.
+
+    Rows are rebuilt from the JSONB relationships list whenever a person is
+    written; ``target_name`` keeps the free-text name and ``target_article_id``
+    is filled in when it matches a person in the same project.
+    """
+    __tablename__ = "person_relationships"
+
+    id = Column(Integer, primary_key=True)
+    # Denormalized scope without a foreign key: rows already go away with their source person,
+    # and skipping the check keeps bulk rebuilds cheap
+    project_id = Column(Integer, nullable=False)
+    source_article_id = Column(
+        Integer, ForeignKey("persons.article_id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    target_article_id = Column(
+        Integer, ForeignKey("persons.article_id", ondelete="SET NULL"), nullable=True, index=True
+    )
+    target_name = Column(String, nullable=False)
+    relationship_type = Column(String, nullable=False, index=True)
+    description = Column(Text, nullable=True)
+    status = Column(String, nullable=False, default="active")
+    position = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Finds unresolved edges that a newly created or renamed person should claim
+        Index("ix_person_relationships_project_target_name", "project_id", func.lower(target_name)),
+    )
@@ -3,6 +3,7 @@ Project database model for SQLAlchemy persistence.
 """
 
 from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -15,15 +16,18 @@ class ProjectDB(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True, nullable=False)
     description = Column(Text, nullable=True)
+    # Eras and month names used to order free-form dates; NULL means the default calendar
+    calendar = Column(JSONB, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    # Relationships
+    # Relationships (children are removed by ON DELETE CASCADE, never loaded for deletion)
     articles = relationship(
-        "ArticleDB", back_populates="project", cascade="all, delete-orphan"
+        "ArticleDB", back_populates="project", cascade="all, delete-orphan", passive_deletes=True
     )
     images = relationship(
-        "ImageDB", back_populates="project", cascade="all, delete-orphan"
-    )
\ No newline at end of file
+        "ImageDB", back_populates="project", cascade="all, delete-orphan", passive_deletes=True
+    )
+    stats = relationship("ProjectStatsDB", back_populates="project", uselist=False, viewonly=True)
@@ -0,0 +1,30 @@
+"""
+Project statistics database model for SQLAlchemy persistence.
+"""
+
+from sqlalchemy import BigInteger, Column, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+from app.db.database import Base
+
+
+class ProjectStatsDB(Base):
+    """
+    Per-project row counts, image storage totals and the article version.
+
+    Rows are created and kept current by database triggers (see the
+    ``add_project_stats`` migration) in the same transaction as the changes
+    they count, so the application only ever reads them.
+    """
+    __tablename__ = "project_stats"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    article_count = Column(Integer, nullable=False, server_default="0")
+    person_count = Column(Integer, nullable=False, server_default="0")
+    settlement_count = Column(Integer, nullable=False, server_default="0")
+    image_count = Column(Integer, nullable=False, server_default="0")
+    image_bytes = Column(BigInteger, nullable=False, server_default="0")
+    # Bumped once by every transaction that writes the project's articles, in commit order
+    article_version = Column(BigInteger, nullable=False, server_default="0")
+
+    # Relationships
+    project = relationship("ProjectDB", back_populates="stats")
@@ -2,7 +2,7 @@
 Settlement database model for SQLAlchemy persistence.
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from app.db.database import Base
@@ -13,7 +13,7 @@ class SettlementDB(Base):
     __tablename__ = "settlements"
 
     id = Column(Integer, primary_key=True, index=True)
-    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, unique=True)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False, unique=True)
     
     # Core settlement data stored as JSONB for flexibility
     settlement_data = Column(JSONB, nullable=False, default={})
@@ -25,5 +25,17 @@ class SettlementDB(Base):
     region = Column(String, index=True, nullable=True)
     primary_industry = Column(String, index=True, nullable=True)
 
+    # Map position in degrees, copied from settlement_data["coordinates"]
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+
+    # The settlement's own node in the location hierarchy
+    location_id = Column(Integer, ForeignKey("locations.id", ondelete="SET NULL"), nullable=True, index=True)
+
     # Relationships
-    article = relationship("ArticleDB", back_populates="settlement")
\ No newline at end of file
+    article = relationship("ArticleDB", back_populates="settlement")
+
+    __table_args__ = (
+        # GiST index on (x=longitude, y=latitude) for bounding-box and nearest-neighbour queries
+        Index("ix_settlements_location", func.point(longitude, latitude), postgresql_using="gist"),
+    )
@@ -0,0 +1,32 @@
+"""
+Timeline event database model for SQLAlchemy persistence.
+"""
+
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer, String
+from app.db.database import Base
+
+
+class TimelineEventDB(Base):
+    """
+    One dated event from a person or settlement, derived from their JSONB data.
+
+    Rows are rebuilt whenever the owning article is written. ``date_text`` keeps
+    the free-form date and ``sort_key`` is its position on the project calendar,
+    or NULL when no year can be read from it.
+    """
+    __tablename__ = "timeline_events"
+
+    id = Column(Integer, primary_key=True)
+    # Denormalized scope without a foreign key: rows already go away with their article
+    project_id = Column(Integer, nullable=False)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), nullable=False, index=True)
+    kind = Column(String, nullable=False)
+    label = Column(String, nullable=False)
+    date_text = Column(String, nullable=False)
+    sort_key = Column(BigInteger, nullable=True)
+    position = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Serves timeline range scans and keyset paging in (sort_key, id) order
+        Index("ix_timeline_events_project_id_sort_key", "project_id", "sort_key", "id"),
+    )
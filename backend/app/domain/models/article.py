@@ -38,6 +38,18 @@ class ArticleContent:
             self.metadata = {}
 
 
+@dataclass
+class HeaderImage:
+    """Display details of an article's header image, embedded to avoid a follow-up fetch."""
+    id: int
+    url: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    alt_text: Optional[str] = None
+    placeholder: Optional[str] = None  # Average colour as "#rrggbb", shown while loading
+    thumbnail_url: Optional[str] = None
+
+
 @dataclass
 class Article:
     """
@@ -55,6 +67,7 @@ class Article:
     spotify_url: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    header_image: Optional[HeaderImage] = None
 
     def __post_init__(self):
         if isinstance(self.content, dict):
@@ -0,0 +1,193 @@
+"""
+Calendar domain model.
+
+Turns free-form in-world dates ("Summer 1425", "15 Hammer 1372 DR", "200 BE",
+"1425-06-15") into integer sort keys so events from different articles can be
+ordered on one timeline. Each project may define its own eras and month names.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+GREGORIAN_MONTHS = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+]
+SEASONS = {"spring": 3, "summer": 6, "autumn": 9, "fall": 9, "winter": 12}
+
+# Sort keys are year * KEY_YEAR + month * KEY_MONTH + day; an unknown month or
+# day is 0, so partial dates sort before the precise dates within them.
+KEY_YEAR = 10000
+KEY_MONTH = 100
+MAX_MONTHS = 99
+MAX_YEAR = 10 ** 14
+
+_ISO_DATE = re.compile(r"^\s*(-?\d+)-(\d{1,2})(?:-(\d{1,2}))?\s*$")
+_NUMBER = re.compile(r"(?<![\w-])(-?\d+)(?:st|nd|rd|th)?(?!\w)", re.IGNORECASE)
+_WORD = re.compile(r"[^\W\d_]+")
+# What may stand between a month or season and the number it goes with ("5 March",
+# "Spring, 1425", "3rd of March"); anything else means the word is not part of the date
+_BESIDE = re.compile(r"[\s,.]*(?:of[\s,.]+)?")
+
+
+@dataclass(frozen=True)
+class Era:
+    """A named era; years in it count forward (or backward, if ``reverse``) from ``start_year``."""
+    name: str
+    start_year: int = 0
+    reverse: bool = False
+
+    def __post_init__(self):
+        if not self.name or not self.name.strip():
+            raise ValueError("Era name is required")
+
+    def absolute_year(self, year: int) -> int:
+        return self.start_year - year if self.reverse else self.start_year + year
+
+
+# Used when a project defines no eras of its own; 1 BC is year 0, as astronomers count
+DEFAULT_ERAS = [Era("BCE", 1, True), Era("BC", 1, True), Era("CE"), Era("AD")]
+
+
+@dataclass
+class Calendar:
+    """
+    Project calendar used to normalize dates into sort keys.
+
+    Dates without an era use ``default_era`` (or plain years when unset).
+    """
+    eras: List[Era] = field(default_factory=list)
+    months: List[str] = field(default_factory=lambda: list(GREGORIAN_MONTHS))
+    default_era: Optional[str] = None
+
+    def __post_init__(self):
+        names = [era.name.strip().lower() for era in self.eras]
+        if len(set(names)) != len(names):
+            raise ValueError("Era names must be unique")
+        if not self.months or len(self.months) > MAX_MONTHS:
+            raise ValueError(f"A calendar needs between 1 and {MAX_MONTHS} months")
+        if any(not month or not month.strip() for month in self.months):
+            raise ValueError("Month names cannot be empty")
+        if self.default_era is not None and self.default_era.strip().lower() not in names:
+            raise ValueError(f"Default era '{self.default_era}' is not one of the calendar's eras")
+
+        # Longest names first so "Third Age" wins over "Age"
+        eras = self.eras or DEFAULT_ERAS
+        self._era_patterns = [
+            (era, re.compile(r"(?<!\w)" + re.escape(era.name.strip()) + r"(?!\w)", re.IGNORECASE))
+            for era in sorted(eras, key=lambda era: -len(era.name))
+        ]
+        self._months = [month.strip().lower() for month in self.months]
+        self._default = next(
+            (era for era in self.eras if self.default_era and era.name.strip().lower() == self.default_era.strip().lower()),
+            None,
+        )
+
+    @classmethod
+    def from_dict(cls, config: Optional[Dict[str, Any]]) -> "Calendar":
+        """Build a calendar from a project's stored configuration (None for the default calendar)."""
+        config = config or {}
+        return cls(
+            eras=[Era(**era) for era in config.get("eras") or []],
+            months=list(config.get("months") or GREGORIAN_MONTHS),
+            default_era=config.get("default_era"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "eras": [{"name": era.name, "start_year": era.start_year, "reverse": era.reverse} for era in self.eras],
+            "months": list(self.months),
+            "default_era": self.default_era,
+        }
+
+    def _month(self, word: str) -> int:
+        for number, month in enumerate(self._months, start=1):
+            if word == month or (len(word) >= 3 and month.startswith(word)):
+                return number
+        return 0
+
+    def _dated_month(self, text: str, numbers: List[re.Match]) -> Tuple[int, bool]:
+        """
+        The first month or season named beside one of the numbers, so "Fall of Rome, 476"
+        has none, and whether it is a month rather than a season.
+        """
+        for word in _WORD.finditer(text):
+            if not any(
+                _BESIDE.fullmatch(text[number.end():word.start()] if number.end() <= word.start()
+                                  else text[word.end():number.start()])
+                for number in numbers
+            ):
+                continue
+            name = word.group().lower()
+            month = self._month(name)
+            if month:
+                return month, True
+            if name in SEASONS:
+                return SEASONS[name], False
+        return 0, False
+
+    def parse(self, text: Optional[str]) -> Optional[Tuple[int, int, int]]:
+        """Parse a date into (absolute year, month, day), with 0 for an unknown month or day."""
+        if not text or not text.strip():
+            return None
+
+        iso = _ISO_DATE.match(text)
+        if iso:
+            year, month, day = int(iso.group(1)), int(iso.group(2)), int(iso.group(3) or 0)
+            era = self._default
+        else:
+            era = None
+            for candidate, pattern in self._era_patterns:
+                match = pattern.search(text)
+                if match:
+                    era = candidate
+                    text = text[:match.start()] + " " + text[match.end():]
+                    break
+
+            matches = list(_NUMBER.finditer(text))
+            if not matches:
+                return None
+            numbers = [int(match.group(1)) for match in matches]
+            month, named = self._dated_month(text, matches)
+            # "March 5" is a day with no year, unless an era says the number is one
+            if named and era is None and len(numbers) == 1 and abs(numbers[0]) <= 31:
+                return None
+            era = era or self._default
+
+            # The year is the last number too large to be a day, else the last number
+            year_index = next((i for i in reversed(range(len(numbers))) if abs(numbers[i]) > 31), len(numbers) - 1)
+            year = numbers.pop(year_index)
+            day = numbers[0] if month and numbers else 0
+
+        if era is not None:
+            year = era.absolute_year(year)
+        if abs(year) >= MAX_YEAR or not 0 <= month <= MAX_MONTHS:
+            return None
+        if not 0 <= day < KEY_MONTH:
+            day = 0
+        return year, month, day
+
+    def sort_key(self, text: Optional[str]) -> Optional[int]:
+        """Sort key for a date, or None if no year can be read from it."""
+        parsed = self.parse(text)
+        if parsed is None:
+            return None
+        year, month, day = parsed
+        return year * KEY_YEAR + month * KEY_MONTH + day
+
+    def key_range(self, text: Optional[str]) -> Optional[Tuple[int, int]]:
+        """
+        Inclusive (low, high) sort keys covered by a date, so "1425" spans the whole
+        year and "June 1425" the whole month.
+        """
+        parsed = self.parse(text)
+        if parsed is None:
+            return None
+        year, month, day = parsed
+        low = year * KEY_YEAR + month * KEY_MONTH + day
+        if day:
+            return low, low
+        if month:
+            return low, low + KEY_MONTH - 1
+        return low, low + KEY_YEAR - 1
@@ -30,6 +30,15 @@ class LifeStatus(Enum):
     IMMORTAL = "immortal"
 
 
+# Relationship types (lower-case) that make up a family tree
+FAMILY_RELATIONSHIP_TYPES = [
+    "family", "parent", "father", "mother", "child", "son", "daughter",
+    "sibling", "brother", "sister", "spouse", "husband", "wife",
+    "grandparent", "grandfather", "grandmother", "grandchild", "grandson", "granddaughter",
+    "aunt", "uncle", "niece", "nephew", "cousin",
+]
+
+
 @dataclass
 class ImportantDate:
     """Represents an important date in a person's life."""
@@ -5,8 +5,9 @@ Represents a project or campaign that contains articles.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 from dataclasses import dataclass
+from app.domain.models.calendar import Calendar
 
 
 @dataclass
@@ -18,6 +19,7 @@ class Project:
     """
     name: str
     description: Optional[str] = None
+    calendar: Optional[Dict[str, Any]] = None
     id: Optional[int] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
@@ -25,6 +27,12 @@ class Project:
     def __post_init__(self):
         if not self.name or not self.name.strip():
             raise ValueError("Project name is required and cannot be empty")
+        if self.calendar is not None:
+            Calendar.from_dict(self.calendar)
+
+    def get_calendar(self) -> Calendar:
+        """The calendar used to order this project's dates."""
+        return Calendar.from_dict(self.calendar)
 
     def update_description(self, description: str) -> None:
         """Update the project description."""
@@ -32,4 +40,15 @@ class Project:
 
     def is_empty(self) -> bool:
         """Check if the project has no description."""
-        return not self.description or not self.description.strip()
\ No newline at end of file
+        return not self.description or not self.description.strip()
+
+
+@dataclass
+class ProjectStats:
+    """Row counts and image storage totals for a project."""
+    project_id: int
+    article_count: int = 0
+    person_count: int = 0
+    settlement_count: int = 0
+    image_count: int = 0
+    image_bytes: int = 0
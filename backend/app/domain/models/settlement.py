@@ -5,12 +5,44 @@ Represents settlements like cities, towns, villages, etc. Built on top of the Ar
 """
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from .article import Article, ArticleContent, ArticleType
 
 
+# Population size categories as (name, exclusive upper bound); the last one is open-ended
+POPULATION_CATEGORIES: List[Tuple[str, Optional[int]]] = [
+    ("tiny", 100),
+    ("small", 1000),
+    ("medium", 5000),
+    ("large", 20000),
+    ("very_large", 100000),
+    ("massive", None),
+]
+UNKNOWN_POPULATION_CATEGORY = "unknown"
+
+
+def population_category(population: Optional[int]) -> str:
+    """Categorize a population size."""
+    if not population:
+        return UNKNOWN_POPULATION_CATEGORY
+    for name, upper in POPULATION_CATEGORIES:
+        if upper is None or population < upper:
+            return name
+    return POPULATION_CATEGORIES[-1][0]
+
+
+def population_category_ranges() -> List[Tuple[str, int, Optional[int]]]:
+    """Population categories as (name, inclusive lower bound, exclusive upper bound)."""
+    ranges = []
+    lower = 1
+    for name, upper in POPULATION_CATEGORIES:
+        ranges.append((name, lower, upper))
+        lower = upper
+    return ranges
+
+
 class SettlementType(Enum):
     """Types of settlements."""
     CITY = "city"
@@ -152,22 +184,13 @@ class Settlement:
     @property
     def population_category(self) -> str:
         """Categorize settlement by population size."""
-        if not self.settlement_data.population:
-            return "unknown"
-        
-        pop = self.settlement_data.population
-        if pop < 100:
-            return "tiny"
-        elif pop < 1000:
-            return "small"
-        elif pop < 5000:
-            return "medium"
-        elif pop < 20000:
-            return "large"
-        elif pop < 100000:
-            return "very_large"
-        else:
-            return "massive"
+        return population_category(self.settlement_data.population)
+
+    def set_coordinates(self, lat: float, lng: float) -> None:
+        """Set the settlement's map position in degrees."""
+        if not -90 <= lat <= 90 or not -180 <= lng <= 180:
+            raise ValueError("Latitude must be within [-90, 90] and longitude within [-180, 180]")
+        self.settlement_data.coordinates = {"lat": lat, "lng": lng}
 
     def add_notable_feature(self, feature: str) -> None:
         """Add a notable feature to the settlement."""
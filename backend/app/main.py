@@ -1,13 +1,25 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.core.cache import entity_cache
 from app.core.config import settings
 from app.api.api_v1.api import api_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Attach the shared cache tier (if configured) and listen for invalidations from other workers
+    entity_cache.start()
+    yield
+    entity_cache.stop()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description="MythosEngine API - An AI-powered world-building platform",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # Set up CORS
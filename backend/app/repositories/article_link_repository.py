@@ -0,0 +1,211 @@
+"""
+Article link repository for the wiki link graph between articles.
+
+Links are written ``[[Title]]``, ``[[id:42]]`` or with a label, ``[[Title|label]]``,
+anywhere in an article's main, sidebar, footer or summary text. They are parsed
+whenever an article is written and diffed against the stored rows, so only links
+that were added or removed are touched; bulk paths rebuild a whole project with
+the equivalent SQL.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Integer, String, any_, bindparam, delete, func, insert, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+from app.db.models.article import ArticleDB
+from app.db.models.article_link import ArticleLinkDB
+from .base_repository import BaseRepository
+
+# The same pattern is used by PostgreSQL below: the target runs up to an optional
+# "|label", and neither may contain brackets
+LINK_PATTERN = r"\[\[([^][|]+)(?:\|[^][]*)?\]\]"
+LINKED_FIELDS = ("main_content", "sidebar_content", "footer_content", "summary")
+
+_LINK = re.compile(LINK_PATTERN)
+_ID_LINK = re.compile(r"^id:\s*([0-9]{1,9})$")
+_WHITESPACE = " \t\n\r"
+
+
+def link_key(target: str) -> str:
+    """The key a link target is stored under: ``id:<n>`` for ID links, else the lower-cased title."""
+    key = target.lower()
+    match = _ID_LINK.match(key)
+    return f"id:{int(match.group(1))}" if match else key
+
+
+def extract_links(content: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Map the key of every link in stored article content to its target as first written."""
+    if not content:
+        return {}
+    body = "\n".join(str(content[field]) for field in LINKED_FIELDS if content.get(field) is not None)
+    links: Dict[str, str] = {}
+    for match in _LINK.finditer(body):
+        target = match.group(1).strip(_WHITESPACE)
+        if target:
+            links.setdefault(link_key(target), target)
+    return links
+
+
+# Rebuilds a project's links from article content. Title links resolve to the oldest
+# article with that (case-insensitive) title, ID links to the article if it is in the project.
+_REBUILD_LINKS_SQL = text(r"""
+    WITH found AS (
+        SELECT DISTINCT ON (a.id, k.target_key) a.id AS source_article_id, k.target_key, k.target_id, t.target_title
+        FROM articles a
+        CROSS JOIN LATERAL regexp_matches(
+            concat_ws(E'\n', a.content->>'main_content', a.content->>'sidebar_content',
+                      a.content->>'footer_content', a.content->>'summary'),
+            :pattern, 'g'
+        ) WITH ORDINALITY AS m(groups, position)
+        CROSS JOIN LATERAL (SELECT btrim(m.groups[1], E' \t\n\r') AS target_title) t
+        CROSS JOIN LATERAL (
+            SELECT substring(lower(t.target_title) FROM '^id:\s*([0-9]{1,9})$')::integer AS target_id
+        ) i
+        CROSS JOIN LATERAL (
+            SELECT coalesce('id:' || i.target_id, lower(t.target_title)) AS target_key, i.target_id
+        ) k
+        WHERE a.project_id = :project_id
+          AND t.target_title <> ''
+        ORDER BY a.id, k.target_key, m.position
+    ),
+    titles AS (
+        SELECT DISTINCT ON (lower(title)) lower(title) AS target_key, id
+        FROM articles
+        WHERE project_id = :project_id
+        ORDER BY lower(title), id
+    )
+    INSERT INTO article_links (source_article_id, target_key, project_id, target_article_id, target_title)
+    SELECT f.source_article_id, f.target_key, :project_id, coalesce(b.id, t.id), f.target_title
+    FROM found f
+    LEFT JOIN articles b ON b.id = f.target_id AND b.project_id = :project_id
+    LEFT JOIN titles t ON t.target_key = f.target_key AND f.target_id IS NULL
+""")
+
+# Re-points the title links that an article is, or should be, the target of after it is
+# created, renamed or deleted: each goes to the oldest article with its title, the article
+# itself only counting under :title (NULL when it is being deleted). ID links never move.
+_RESOLVE_TARGETS_SQL = text(r"""
+    UPDATE article_links l
+    SET target_article_id = least(
+        (SELECT min(a.id) FROM articles a
+         WHERE a.project_id = l.project_id AND lower(a.title) = l.target_key AND a.id <> :article_id),
+        CASE WHEN l.target_key = lower(:title) THEN :article_id END
+    )
+    WHERE l.project_id = :project_id
+      AND (l.target_article_id = :article_id OR l.target_key = lower(:title))
+      AND l.target_key !~ '^id:[0-9]+$'
+""")
+
+
+class ArticleLinkRepository(BaseRepository[ArticleLinkDB, ArticleLinkDB]):
+    """Repository for article links. Writes here do not commit."""
+
+    def __init__(self, db: Session):
+        super().__init__(db, ArticleLinkDB)
+
+    def resolve_keys(self, project_id: int, keys: Sequence[str]) -> Dict[str, int]:
+        """Map link keys to the article they point at in a project."""
+        ids = {int(key[3:]) for key in keys if _ID_LINK.match(key)}
+        titles = [key for key in keys if not _ID_LINK.match(key)]
+        resolved: Dict[str, int] = {}
+        if ids:
+            rows = self.db.execute(
+                select(ArticleDB.id).where(
+                    ArticleDB.project_id == project_id,
+                    ArticleDB.id == any_(bindparam("link_ids", list(ids), type_=ARRAY(Integer))),
+                )
+            ).scalars()
+            resolved.update((f"id:{article_id}", article_id) for article_id in rows)
+        if titles:
+            rows = self.db.execute(
+                select(func.lower(ArticleDB.title), func.min(ArticleDB.id))
+                .where(
+                    ArticleDB.project_id == project_id,
+                    func.lower(ArticleDB.title) == any_(bindparam("link_titles", titles, type_=ARRAY(String))),
+                )
+                .group_by(func.lower(ArticleDB.title))
+            ).all()
+            resolved.update(rows)
+        return resolved
+
+    def sync_article(self, article_id: int, project_id: int, title: str, content: Optional[Dict[str, Any]]) -> None:
+        """
+        Bring an article's outgoing links in line with its content and re-point the
+        links that name it under its current title. The article row must already be flushed.
+        """
+        links = extract_links(content)
+        stored = dict(
+            self.db.execute(
+                select(ArticleLinkDB.target_key, ArticleLinkDB.target_title)
+                .where(ArticleLinkDB.source_article_id == article_id)
+            ).all()
+        )
+
+        removed = [key for key in stored if key not in links]
+        if removed:
+            self.db.execute(
+                delete(ArticleLinkDB).where(
+                    ArticleLinkDB.source_article_id == article_id,
+                    ArticleLinkDB.target_key == any_(bindparam("removed_keys", removed, type_=ARRAY(String))),
+                )
+            )
+        added = [key for key in links if key not in stored]
+        if added:
+            resolved = self.resolve_keys(project_id, added)
+            self.db.execute(
+                insert(ArticleLinkDB),
+                [
+                    {
+                        "source_article_id": article_id,
+                        "target_key": key,
+                        "project_id": project_id,
+                        "target_article_id": resolved.get(key),
+                        "target_title": links[key],
+                    }
+                    for key in added
+                ],
+            )
+        for key, target in links.items():
+            if key in stored and stored[key] != target:
+                self.db.execute(
+                    update(ArticleLinkDB)
+                    .where(ArticleLinkDB.source_article_id == article_id, ArticleLinkDB.target_key == key)
+                    .values(target_title=target)
+                )
+
+        self.resolve_targets(article_id, project_id, title)
+
+    def resolve_targets(self, article_id: int, project_id: int, title: Optional[str]) -> None:
+        """
+        Re-resolve the title links pointing at an article or naming ``title``. Pass
+        ``None`` before deleting the article so its links move to the next article
+        with that title.
+        """
+        self.db.execute(
+            _RESOLVE_TARGETS_SQL, {"article_id": article_id, "project_id": project_id, "title": title}
+        )
+
+    def rebuild_project(self, project_id: int) -> None:
+        """Rebuild every link in a project from the stored article content."""
+        self.db.execute(delete(ArticleLinkDB).where(ArticleLinkDB.project_id == project_id))
+        self.db.execute(_REBUILD_LINKS_SQL, {"project_id": project_id, "pattern": LINK_PATTERN})
+
+    def get_backlinks(self, article_id: int, skip: int = 0, limit: int = 100) -> List[Tuple[int, str, str]]:
+        """Get (id, title, article_type) of the articles linking to an article, in ID order."""
+        return self.db.execute(
+            select(ArticleDB.id, ArticleDB.title, ArticleDB.article_type)
+            .join(ArticleLinkDB, ArticleLinkDB.source_article_id == ArticleDB.id)
+            .where(ArticleLinkDB.target_article_id == article_id)
+            .order_by(ArticleLinkDB.source_article_id)
+            .offset(skip)
+            .limit(limit)
+        ).all()
+
+    def to_domain(self, db_obj: ArticleLinkDB) -> ArticleLinkDB:
+        """Convert database model to domain model (identity)."""
+        return db_obj
+
+    def from_domain(self, domain_obj: ArticleLinkDB) -> ArticleLinkDB:
+        """Convert domain model to database model (identity)."""
+        return domain_obj
@@ -2,16 +2,77 @@
 Article repository for database operations.
 """
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Sequence, Tuple
+from sqlalchemy import Integer, func, select, text
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql import ColumnElement
 from app.db.models.article import ArticleDB
+from app.db.models.article_tag import ArticleTagDB, ProjectTagCountDB
+from app.db.models.image import ImageDB
+from app.db.models.project_stats import ProjectStatsDB
 from app.domain.models.article import Article, ArticleContent, ArticleType
+from .article_link_repository import ArticleLinkRepository
 from .base_repository import BaseRepository
 
 
+def _word_count(text_expr):
+    """SQL equivalent of len(text.split()) that treats NULL and blank text as zero words."""
+    trimmed = func.regexp_replace(text_expr, r"^\s+|\s+$", "", "g")
+    words = func.regexp_split_to_array(func.nullif(trimmed, ""), r"\s+")
+    return func.coalesce(func.array_length(words, 1), 0)
+
+
+# Columns and JSONB content keys that list endpoints may project. Content keys are
+# extracted with ->> / -> so the rest of the content document never leaves Postgres.
+PROJECTABLE_COLUMNS = {
+    "id": ArticleDB.id,
+    "title": ArticleDB.title,
+    "article_type": ArticleDB.article_type,
+    "project_id": ArticleDB.project_id,
+    "header_image_id": ArticleDB.header_image_id,
+    "spotify_url": ArticleDB.spotify_url,
+    "created_at": ArticleDB.created_at,
+    "updated_at": ArticleDB.updated_at,
+    "summary": ArticleDB.content["summary"].astext,
+    "main_content": ArticleDB.content["main_content"].astext,
+    "sidebar_content": ArticleDB.content["sidebar_content"].astext,
+    "footer_content": ArticleDB.content["footer_content"].astext,
+    "tags": ArticleDB.content["tags"],
+    "metadata": ArticleDB.content["metadata"],
+    "word_count": (
+        _word_count(ArticleDB.content["main_content"].astext)
+        + _word_count(ArticleDB.content["sidebar_content"].astext)
+        + _word_count(ArticleDB.content["footer_content"].astext)
+        + _word_count(ArticleDB.content["summary"].astext)
+    ).cast(Integer),
+}
+
+
+# btrim() in article_tag_keys() trims the same characters
+_TAG_WHITESPACE = " \t\n\r"
+
+
+def normalize_tag(tag: str) -> str:
+    """The key a tag is stored under in article_tags (matches article_tag_keys() in the database)."""
+    return tag.strip(_TAG_WHITESPACE).lower()
+
+
+def tag_filter(tags: Sequence[str], match_all: bool = True, project_id: Optional[int] = None) -> ColumnElement:
+    """Filter for articles carrying every (or, unless ``match_all``, any) one of ``tags``."""
+    keys = sorted({normalize_tag(tag) for tag in tags})
+    matches = select(ArticleTagDB.article_id).where(ArticleTagDB.tag.in_(keys))
+    if project_id:
+        matches = matches.where(ArticleTagDB.project_id == project_id)
+    if match_all and len(keys) > 1:
+        matches = matches.group_by(ArticleTagDB.article_id).having(func.count() == len(keys))
+    return ArticleDB.id.in_(matches)
+
+
 class ArticleRepository(BaseRepository[ArticleDB, Article]):
     """Repository for article database operations."""
 
+    cache_kind = "article"
+
     def __init__(self, db: Session):
         super().__init__(db, ArticleDB)
 
@@ -54,17 +115,188 @@ class ArticleRepository(BaseRepository[ArticleDB, Article]):
             .first()
         )
 
-    def get_by_project_with_header_images(self, project_id: int, skip: int = 0, limit: int = 100) -> List[ArticleDB]:
-        """Get articles by project ID with header images loaded."""
+    def get_typed(self, article_id: int) -> Optional[ArticleDB]:
+        """
+        Get an article with its person or settlement row and header image.
+
+        Everything is fetched in one statement via LEFT OUTER JOINs; at most one
+        of ``person``/``settlement`` is populated.
+        """
         return (
+            self.db.query(ArticleDB)
+            .options(
+                joinedload(ArticleDB.person),
+                joinedload(ArticleDB.settlement),
+                joinedload(ArticleDB.header_image),
+            )
+            .filter(ArticleDB.id == article_id)
+            .first()
+        )
+
+    def get_all_with_header_images(
+        self, skip: int = 0, limit: int = 100, tags: Optional[Sequence[str]] = None, match_all: bool = True
+    ) -> List[ArticleDB]:
+        """Get all articles with header images loaded, optionally only those with the given tags."""
+        query = self.db.query(ArticleDB).options(joinedload(ArticleDB.header_image))
+        if tags:
+            query = query.filter(tag_filter(tags, match_all))
+        return (
+            query
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def get_by_ids_with_header_images(self, article_ids: List[int]) -> List[ArticleDB]:
+        """Get articles by a list of IDs with header images loaded (in no particular order)."""
+        if not article_ids:
+            return []
+        return (
+            self.db.query(ArticleDB)
+            .options(joinedload(ArticleDB.header_image))
+            .filter(self._id_in(ArticleDB.id, article_ids))
+            .all()
+        )
+
+    def get_by_project_with_header_images(
+        self,
+        project_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        tags: Optional[Sequence[str]] = None,
+        match_all: bool = True,
+    ) -> List[ArticleDB]:
+        """Get articles by project ID with header images loaded, optionally only those with the given tags."""
+        query = (
             self.db.query(ArticleDB)
             .options(joinedload(ArticleDB.header_image))
             .filter(ArticleDB.project_id == project_id)
+        )
+        if tags:
+            query = query.filter(tag_filter(tags, match_all, project_id))
+        return (
+            query
             .offset(skip)
             .limit(limit)
             .all()
         )
 
+    def get_projection(
+        self,
+        fields: Sequence[str],
+        project_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+        newest_first: bool = False,
+        tags: Optional[Sequence[str]] = None,
+        match_all: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Get only the given PROJECTABLE_COLUMNS for articles, optionally filtered by project and tags."""
+        statement = select(*(PROJECTABLE_COLUMNS[field].label(field) for field in fields))
+        if project_id:
+            statement = statement.where(ArticleDB.project_id == project_id)
+        if tags:
+            statement = statement.where(tag_filter(tags, match_all, project_id))
+        if newest_first:
+            statement = statement.order_by(ArticleDB.updated_at.desc(), ArticleDB.id.desc())
+        statement = statement.offset(skip).limit(limit)
+        return [dict(row) for row in self.db.execute(statement).mappings()]
+
+    def count_by_type(self, project_id: int) -> Dict[str, int]:
+        """Count a project's articles per article type."""
+        rows = (
+            self.db.query(ArticleDB.article_type, func.count(ArticleDB.id))
+            .filter(ArticleDB.project_id == project_id)
+            .group_by(ArticleDB.article_type)
+            .all()
+        )
+        return dict(rows)
+
+    def get_tag_counts(self, project_id: int, limit: int = 100) -> List[Tuple[str, int]]:
+        """Get a project's most used tags with their article counts, from the maintained counters."""
+        rows = (
+            self.db.query(ProjectTagCountDB.tag, ProjectTagCountDB.article_count)
+            .filter(ProjectTagCountDB.project_id == project_id)
+            .order_by(ProjectTagCountDB.article_count.desc(), ProjectTagCountDB.tag)
+            .limit(limit)
+            .all()
+        )
+        return [tuple(row) for row in rows]
+
+    def get_change_version(self, project_id: int) -> Tuple[int, int]:
+        """
+        Get (article count, article version) for a project from its stats row. Every
+        transaction writing the project's articles takes the next version, in commit
+        order, and stamps it on the rows it writes, so once a version is seen every
+        row written at or below it is visible too.
+        """
+        row = self.db.execute(
+            select(ProjectStatsDB.article_count, ProjectStatsDB.article_version)
+            .where(ProjectStatsDB.project_id == project_id)
+        ).first()
+        return tuple(row) if row else (0, 0)
+
+    def get_titles(self, project_id: int, changed_after: Optional[int] = None) -> List[Tuple[int, str, str]]:
+        """Get (id, title, article_type) for a project's articles, optionally only those written after a version."""
+        statement = select(ArticleDB.id, ArticleDB.title, ArticleDB.article_type).where(
+            ArticleDB.project_id == project_id
+        )
+        if changed_after is not None:
+            statement = statement.where(ArticleDB.change_version > changed_after)
+        return [tuple(row) for row in self.db.execute(statement)]
+
+    def get_texts(
+        self, project_id: int, changed_after: Optional[int] = None
+    ) -> List[Tuple[int, str, Optional[Dict[str, Any]]]]:
+        """Get (id, title, content) for a project's articles, optionally only those written after a version."""
+        statement = select(ArticleDB.id, ArticleDB.title, ArticleDB.content).where(ArticleDB.project_id == project_id)
+        if changed_after is not None:
+            statement = statement.where(ArticleDB.change_version > changed_after)
+        return [tuple(row) for row in self.db.execute(statement)]
+
+    def get_titles_by_prefix(self, project_id: int, prefix: str, limit: int = 10) -> List[Tuple[int, str, str]]:
+        """
+        Get (id, title, article_type) for articles whose title starts with a prefix,
+        case-insensitively, ordered by lower-cased title. The ``USING ~<~`` ordering
+        matches the text_pattern_ops title index, so no sort step is needed.
+        """
+        lower_title = func.lower(ArticleDB.title)
+        rows = self.db.execute(
+            select(ArticleDB.id, ArticleDB.title, ArticleDB.article_type)
+            .where(ArticleDB.project_id == project_id, lower_title.startswith(prefix.lower(), autoescape=True))
+            .order_by(text("lower(articles.title) USING ~<~"), ArticleDB.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in rows]
+
+    def get_version(self, article_id: int) -> Optional[Tuple[Any, ...]]:
+        """Get (id, updated_at, header image updated_at) for an article without loading it."""
+        row = (
+            self.db.query(ArticleDB.id, ArticleDB.updated_at, ImageDB.updated_at)
+            .outerjoin(ImageDB, ImageDB.id == ArticleDB.header_image_id)
+            .filter(ArticleDB.id == article_id)
+            .first()
+        )
+        return tuple(row) if row else None
+
+    def get_collection_version(self, project_id: Optional[int] = None) -> Tuple[Any, ...]:
+        """
+        Get (count, max(updated_at), header image count, max header image updated_at)
+        for all articles or those of a project.
+        """
+        query = (
+            self.db.query(
+                func.count(ArticleDB.id),
+                func.max(ArticleDB.updated_at),
+                func.count(ImageDB.id),
+                func.max(ImageDB.updated_at),
+            )
+            .outerjoin(ImageDB, ImageDB.id == ArticleDB.header_image_id)
+        )
+        if project_id:
+            query = query.filter(ArticleDB.project_id == project_id)
+        return tuple(query.one())
+
     def to_domain(self, db_obj: ArticleDB) -> Article:
         """Convert database model to domain model."""
         content = ArticleContent()
@@ -111,6 +343,9 @@ class ArticleRepository(BaseRepository[ArticleDB, Article]):
     def create_from_domain(self, domain_obj: Article) -> Article:
         """Create a new article from domain model."""
         db_obj = self.from_domain(domain_obj)
+        self.db.add(db_obj)
+        self.db.flush()  # Links need the article ID
+        ArticleLinkRepository(self.db).sync_article(db_obj.id, db_obj.project_id, db_obj.title, db_obj.content)
         created_db_obj = self.create(db_obj)
         return self.to_domain(created_db_obj)
 
@@ -138,5 +373,16 @@ class ArticleRepository(BaseRepository[ArticleDB, Article]):
                 "metadata": domain_obj.content.metadata
             }
 
+        ArticleLinkRepository(self.db).sync_article(db_obj.id, db_obj.project_id, db_obj.title, db_obj.content)
         updated_db_obj = self.update(db_obj)
-        return self.to_domain(updated_db_obj)
\ No newline at end of file
+        return self.to_domain(updated_db_obj)
+
+    def delete(self, id: int) -> Optional[ArticleDB]:
+        """Delete an article, handing the title links that pointed at it to the next article with its title."""
+        db_obj = self.get_by_id(id)
+        if db_obj:
+            ArticleLinkRepository(self.db).resolve_targets(db_obj.id, db_obj.project_id, None)
+            self.db.delete(db_obj)
+            self.db.commit()
+            self.invalidate_cache(id)
+        return db_obj
\ No newline at end of file
@@ -3,8 +3,11 @@ Base repository class with common database operations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, List
+from typing import Any, Generic, TypeVar, Optional, List, Tuple
+from sqlalchemy import Integer, any_, bindparam, func
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
+from app.core.cache import payload_cache
 from app.db.database import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -14,6 +17,9 @@ DomainType = TypeVar("DomainType")
 class BaseRepository(ABC, Generic[ModelType, DomainType]):
     """Abstract base repository class."""
 
+    # Kind under which serialized payloads of this model are cached, if any
+    cache_kind: Optional[str] = None
+
     def __init__(self, db: Session, model_class: type[ModelType]):
         self.db = db
         self.model_class = model_class
@@ -22,6 +28,16 @@ class BaseRepository(ABC, Generic[ModelType, DomainType]):
         """Get a model by ID."""
         return self.db.query(self.model_class).filter(self.model_class.id == id).first()
 
+    def _id_in(self, column, ids: List[int]):
+        """``column = ANY(:ids)`` with the IDs sent as a single array parameter."""
+        return column == any_(bindparam("ids", list(ids), type_=ARRAY(Integer)))
+
+    def get_by_ids(self, ids: List[int]) -> List[ModelType]:
+        """Get models by a list of IDs in one query (in no particular order)."""
+        if not ids:
+            return []
+        return self.db.query(self.model_class).filter(self._id_in(self.model_class.id, ids)).all()
+
     def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
         """Get all models with pagination."""
         return self.db.query(self.model_class).offset(skip).limit(limit).all()
@@ -31,12 +47,14 @@ class BaseRepository(ABC, Generic[ModelType, DomainType]):
         self.db.add(db_obj)
         self.db.commit()
         self.db.refresh(db_obj)
+        self.invalidate_cache(db_obj.id)
         return db_obj
 
     def update(self, db_obj: ModelType) -> ModelType:
         """Update an existing model."""
         self.db.commit()
         self.db.refresh(db_obj)
+        self.invalidate_cache(db_obj.id)
         return db_obj
 
     def delete(self, id: int) -> Optional[ModelType]:
@@ -45,8 +63,31 @@ class BaseRepository(ABC, Generic[ModelType, DomainType]):
         if db_obj:
             self.db.delete(db_obj)
             self.db.commit()
+            self.invalidate_cache(id)
         return db_obj
 
+    def invalidate_cache(self, id: int) -> None:
+        """Drop cached payloads for a model after it has been written."""
+        if self.cache_kind is not None:
+            payload_cache.invalidate(self.cache_kind, id)
+
+    def get_version(self, id: int) -> Optional[Tuple[Any, ...]]:
+        """Get (id, updated_at) for a model without loading it, for models with an updated_at column."""
+        row = (
+            self.db.query(self.model_class.id, self.model_class.updated_at)
+            .filter(self.model_class.id == id)
+            .first()
+        )
+        return tuple(row) if row else None
+
+    def get_collection_version(self, *criteria) -> Tuple[Any, ...]:
+        """Get (count, max(updated_at)) for the models matching the given filter criteria."""
+        return tuple(
+            self.db.query(func.count(self.model_class.id), func.max(self.model_class.updated_at))
+            .filter(*criteria)
+            .one()
+        )
+
     @abstractmethod
     def to_domain(self, db_obj: ModelType) -> DomainType:
         """Convert database model to domain model."""
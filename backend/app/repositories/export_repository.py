@@ -0,0 +1,76 @@
+"""
+Export repository for streaming whole projects out of the database.
+"""
+
+from typing import Any, Dict, Iterator, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.db.models.article import ArticleDB
+from app.db.models.image import ImageDB
+from app.db.models.location import LocationDB
+from app.db.models.person import PersonDB
+from app.db.models.project import ProjectDB
+from app.db.models.settlement import SettlementDB
+
+EXPORT_BATCH_SIZE = 1000
+
+
+class ProjectExportRepository:
+    """
+    Streams raw rows for a project using server-side cursors.
+
+    Rows are yielded as plain column mappings rather than ORM objects so memory
+    stays flat regardless of project size.
+    """
+
+    def __init__(self, db: Session, batch_size: int = EXPORT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+
+    def _stream(self, statement) -> Iterator[Dict[str, Any]]:
+        result = self.db.execute(statement.execution_options(yield_per=self.batch_size))
+        for row in result.mappings():
+            yield dict(row)
+
+    def get_project_row(self, project_id: int) -> Optional[Dict[str, Any]]:
+        """Get the project row as a column mapping."""
+        row = self.db.execute(
+            select(ProjectDB.__table__).where(ProjectDB.id == project_id)
+        ).mappings().first()
+        return dict(row) if row else None
+
+    def stream_images(self, project_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream image metadata rows for a project."""
+        return self._stream(
+            select(ImageDB.__table__).where(ImageDB.project_id == project_id).order_by(ImageDB.id)
+        )
+
+    def stream_articles(self, project_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream article rows for a project."""
+        return self._stream(
+            select(ArticleDB.__table__).where(ArticleDB.project_id == project_id).order_by(ArticleDB.id)
+        )
+
+    def stream_persons(self, project_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream person rows whose articles belong to a project."""
+        return self._stream(
+            select(PersonDB.__table__)
+            .join(ArticleDB, ArticleDB.id == PersonDB.article_id)
+            .where(ArticleDB.project_id == project_id)
+            .order_by(PersonDB.id)
+        )
+
+    def stream_settlements(self, project_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream settlement rows whose articles belong to a project."""
+        return self._stream(
+            select(SettlementDB.__table__)
+            .join(ArticleDB, ArticleDB.id == SettlementDB.article_id)
+            .where(ArticleDB.project_id == project_id)
+            .order_by(SettlementDB.id)
+        )
+
+    def stream_locations(self, project_id: int) -> Iterator[Dict[str, Any]]:
+        """Stream location hierarchy rows for a project."""
+        return self._stream(
+            select(LocationDB.__table__).where(LocationDB.project_id == project_id).order_by(LocationDB.id)
+        )
@@ -0,0 +1,126 @@
+"""
+Query helpers for faceted search.
+
+Facet counts for several columns are computed in a single pass with
+GROUPING SETS. Each facet is counted with every selected filter except its
+own, so a selected value still shows the alternatives that could replace it.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import String, and_, case, cast, func, literal, literal_column, select, true, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy.sql import ColumnElement, FromClause
+
+from app.db.models.article import ArticleDB
+
+FacetCounts = Dict[str, List[Dict[str, Any]]]
+
+
+def facet_filters(columns: Dict[str, ColumnElement], selected: Dict[str, Sequence[Any]]) -> Dict[str, ColumnElement]:
+    """Build an ``IN`` clause for every facet that has selected values."""
+    return {name: columns[name].in_(values) for name, values in selected.items() if values}
+
+
+def facet_counts_subquery(
+    columns: Dict[str, ColumnElement],
+    filters: Dict[str, ColumnElement],
+    scope: Sequence[ColumnElement],
+    from_: FromClause,
+):
+    """
+    Scalar subquery yielding ``{"facet": [{"value": ..., "count": ...}, ...]}`` as JSON.
+
+    ``scope`` applies to every facet (e.g. project and text search); ``filters``
+    are the per-facet selections from ``facet_filters``. Values are sorted by
+    count, NULL values are omitted and facets without values are left out.
+    """
+    is_grouped = {name: func.grouping(column) == 0 for name, column in columns.items()}
+    counts = {}
+    for name in columns:
+        others = [clause for facet, clause in filters.items() if facet != name]
+        counts[name] = func.count().filter(and_(*others)) if others else func.count()
+
+    rows = (
+        select(
+            case(*((is_grouped[name], literal(name)) for name in columns)).label("facet"),
+            case(*((is_grouped[name], cast(column, String)) for name, column in columns.items())).label("value"),
+            case(*((is_grouped[name], counts[name]) for name in columns)).label("count"),
+        )
+        .select_from(from_)
+        .where(*scope)
+        .group_by(func.grouping_sets(*(tuple_(column) for column in columns.values())))
+        .subquery("facet_rows")
+    )
+    per_facet = (
+        select(
+            rows.c.facet,
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object("value", rows.c.value, "count", rows.c["count"]),
+                    rows.c["count"].desc(),
+                    rows.c.value,
+                )
+            ).label("facet_values"),
+        )
+        .where(rows.c.value.isnot(None), rows.c["count"] > 0)
+        .group_by(rows.c.facet)
+        .subquery("facet_values")
+    )
+    return select(
+        func.coalesce(
+            func.json_object_agg(per_facet.c.facet, per_facet.c.facet_values),
+            literal_column("'{}'::json"),
+        )
+    ).scalar_subquery()
+
+
+def faceted_article_search(
+    db: Session,
+    model: Type[Any],
+    columns: Dict[str, ColumnElement],
+    selected: Dict[str, Sequence[Any]],
+    project_id: int,
+    name: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> Tuple[List[Any], int, FacetCounts]:
+    """
+    Search an article subtype (a model with ``article_id`` and ``article``) in a project.
+
+    Returns a page ordered by article title with articles loaded, the total
+    match count and per-facet value counts, all from one statement.
+    """
+    from_ = model.__table__.join(ArticleDB.__table__, ArticleDB.id == model.article_id)
+    scope = [ArticleDB.project_id == project_id]
+    if name:
+        scope.append(ArticleDB.title.ilike(f"%{name}%"))
+    filters = facet_filters(columns, selected)
+
+    summary = select(
+        facet_counts_subquery(columns, filters, scope, from_).label("facets"),
+        select(func.count()).select_from(from_).where(*scope, *filters.values()).scalar_subquery().label("total"),
+    ).subquery("summary")
+    page = (
+        select(model, ArticleDB.title.label("sort_title"))
+        .join(ArticleDB, ArticleDB.id == model.article_id)
+        .where(*scope, *filters.values())
+        .order_by(ArticleDB.title, model.id)
+        .offset(skip)
+        .limit(limit)
+        .subquery("page")
+    )
+    entity = aliased(model, page)
+
+    # The page is outer-joined to the one-row summary so counts come back even for an empty page
+    rows = db.execute(
+        select(entity, summary.c.facets, summary.c.total)
+        .select_from(summary)
+        .outerjoin(page, true())
+        .options(joinedload(entity.article))
+        .order_by(page.c.sort_title, page.c.id)
+    ).all()
+
+    items = [row[0] for row in rows if row[0] is not None]
+    return items, rows[0].total, rows[0].facets
@@ -2,11 +2,12 @@
 Image repository for database operations.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func
 from app.repositories.base_repository import BaseRepository
 from app.db.models.image import ImageDB
+from app.db.models.project_stats import ProjectStatsDB
 from app.schemas.image import ImageCreate, ImageUpdate
 
 
@@ -33,6 +34,25 @@ class ImageRepository(BaseRepository[ImageDB, ImageDB]):
         """Get image by filename."""
         return self.db.query(ImageDB).filter(ImageDB.filename == filename).first()
 
+    def get_file_refs_by_project_id(self, project_id: int) -> List[Tuple[str, str, bool]]:
+        """Get (file path, filename, is S3 stored) for every image in a project."""
+        return (
+            self.db.query(ImageDB.file_path, ImageDB.filename, ImageDB.is_s3_stored)
+            .filter(ImageDB.project_id == project_id)
+            .all()
+        )
+
+    def get_referenced_file_paths(self, file_paths: List[str]) -> set[str]:
+        """Return which of the given file paths are still referenced by an image row."""
+        if not file_paths:
+            return set()
+        rows = self.db.query(ImageDB.file_path).filter(ImageDB.file_path.in_(file_paths)).distinct().all()
+        return {row.file_path for row in rows}
+
+    def count_by_file_path(self, file_path: str) -> int:
+        """Count image rows referencing a stored file (cloned projects share files)."""
+        return self.db.query(ImageDB).filter(ImageDB.file_path == file_path).count()
+
     def count_by_project_id(self, project_id: int) -> int:
         """Count total images for a project."""
         return self.db.query(ImageDB).filter(ImageDB.project_id == project_id).count()
@@ -46,6 +66,44 @@ class ImageRepository(BaseRepository[ImageDB, ImageDB]):
         )
         return result or 0
 
+    def get_project_totals(self, project_id: int) -> Tuple[int, int]:
+        """Get (image count, total bytes) for a project from its maintained stats row."""
+        row = (
+            self.db.query(ProjectStatsDB.image_count, ProjectStatsDB.image_bytes)
+            .filter(ProjectStatsDB.project_id == project_id)
+            .first()
+        )
+        return (row.image_count, row.image_bytes) if row else (0, 0)
+
+    def get_hash_signature_by_project_id(self, project_id: int) -> Tuple[int, int]:
+        """Get (image count, highest image ID) for a project, used to detect stale hash indexes."""
+        count, max_id = (
+            self.db.query(func.count(ImageDB.id), func.max(ImageDB.id))
+            .filter(ImageDB.project_id == project_id)
+            .one()
+        )
+        return count or 0, max_id or 0
+
+    def get_hashes_by_project_id(self, project_id: int) -> List[Tuple[int, int]]:
+        """Get (image ID, perceptual hash) pairs for all hashed images in a project."""
+        return (
+            self.db.query(ImageDB.id, ImageDB.perceptual_hash)
+            .filter(ImageDB.project_id == project_id, ImageDB.perceptual_hash.isnot(None))
+            .all()
+        )
+
+    def get_unhashed_local_by_project_id(self, project_id: int) -> List[ImageDB]:
+        """Get locally stored images in a project that have no perceptual hash yet."""
+        return (
+            self.db.query(ImageDB)
+            .filter(
+                ImageDB.project_id == project_id,
+                ImageDB.perceptual_hash.is_(None),
+                ImageDB.is_s3_stored.isnot(True),
+            )
+            .all()
+        )
+
     def delete_by_project_id(self, project_id: int) -> int:
         """Delete all images for a project. Returns count of deleted images."""
         count = self.count_by_project_id(project_id)
@@ -0,0 +1,336 @@
+"""
+Location repository for the location hierarchy and its closure table.
+
+Every node has a closure row pairing it with itself (depth 0) and one per
+ancestor, so "everything under X" is ``descendant_id`` for ``ancestor_id = X``
+and is answered from the closure primary key. Writes here flush but do not
+commit; callers commit with the rows that triggered them.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import String, cast, func, select, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+from app.db.models.article import ArticleDB
+from app.db.models.location import LocationClosureDB, LocationDB
+from app.db.models.person import PersonDB
+from app.db.models.settlement import SettlementDB
+from .base_repository import BaseRepository
+
+# Set-based linking of a project's free-text locations, in order: region nodes for
+# settlement regions, a node per settlement under its region, settlement node names
+# and links, place nodes for person locations, then person links. Names resolve
+# case-insensitively to the lowest ID, preferring settlement nodes for persons and
+# ignoring them for regions.
+_LINK_PROJECT_SQL = [
+    text("""
+        INSERT INTO locations (project_id, name, location_type)
+        SELECT DISTINCT ON (lower(btrim(s.region))) :project_id, btrim(s.region), 'region'
+        FROM settlements s
+        JOIN articles a ON a.id = s.article_id
+        WHERE a.project_id = :project_id
+          AND btrim(coalesce(s.region, '')) <> ''
+          AND NOT EXISTS (
+              SELECT 1 FROM locations l
+              WHERE l.project_id = :project_id AND l.article_id IS NULL AND lower(l.name) = lower(btrim(s.region))
+          )
+        ORDER BY lower(btrim(s.region)), btrim(s.region)
+    """),
+    text("""
+        WITH regions AS (
+            SELECT DISTINCT ON (lower(name)) lower(name) AS key, id
+            FROM locations
+            WHERE project_id = :project_id AND article_id IS NULL
+            ORDER BY lower(name), id
+        )
+        INSERT INTO locations (project_id, name, location_type, article_id, parent_id)
+        SELECT :project_id, a.title, 'settlement', a.id, r.id
+        FROM settlements s
+        JOIN articles a ON a.id = s.article_id
+        LEFT JOIN regions r ON r.key = lower(btrim(s.region))
+        WHERE a.project_id = :project_id
+          AND NOT EXISTS (SELECT 1 FROM locations l WHERE l.article_id = a.id)
+    """),
+    text("""
+        UPDATE locations l SET name = a.title
+        FROM articles a
+        WHERE a.id = l.article_id AND l.project_id = :project_id AND l.name IS DISTINCT FROM a.title
+    """),
+    text("""
+        UPDATE settlements s SET location_id = l.id
+        FROM locations l
+        WHERE l.article_id = s.article_id AND l.project_id = :project_id AND s.location_id IS DISTINCT FROM l.id
+    """),
+    text("""
+        INSERT INTO locations (project_id, name, location_type)
+        SELECT DISTINCT ON (lower(n.name)) :project_id, n.name, 'place'
+        FROM persons p
+        JOIN articles a ON a.id = p.article_id
+        CROSS JOIN LATERAL (VALUES (btrim(p.current_location)), (btrim(p.person_data->>'birthplace'))) n(name)
+        WHERE a.project_id = :project_id
+          AND coalesce(n.name, '') <> ''
+          AND NOT EXISTS (
+              SELECT 1 FROM locations l WHERE l.project_id = :project_id AND lower(l.name) = lower(n.name)
+          )
+        ORDER BY lower(n.name), n.name
+    """),
+    text("""
+        WITH names AS (
+            SELECT DISTINCT ON (lower(name)) lower(name) AS key, id
+            FROM locations
+            WHERE project_id = :project_id
+            ORDER BY lower(name), article_id IS NULL, id
+        )
+        UPDATE persons p SET location_id = x.location_id, birthplace_id = x.birthplace_id
+        FROM (
+            SELECT pe.id, current.id AS location_id, birth.id AS birthplace_id
+            FROM persons pe
+            JOIN articles a ON a.id = pe.article_id
+            LEFT JOIN names current ON current.key = lower(btrim(pe.current_location))
+            LEFT JOIN names birth ON birth.key = lower(btrim(pe.person_data->>'birthplace'))
+            WHERE a.project_id = :project_id
+        ) x
+        WHERE x.id = p.id
+          AND (p.location_id IS DISTINCT FROM x.location_id OR p.birthplace_id IS DISTINCT FROM x.birthplace_id)
+    """),
+]
+
+# Recompute a project's closure rows from parent pointers. The depth cap stops a
+# cyclic parent chain (only possible in hand-edited imports) from recursing forever;
+# it then fails on the closure primary key instead.
+_REBUILD_CLOSURE_SQL = [
+    text("""
+        DELETE FROM location_closure c
+        USING locations l
+        WHERE l.id = c.descendant_id AND l.project_id = :project_id
+    """),
+    text("""
+        WITH RECURSIVE tree(ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM locations WHERE project_id = :project_id
+            UNION ALL
+            SELECT tree.ancestor_id, l.id, tree.depth + 1
+            FROM tree
+            JOIN locations l ON l.parent_id = tree.descendant_id
+            WHERE tree.depth < 1000
+        )
+        INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree
+    """),
+]
+
+
+class LocationRepository(BaseRepository[LocationDB, LocationDB]):
+    """Repository for location hierarchy nodes and subtree queries."""
+
+    def __init__(self, db: Session):
+        super().__init__(db, LocationDB)
+
+    def get_by_project(self, project_id: int) -> List[Tuple[LocationDB, int]]:
+        """Get a project's nodes with their depth, in tree order (each node after its parent, siblings by name)."""
+        ancestor = LocationDB.__table__.alias("ancestor")
+        # Each node sorts by its root-to-node chain of (name, ID) keys, so it follows its parent
+        ancestry = func.array_agg(
+            aggregate_order_by(
+                func.lower(ancestor.c.name).op("||")(func.lpad(cast(ancestor.c.id, String), 12, "0")),
+                LocationClosureDB.depth.desc(),
+            )
+        )
+        rows = self.db.execute(
+            select(LocationDB, func.max(LocationClosureDB.depth).label("depth"))
+            .join(LocationClosureDB, LocationClosureDB.descendant_id == LocationDB.id)
+            .join(ancestor, ancestor.c.id == LocationClosureDB.ancestor_id)
+            .where(LocationDB.project_id == project_id)
+            .group_by(LocationDB.id)
+            .order_by(ancestry)
+        ).all()
+        return [(location, depth) for location, depth in rows]
+
+    def get_depth(self, location_id: int) -> int:
+        """Number of ancestors above a node."""
+        return self.db.query(func.coalesce(func.max(LocationClosureDB.depth), 0)).filter(
+            LocationClosureDB.descendant_id == location_id
+        ).scalar()
+
+    def get_ancestors(self, location_id: int) -> List[LocationDB]:
+        """Get a node's ancestors from the root down, excluding the node itself."""
+        return (
+            self.db.query(LocationDB)
+            .join(LocationClosureDB, LocationClosureDB.ancestor_id == LocationDB.id)
+            .filter(LocationClosureDB.descendant_id == location_id, LocationClosureDB.depth > 0)
+            .order_by(LocationClosureDB.depth.desc())
+            .all()
+        )
+
+    def get_by_article_id(self, article_id: int) -> Optional[LocationDB]:
+        """Get a settlement's node by its article ID."""
+        return self.db.query(LocationDB).filter(LocationDB.article_id == article_id).first()
+
+    def find_by_name(self, project_id: int, name: str, include_settlements: bool = True) -> Optional[LocationDB]:
+        """
+        Find a node by case-insensitive name. Settlement nodes win ties when
+        included; otherwise the lowest ID does.
+        """
+        query = self.db.query(LocationDB).filter(
+            LocationDB.project_id == project_id, func.lower(LocationDB.name) == name.strip().lower()
+        )
+        if not include_settlements:
+            query = query.filter(LocationDB.article_id.is_(None))
+        return query.order_by(LocationDB.article_id.is_(None), LocationDB.id).first()
+
+    def resolve(
+        self, project_id: int, name: Optional[str], location_type: str = "place", include_settlements: bool = True
+    ) -> Optional[int]:
+        """Get the ID of the node a free-text location names, creating a root node if none matches."""
+        if not name or not name.strip():
+            return None
+        location = self.find_by_name(project_id, name, include_settlements)
+        if location is None:
+            location = self.add_node(project_id, name.strip(), location_type)
+        return location.id
+
+    def add_node(
+        self,
+        project_id: int,
+        name: str,
+        location_type: str,
+        parent_id: Optional[int] = None,
+        article_id: Optional[int] = None,
+    ) -> LocationDB:
+        """Insert a node and its closure rows."""
+        location = LocationDB(
+            project_id=project_id, name=name, location_type=location_type, parent_id=parent_id, article_id=article_id
+        )
+        self.db.add(location)
+        self.db.flush()
+        self.db.execute(
+            text("""
+                INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+                SELECT ancestor_id, :id, depth + 1 FROM location_closure WHERE descendant_id = :parent_id
+                UNION ALL
+                SELECT :id, :id, 0
+            """),
+            {"id": location.id, "parent_id": parent_id},
+        )
+        return location
+
+    def is_within(self, location_id: int, ancestor_id: int) -> bool:
+        """Check whether a node is ``ancestor_id`` or one of its descendants."""
+        return self.db.query(
+            self.db.query(LocationClosureDB)
+            .filter(LocationClosureDB.ancestor_id == ancestor_id, LocationClosureDB.descendant_id == location_id)
+            .exists()
+        ).scalar()
+
+    def move(self, location: LocationDB, parent_id: Optional[int]) -> None:
+        """
+        Re-parent a node with its whole subtree (None makes it a root).
+
+        Raises ValueError if the new parent is the node itself or one of its descendants.
+        """
+        if parent_id is not None and self.is_within(parent_id, location.id):
+            raise ValueError("A location cannot be moved under itself or its descendants")
+        params = {"id": location.id, "parent_id": parent_id}
+        # Detach the subtree from its old ancestors, then attach it below the new parent
+        self.db.execute(
+            text("""
+                DELETE FROM location_closure c
+                USING location_closure sub
+                WHERE sub.ancestor_id = :id
+                  AND c.descendant_id = sub.descendant_id
+                  AND c.ancestor_id NOT IN (SELECT descendant_id FROM location_closure WHERE ancestor_id = :id)
+            """),
+            params,
+        )
+        if parent_id is not None:
+            self.db.execute(
+                text("""
+                    INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+                    SELECT super.ancestor_id, sub.descendant_id, super.depth + sub.depth + 1
+                    FROM location_closure super
+                    CROSS JOIN location_closure sub
+                    WHERE super.descendant_id = :parent_id AND sub.ancestor_id = :id
+                """),
+                params,
+            )
+        location.parent_id = parent_id
+        self.db.flush()
+
+    def remove(self, location: LocationDB) -> None:
+        """Delete a node, moving its children up to its parent."""
+        for child in self.db.query(LocationDB).filter(LocationDB.parent_id == location.id).all():
+            self.move(child, location.parent_id)
+        self.db.delete(location)
+        self.db.flush()
+
+    def sync_settlement(
+        self, article_id: int, project_id: int, title: str, region: Optional[str], place_in_region: bool
+    ) -> int:
+        """
+        Ensure a settlement has a node named after it, returning the node ID.
+
+        New nodes go under the node for ``region``; existing ones only move there when
+        ``place_in_region`` is set (i.e. the region changed), so manual placement survives edits.
+        """
+        parent_id = self.resolve(project_id, region, "region", include_settlements=False)
+        location = self.get_by_article_id(article_id)
+        if location is None:
+            return self.add_node(project_id, title, "settlement", parent_id, article_id).id
+        location.name = title
+        if place_in_region and location.parent_id != parent_id:
+            self.move(location, parent_id)
+        return location.id
+
+    def rename_for_article(self, article_id: int, title: str) -> None:
+        """Keep a settlement node's name in step with its article title."""
+        self.db.query(LocationDB).filter(LocationDB.article_id == article_id).update(
+            {LocationDB.name: title}, synchronize_session=False
+        )
+
+    def _subtree(self, location_id: int):
+        return select(LocationClosureDB.descendant_id).where(LocationClosureDB.ancestor_id == location_id)
+
+    def _members(self, model, column, location_id: int, skip: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        scope = [column.in_(self._subtree(location_id))]
+        total = self.db.execute(select(func.count()).select_from(model).where(*scope)).scalar()
+        rows = self.db.execute(
+            select(
+                ArticleDB.id.label("id"),
+                ArticleDB.title.label("name"),
+                LocationDB.id.label("location_id"),
+                LocationDB.name.label("location_name"),
+            )
+            .select_from(model)
+            .join(ArticleDB, ArticleDB.id == model.article_id)
+            .join(LocationDB, LocationDB.id == column)
+            .where(*scope)
+            .order_by(ArticleDB.title, ArticleDB.id)
+            .offset(skip)
+            .limit(limit)
+        ).mappings().all()
+        return [dict(row) for row in rows], total
+
+    def get_persons_within(
+        self, location_id: int, skip: int = 0, limit: int = 100, birthplace: bool = False
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of persons located (or born, with ``birthplace``) anywhere under a node, and the total."""
+        column = PersonDB.birthplace_id if birthplace else PersonDB.location_id
+        return self._members(PersonDB, column, location_id, skip, limit)
+
+    def get_settlements_within(
+        self, location_id: int, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of settlements anywhere under a node, and the total."""
+        return self._members(SettlementDB, SettlementDB.location_id, location_id, skip, limit)
+
+    def link_project(self, project_id: int) -> None:
+        """Create and link nodes for every free-text location in a project, then rebuild its closure."""
+        for statement in _LINK_PROJECT_SQL + _REBUILD_CLOSURE_SQL:
+            self.db.execute(statement, {"project_id": project_id})
+
+    def to_domain(self, db_obj: LocationDB) -> LocationDB:
+        """Convert database model to domain model (identity)."""
+        return db_obj
+
+    def from_domain(self, domain_obj: LocationDB) -> LocationDB:
+        """Convert domain model to database model (identity)."""
+        return domain_obj
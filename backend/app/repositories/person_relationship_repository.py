@@ -0,0 +1,130 @@
+"""
+Person relationship repository for graph queries over relationship edges.
+
+Edges are directed (source lists target as a relationship) but traversals treat
+them as undirected, since either side of a relationship connects the two persons.
+All persons are identified by their article ID.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Integer, String, bindparam, or_, text, true
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+from app.db.models.article import ArticleDB
+from app.db.models.person_relationship import PersonRelationshipDB
+from .base_repository import BaseRepository
+
+# Persons reachable from :start within :max_depth hops, with their distance. UNION
+# (not UNION ALL) collapses repeated (node, depth) pairs, so cycles stop growing
+# the working table and the recursion ends at max_depth.
+_REACHABLE_SQL = text("""
+    WITH RECURSIVE walk(node, depth) AS (
+        SELECT CAST(:start AS integer), 0
+        UNION
+        SELECT step.node, walk.depth + 1
+        FROM walk
+        CROSS JOIN LATERAL (
+            SELECT r.target_article_id AS node
+            FROM person_relationships r
+            WHERE r.source_article_id = walk.node
+              AND r.target_article_id IS NOT NULL
+              AND (CAST(:types AS text[]) IS NULL OR r.relationship_type = ANY(CAST(:types AS text[])))
+            UNION ALL
+            SELECT r.source_article_id
+            FROM person_relationships r
+            WHERE r.target_article_id = walk.node
+              AND (CAST(:types AS text[]) IS NULL OR r.relationship_type = ANY(CAST(:types AS text[])))
+        ) step
+        WHERE walk.depth < :max_depth
+    )
+    SELECT node, min(depth) AS depth FROM walk GROUP BY node
+""")
+
+
+class PersonRelationshipRepository(BaseRepository[PersonRelationshipDB, PersonRelationshipDB]):
+    """Repository for person relationship edges and traversals."""
+
+    def __init__(self, db: Session):
+        super().__init__(db, PersonRelationshipDB)
+
+    @staticmethod
+    def _type_filter(types: Optional[Sequence[str]]):
+        if not types:
+            return true()
+        return PersonRelationshipDB.relationship_type.in_([type_.lower() for type_ in types])
+
+    def get_edges_for(self, article_id: int, types: Optional[Sequence[str]] = None) -> List[PersonRelationshipDB]:
+        """Get the edges a person lists and the edges that point at them."""
+        return (
+            self.db.query(PersonRelationshipDB)
+            .filter(
+                or_(
+                    PersonRelationshipDB.source_article_id == article_id,
+                    PersonRelationshipDB.target_article_id == article_id,
+                ),
+                self._type_filter(types),
+            )
+            .order_by(PersonRelationshipDB.source_article_id, PersonRelationshipDB.position)
+            .all()
+        )
+
+    def get_reachable(
+        self, article_id: int, max_depth: int, types: Optional[Sequence[str]] = None
+    ) -> Dict[int, int]:
+        """Get every person within ``max_depth`` hops, mapped to their hop distance (0 for the start)."""
+        statement = _REACHABLE_SQL.bindparams(
+            bindparam("types", [type_.lower() for type_ in types] if types else None, type_=ARRAY(String))
+        )
+        rows = self.db.execute(statement, {"start": article_id, "max_depth": max_depth}).all()
+        return dict(rows)
+
+    def get_edges_among(
+        self, article_ids: Sequence[int], types: Optional[Sequence[str]] = None
+    ) -> List[PersonRelationshipDB]:
+        """Get the resolved edges whose endpoints are both in ``article_ids``."""
+        if not article_ids:
+            return []
+        ids = bindparam("member_ids", list(article_ids), type_=ARRAY(Integer))
+        return (
+            self.db.query(PersonRelationshipDB)
+            .filter(
+                PersonRelationshipDB.source_article_id == ids.any_(),
+                PersonRelationshipDB.target_article_id == ids.any_(),
+                self._type_filter(types),
+            )
+            .order_by(PersonRelationshipDB.source_article_id, PersonRelationshipDB.position)
+            .all()
+        )
+
+    def get_adjacent(self, article_ids: Sequence[int]) -> List[Tuple[int, int]]:
+        """Get (person, neighbor) pairs for every resolved edge touching the given persons."""
+        if not article_ids:
+            return []
+        ids = bindparam("frontier_ids", list(article_ids), type_=ARRAY(Integer))
+        rows = self.db.execute(
+            text("""
+                SELECT source_article_id, target_article_id
+                FROM person_relationships
+                WHERE source_article_id = ANY(:frontier_ids) AND target_article_id IS NOT NULL
+                UNION
+                SELECT target_article_id, source_article_id
+                FROM person_relationships
+                WHERE target_article_id = ANY(:frontier_ids)
+            """).bindparams(ids)
+        ).all()
+        return [(node, neighbor) for node, neighbor in rows]
+
+    def get_names(self, article_ids: Sequence[int]) -> Dict[int, str]:
+        """Get person names (article titles) by article ID."""
+        if not article_ids:
+            return {}
+        rows = self.db.query(ArticleDB.id, ArticleDB.title).filter(self._id_in(ArticleDB.id, article_ids)).all()
+        return dict(rows)
+
+    def to_domain(self, db_obj: PersonRelationshipDB) -> PersonRelationshipDB:
+        """Convert database model to domain model (identity)."""
+        return db_obj
+
+    def from_domain(self, domain_obj: PersonRelationshipDB) -> PersonRelationshipDB:
+        """Convert domain model to database model (identity)."""
+        return domain_obj
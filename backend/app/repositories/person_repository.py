@@ -2,13 +2,82 @@
 Person repository for database operations.
 """
 
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional, List, Sequence, Tuple
+from sqlalchemy import String, any_, bindparam, delete, func, insert, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session, joinedload
 from app.db.models.person import PersonDB
+from app.db.models.person_relationship import PersonRelationshipDB
 from app.db.models.article import ArticleDB
 from app.domain.models.person import Person, PersonData, Gender, LifeStatus, ImportantDate, Relationship
 from app.domain.models.article import Article, ArticleContent, ArticleType
+from .article_link_repository import ArticleLinkRepository
 from .base_repository import BaseRepository
+from .location_repository import LocationRepository
+from .timeline_repository import TimelineRepository, person_events
+from .facets import FacetCounts, faceted_article_search
+
+# Indexed columns persons can be filtered and counted by
+PERSON_FACETS = {
+    "race": PersonDB.race,
+    "gender": PersonDB.gender,
+    "life_status": PersonDB.life_status,
+    "occupation": PersonDB.occupation,
+    "current_location": PersonDB.current_location,
+}
+
+
+# Rebuilds a project's relationship edges from the JSONB relationship lists,
+# resolving names to the oldest person with that (case-insensitive) name
+_REBUILD_RELATIONSHIPS_SQL = text("""
+    WITH names AS (
+        SELECT DISTINCT ON (a.project_id, lower(a.title)) a.project_id, lower(a.title) AS name, p.article_id
+        FROM articles a
+        JOIN persons p ON p.article_id = a.id
+        WHERE a.project_id = :project_id
+        ORDER BY a.project_id, lower(a.title), p.article_id
+    )
+    INSERT INTO person_relationships (project_id, source_article_id, target_article_id, target_name,
+                                      relationship_type, description, status, position)
+    SELECT a.project_id, p.article_id, t.article_id, r.rel->>'person_name',
+           lower(r.rel->>'relationship_type'), r.rel->>'description',
+           coalesce(r.rel->>'status', 'active'), r.ord - 1
+    FROM persons p
+    JOIN articles a ON a.id = p.article_id
+    CROSS JOIN LATERAL jsonb_array_elements(
+        CASE WHEN jsonb_typeof(p.person_data->'relationships') = 'array'
+             THEN p.person_data->'relationships' ELSE '[]'::jsonb END
+    ) WITH ORDINALITY AS r(rel, ord)
+    LEFT JOIN names t ON t.project_id = a.project_id AND t.name = lower(r.rel->>'person_name')
+    WHERE a.project_id = :project_id
+      AND coalesce(r.rel->>'person_name', '') <> ''
+      AND coalesce(r.rel->>'relationship_type', '') <> ''
+""")
+
+# Re-points the edges that resolve to a person or name it at the oldest person with that
+# name. The person's own title is taken from :name, so it need not be flushed yet.
+_RESOLVE_TARGETS_SQL = text("""
+    UPDATE person_relationships r
+    SET target_article_id = least(
+        (SELECT min(p.article_id)
+         FROM articles a
+         JOIN persons p ON p.article_id = a.id
+         WHERE a.project_id = r.project_id
+           AND lower(a.title) = lower(r.target_name)
+           AND a.id <> :article_id),
+        (SELECT p.article_id FROM persons p
+         WHERE p.article_id = :article_id AND lower(r.target_name) = lower(:name))
+    )
+    WHERE r.project_id = :project_id
+      AND (r.target_article_id = :article_id OR lower(r.target_name) = lower(:name))
+""")
+
+
+def _storable_metadata(metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Article metadata without the PersonData object Person keeps there; the persons row stores it."""
+    if not metadata:
+        return metadata
+    return {key: value for key, value in metadata.items() if key != "person_data"}
 
 
 class PersonRepository(BaseRepository[PersonDB, Person]):
@@ -57,10 +126,111 @@ class PersonRepository(BaseRepository[PersonDB, Person]):
             .all()
         )
 
+    def get_by_article_ids(self, article_ids: List[int]) -> List[PersonDB]:
+        """Get persons by their article IDs with articles loaded (in no particular order)."""
+        if not article_ids:
+            return []
+        return (
+            self.db.query(PersonDB)
+            .options(joinedload(PersonDB.article))
+            .filter(self._id_in(PersonDB.article_id, article_ids))
+            .all()
+        )
+
+    def count_by_life_status(self, project_id: int) -> Dict[str, int]:
+        """Count a project's persons per life status."""
+        rows = (
+            self.db.query(PersonDB.life_status, func.count(PersonDB.id))
+            .join(ArticleDB, ArticleDB.id == PersonDB.article_id)
+            .filter(ArticleDB.project_id == project_id)
+            .group_by(PersonDB.life_status)
+            .all()
+        )
+        return dict(rows)
+
+    def faceted_search(
+        self,
+        project_id: int,
+        selected: Dict[str, Sequence[Any]],
+        name: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Tuple[List[PersonDB], int, FacetCounts]:
+        """
+        Get a page of persons matching the selected facet values, the total match
+        count and per-facet value counts, all in one statement.
+        """
+        return faceted_article_search(self.db, PersonDB, PERSON_FACETS, selected, project_id, name, skip, limit)
+
+    def resolve_names(self, project_id: int, names: Sequence[str]) -> Dict[str, int]:
+        """Map lower-cased names to the article ID of the oldest person with that name in a project."""
+        keys = list({name.lower() for name in names if name})
+        if not keys:
+            return {}
+        rows = self.db.execute(
+            select(func.lower(ArticleDB.title), func.min(PersonDB.article_id))
+            .join(PersonDB, PersonDB.article_id == ArticleDB.id)
+            .where(
+                ArticleDB.project_id == project_id,
+                func.lower(ArticleDB.title) == any_(bindparam("names", keys, type_=ARRAY(String))),
+            )
+            .group_by(func.lower(ArticleDB.title))
+        ).all()
+        return dict(rows)
+
+    def link_locations(self, person_db: PersonDB, project_id: int, person_data: PersonData) -> None:
+        """Point a person at the location hierarchy nodes for their current location and birthplace."""
+        locations = LocationRepository(self.db)
+        person_db.location_id = locations.resolve(project_id, person_data.current_location)
+        person_db.birthplace_id = locations.resolve(project_id, person_data.birthplace)
+
+    def sync_relationships(self, article_id: int, project_id: int, name: str, relationships: List[Relationship]) -> None:
+        """
+        Replace a person's relationship edges and re-resolve the edges that name them.
+
+        Runs in the caller's transaction; the person row must already be flushed.
+        """
+        self.db.execute(delete(PersonRelationshipDB).where(PersonRelationshipDB.source_article_id == article_id))
+
+        edges = [rel for rel in relationships if rel.person_name and rel.relationship_type]
+        if edges:
+            resolved = self.resolve_names(project_id, [rel.person_name for rel in edges])
+            self.db.execute(
+                insert(PersonRelationshipDB),
+                [
+                    {
+                        "project_id": project_id,
+                        "source_article_id": article_id,
+                        "target_article_id": resolved.get(rel.person_name.lower()),
+                        "target_name": rel.person_name,
+                        "relationship_type": rel.relationship_type.lower(),
+                        "description": rel.description,
+                        "status": rel.status or "active",
+                        "position": position,
+                    }
+                    for position, rel in enumerate(edges)
+                ],
+            )
+
+        self.resolve_relationship_targets(article_id, project_id, name)
+
+    def resolve_relationship_targets(self, article_id: int, project_id: int, name: str) -> None:
+        """
+        Re-resolve the relationship edges pointing at an article or naming it, after it
+        was created or renamed: edges it no longer matches fall to the next person with
+        that name (or none), and edges naming it are claimed unless an older person has the name.
+        """
+        self.db.execute(_RESOLVE_TARGETS_SQL, {"article_id": article_id, "project_id": project_id, "name": name})
+
+    def rebuild_relationships(self, project_id: int) -> None:
+        """Rebuild every relationship edge in a project from the stored person data (no commit)."""
+        self.db.execute(delete(PersonRelationshipDB).where(PersonRelationshipDB.project_id == project_id))
+        self.db.execute(_REBUILD_RELATIONSHIPS_SQL, {"project_id": project_id})
+
     def to_domain(self, db_obj: PersonDB) -> Person:
         """Convert database model to domain model."""
         # Get the associated article
-        article_db = self.db.query(ArticleDB).filter(ArticleDB.id == db_obj.article_id).first()
+        article_db = db_obj.article
         if not article_db:
             raise ValueError(f"Article not found for person {db_obj.id}")
 
@@ -75,6 +245,8 @@ class PersonRepository(BaseRepository[PersonDB, Person]):
             content=content,
             article_type=ArticleType(article_db.article_type),
             project_id=article_db.project_id,
+            header_image_id=article_db.header_image_id,
+            spotify_url=article_db.spotify_url,
             created_at=article_db.created_at,
             updated_at=article_db.updated_at
         )
@@ -135,7 +307,7 @@ class PersonRepository(BaseRepository[PersonDB, Person]):
                 "footer_content": domain_obj.article.content.footer_content,
                 "summary": domain_obj.article.content.summary,
                 "tags": domain_obj.article.content.tags,
-                "metadata": domain_obj.article.content.metadata
+                "metadata": _storable_metadata(domain_obj.article.content.metadata)
             }
 
         article_db = ArticleDB(
@@ -218,7 +390,19 @@ class PersonRepository(BaseRepository[PersonDB, Person]):
         
         # Set the article_id on person
         person_db.article_id = article_db.id
-        
+        self.db.add(person_db)
+        self.db.flush()
+        self.sync_relationships(
+            article_db.id, article_db.project_id, article_db.title, domain_obj.person_data.relationships
+        )
+        self.link_locations(person_db, article_db.project_id, domain_obj.person_data)
+        TimelineRepository(self.db).sync_article(
+            article_db.id, article_db.project_id, person_events(domain_obj.person_data)
+        )
+        ArticleLinkRepository(self.db).sync_article(
+            article_db.id, article_db.project_id, article_db.title, article_db.content
+        )
+
         # Create person
         created_person_db = self.create(person_db)
         
@@ -229,7 +413,8 @@ class PersonRepository(BaseRepository[PersonDB, Person]):
         if not domain_obj.id:
             return None
 
-        person_db = self.get_by_id(domain_obj.id)
+        # The domain ID is the article ID
+        person_db = self.db.query(PersonDB).filter(PersonDB.article_id == domain_obj.id).first()
         if not person_db:
             return None
 
@@ -246,7 +431,7 @@ class PersonRepository(BaseRepository[PersonDB, Person]):
                     "footer_content": domain_obj.article.content.footer_content,
                     "summary": domain_obj.article.content.summary,
                     "tags": domain_obj.article.content.tags,
-                    "metadata": domain_obj.article.content.metadata
+                    "metadata": _storable_metadata(domain_obj.article.content.metadata)
                 }
 
         # Update person data (similar to from_domain conversion)
@@ -305,5 +490,18 @@ class PersonRepository(BaseRepository[PersonDB, Person]):
         person_db.occupation = domain_obj.person_data.occupation
         person_db.current_location = domain_obj.person_data.current_location
 
+        if article_db:
+            self.db.flush()
+            self.sync_relationships(
+                person_db.article_id, article_db.project_id, article_db.title, domain_obj.person_data.relationships
+            )
+            self.link_locations(person_db, article_db.project_id, domain_obj.person_data)
+            TimelineRepository(self.db).sync_article(
+                person_db.article_id, article_db.project_id, person_events(domain_obj.person_data)
+            )
+            ArticleLinkRepository(self.db).sync_article(
+                person_db.article_id, article_db.project_id, article_db.title, article_db.content
+            )
+
         updated_person_db = self.update(person_db)
         return self.to_domain(updated_person_db)
\ No newline at end of file
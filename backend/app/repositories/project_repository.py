@@ -3,15 +3,19 @@ Project repository for database operations.
 """
 
 from typing import Optional, List
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.db.models.project import ProjectDB
-from app.domain.models.project import Project  # We'll create this
+from app.db.models.project_stats import ProjectStatsDB
+from app.domain.models.project import Project, ProjectStats
 from .base_repository import BaseRepository
 
 
 class ProjectRepository(BaseRepository[ProjectDB, Project]):
     """Repository for project database operations."""
 
+    cache_kind = "project"
+
     def __init__(self, db: Session):
         super().__init__(db, ProjectDB)
 
@@ -29,12 +33,27 @@ class ProjectRepository(BaseRepository[ProjectDB, Project]):
             .all()
         )
 
+    def get_stats(self, project_id: int) -> Optional[ProjectStats]:
+        """Get a project's maintained row counts and image totals."""
+        db_stats = self.db.query(ProjectStatsDB).filter(ProjectStatsDB.project_id == project_id).first()
+        if db_stats is None:
+            return None
+        return ProjectStats(
+            project_id=db_stats.project_id,
+            article_count=db_stats.article_count,
+            person_count=db_stats.person_count,
+            settlement_count=db_stats.settlement_count,
+            image_count=db_stats.image_count,
+            image_bytes=db_stats.image_bytes,
+        )
+
     def to_domain(self, db_obj: ProjectDB) -> Project:
         """Convert database model to domain model."""
         return Project(
             id=db_obj.id,
             name=db_obj.name,
             description=db_obj.description,
+            calendar=db_obj.calendar,
             created_at=db_obj.created_at,
             updated_at=db_obj.updated_at
         )
@@ -43,7 +62,8 @@ class ProjectRepository(BaseRepository[ProjectDB, Project]):
         """Convert domain model to database model."""
         db_obj = ProjectDB(
             name=domain_obj.name,
-            description=domain_obj.description
+            description=domain_obj.description,
+            calendar=domain_obj.calendar
         )
 
         if domain_obj.id:
@@ -69,6 +89,106 @@ class ProjectRepository(BaseRepository[ProjectDB, Project]):
         # Update fields
         db_obj.name = domain_obj.name
         db_obj.description = domain_obj.description
+        db_obj.calendar = domain_obj.calendar
 
         updated_db_obj = self.update(db_obj)
-        return self.to_domain(updated_db_obj)
\ No newline at end of file
+        return self.to_domain(updated_db_obj)
+
+    def delete_cascading(self, project_id: int) -> bool:
+        """
+        Delete a project with a single set-based statement.
+
+        Articles, images, persons and settlements are removed by ON DELETE CASCADE
+        in the database instead of being loaded into the session first.
+        """
+        deleted = (
+            self.db.query(ProjectDB)
+            .filter(ProjectDB.id == project_id)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        self.invalidate_cache(project_id)
+        return deleted > 0
+
+    def clone(self, project_id: int, name: str) -> Optional[ProjectDB]:
+        """
+        Copy a project and all of its rows inside PostgreSQL.
+
+        Images, articles, persons, settlements and locations are copied with set-based
+        INSERT ... SELECT statements; new IDs are drawn from each table's sequence
+        up front so references can be remapped with joins. Image rows point at the
+        same stored files as the source project rather than duplicating bytes.
+
+        Nothing is committed, so the caller can reindex the copy in the same transaction.
+        """
+        new_project_id = self.db.execute(
+            text("""
+                INSERT INTO projects (name, description, calendar)
+                SELECT :name, description, calendar FROM projects WHERE id = :project_id
+                RETURNING id
+            """),
+            {"name": name, "project_id": project_id},
+        ).scalar()
+        if new_project_id is None:
+            self.db.rollback()
+            return None
+
+        params = {"project_id": project_id, "new_project_id": new_project_id}
+        self.db.execute(text("""
+            CREATE TEMP TABLE clone_image_map ON COMMIT DROP AS
+            SELECT id AS old_id, nextval(pg_get_serial_sequence('images', 'id'))::integer AS new_id
+            FROM images WHERE project_id = :project_id
+        """), params)
+        self.db.execute(text("""
+            CREATE TEMP TABLE clone_article_map ON COMMIT DROP AS
+            SELECT id AS old_id, nextval(pg_get_serial_sequence('articles', 'id'))::integer AS new_id
+            FROM articles WHERE project_id = :project_id
+        """), params)
+        self.db.execute(text("CREATE INDEX ON clone_image_map (old_id)"))
+        self.db.execute(text("CREATE INDEX ON clone_article_map (old_id)"))
+
+        self.db.execute(text("""
+            INSERT INTO images (id, filename, original_filename, file_path, file_size, mime_type, width, height,
+                                alt_text, is_s3_stored, s3_bucket, perceptual_hash, placeholder_color, project_id)
+            SELECT m.new_id, i.filename, i.original_filename, i.file_path, i.file_size, i.mime_type, i.width,
+                   i.height, i.alt_text, i.is_s3_stored, i.s3_bucket, i.perceptual_hash, i.placeholder_color,
+                   :new_project_id
+            FROM images i
+            JOIN clone_image_map m ON m.old_id = i.id
+        """), params)
+        self.db.execute(text("""
+            INSERT INTO articles (id, title, content, article_type, project_id, header_image_id, spotify_url)
+            SELECT m.new_id, a.title, a.content, a.article_type, :new_project_id, im.new_id, a.spotify_url
+            FROM articles a
+            JOIN clone_article_map m ON m.old_id = a.id
+            LEFT JOIN clone_image_map im ON im.old_id = a.header_image_id
+        """), params)
+        self.db.execute(text("""
+            INSERT INTO persons (article_id, person_data, race, gender, life_status, occupation, current_location)
+            SELECT m.new_id, p.person_data, p.race, p.gender, p.life_status, p.occupation, p.current_location
+            FROM persons p
+            JOIN clone_article_map m ON m.old_id = p.article_id
+        """))
+        self.db.execute(text("""
+            INSERT INTO settlements (article_id, settlement_data, settlement_type, population, government_type,
+                                     region, primary_industry, latitude, longitude)
+            SELECT m.new_id, s.settlement_data, s.settlement_type, s.population, s.government_type,
+                   s.region, s.primary_industry, s.latitude, s.longitude
+            FROM settlements s
+            JOIN clone_article_map m ON m.old_id = s.article_id
+        """))
+        # Persons and settlements are linked to the copied hierarchy when the clone is reindexed
+        self.db.execute(text("""
+            CREATE TEMP TABLE clone_location_map ON COMMIT DROP AS
+            SELECT id AS old_id, nextval(pg_get_serial_sequence('locations', 'id'))::integer AS new_id
+            FROM locations WHERE project_id = :project_id
+        """), params)
+        self.db.execute(text("""
+            INSERT INTO locations (id, project_id, name, location_type, parent_id, article_id)
+            SELECT m.new_id, :new_project_id, l.name, l.location_type, pm.new_id, am.new_id
+            FROM locations l
+            JOIN clone_location_map m ON m.old_id = l.id
+            LEFT JOIN clone_location_map pm ON pm.old_id = l.parent_id
+            LEFT JOIN clone_article_map am ON am.old_id = l.article_id
+        """), params)
+        return self.get_by_id(new_project_id)
@@ -2,13 +2,122 @@
 Settlement repository for database operations.
 """
 
-from typing import Optional, List
-from sqlalchemy.orm import Session
+import math
+from typing import Any, Dict, Optional, List, Sequence, Tuple
+from sqlalchemy import case, func, literal_column, or_, select, true
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql import ColumnElement
 from app.db.models.settlement import SettlementDB
 from app.db.models.article import ArticleDB
-from app.domain.models.settlement import Settlement, SettlementData, SettlementType, GovernmentType
+from app.domain.models.settlement import (
+    Settlement, SettlementData, SettlementType, GovernmentType,
+    POPULATION_CATEGORIES, UNKNOWN_POPULATION_CATEGORY,
+)
 from app.domain.models.article import Article, ArticleContent, ArticleType
+from .article_link_repository import ArticleLinkRepository
 from .base_repository import BaseRepository
+from .facets import FacetCounts, faceted_article_search
+from .location_repository import LocationRepository
+from .timeline_repository import TimelineRepository, settlement_events
+
+
+def population_category_column(population: ColumnElement) -> ColumnElement:
+    """SQL version of ``population_category`` built from the same thresholds."""
+    # Literals rather than bind parameters, so GROUPING() can match the expression in GROUP BY
+    whens = [(or_(population.is_(None), population == 0), literal_column(f"'{UNKNOWN_POPULATION_CATEGORY}'"))]
+    for name, upper in POPULATION_CATEGORIES[:-1]:
+        whens.append((population < literal_column(str(upper)), literal_column(f"'{name}'")))
+    return case(*whens, else_=literal_column(f"'{POPULATION_CATEGORIES[-1][0]}'"))
+
+
+EARTH_RADIUS_KM = 6371.0
+
+# The GiST index is on point(x=longitude, y=latitude)
+SETTLEMENT_LOCATION = func.point(SettlementDB.longitude, SettlementDB.latitude)
+
+# Lightweight columns for map markers and proximity results
+MAP_COLUMNS = (
+    ArticleDB.id.label("id"),
+    ArticleDB.title.label("name"),
+    SettlementDB.settlement_type,
+    SettlementDB.population,
+    SettlementDB.latitude,
+    SettlementDB.longitude,
+)
+
+
+def coordinates_columns(coordinates: Optional[Dict[str, Any]]) -> Tuple[Optional[float], Optional[float]]:
+    """(latitude, longitude) from a ``{"lat", "lng"}`` dict, or (None, None) if missing or out of range."""
+    if not coordinates:
+        return None, None
+    lat, lng = coordinates.get("lat"), coordinates.get("lng")
+    if isinstance(lat, bool) or isinstance(lng, bool) or not isinstance(lat, (int, float)) or not isinstance(lng, (int, float)):
+        return None, None
+    if not -90 <= lat <= 90 or not -180 <= lng <= 180:
+        return None, None
+    return float(lat), float(lng)
+
+
+def distance_km_column(lat: float, lng: float) -> ColumnElement:
+    """Great-circle (haversine) distance in kilometres from a point to each settlement."""
+    half_dlat = func.radians(SettlementDB.latitude - lat) / 2
+    half_dlng = func.radians(SettlementDB.longitude - lng) / 2
+    a = (
+        func.power(func.sin(half_dlat), 2)
+        + math.cos(math.radians(lat)) * func.cos(func.radians(SettlementDB.latitude)) * func.power(func.sin(half_dlng), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(a)))
+
+
+def bbox_filter(south: float, west: float, north: float, east: float) -> ColumnElement:
+    """
+    Index-backed containment test for a latitude/longitude box.
+
+    A box with ``west > east`` crosses the antimeridian and is split in two.
+    """
+    def box(w: float, e: float) -> ColumnElement:
+        return SETTLEMENT_LOCATION.op("<@")(func.box(func.point(w, south), func.point(e, north)))
+
+    if west <= east:
+        return box(west, east)
+    return or_(box(west, 180.0), box(-180.0, east))
+
+
+def radius_bbox(lat: float, lng: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(south, west, north, east) box enclosing every point within ``radius_km`` of a point."""
+    angular = radius_km / EARTH_RADIUS_KM
+    dlat = math.degrees(angular)
+    south, north = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+    # Near a pole (or for huge radii) the circle covers every longitude
+    if south == -90.0 or north == 90.0 or angular >= math.pi / 2:
+        return south, -180.0, north, 180.0
+    dlng = math.degrees(math.asin(min(1.0, math.sin(angular) / math.cos(math.radians(lat)))))
+    if dlng >= 180.0:
+        return south, -180.0, north, 180.0
+    west, east = lng - dlng, lng + dlng
+    # Wrap into [-180, 180]; a wrapped box has west > east
+    if west < -180.0:
+        west += 360.0
+    if east > 180.0:
+        east -= 360.0
+    return south, west, north, east
+
+
+# Columns settlements can be filtered and counted by
+SETTLEMENT_FACETS = {
+    "settlement_type": SettlementDB.settlement_type,
+    "government_type": SettlementDB.government_type,
+    "region": SettlementDB.region,
+    "primary_industry": SettlementDB.primary_industry,
+    "population_category": population_category_column(SettlementDB.population),
+}
+
+
+def _storable_metadata(metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Article metadata without the SettlementData object Settlement keeps there; the settlements row stores it."""
+    if not metadata:
+        return metadata
+    return {key: value for key, value in metadata.items() if key != "settlement_data"}
 
 
 class SettlementRepository(BaseRepository[SettlementDB, Settlement]):
@@ -56,10 +165,160 @@ class SettlementRepository(BaseRepository[SettlementDB, Settlement]):
             .all()
         )
 
+    def get_by_article_ids(self, article_ids: List[int]) -> List[SettlementDB]:
+        """Get settlements by their article IDs with articles loaded (in no particular order)."""
+        if not article_ids:
+            return []
+        return (
+            self.db.query(SettlementDB)
+            .options(joinedload(SettlementDB.article))
+            .filter(self._id_in(SettlementDB.article_id, article_ids))
+            .all()
+        )
+
+    def count_by_type(self, project_id: int) -> Dict[str, int]:
+        """Count a project's settlements per settlement type."""
+        rows = (
+            self.db.query(SettlementDB.settlement_type, func.count(SettlementDB.id))
+            .join(ArticleDB, ArticleDB.id == SettlementDB.article_id)
+            .filter(ArticleDB.project_id == project_id)
+            .group_by(SettlementDB.settlement_type)
+            .all()
+        )
+        return dict(rows)
+
+    def faceted_search(
+        self,
+        project_id: int,
+        selected: Dict[str, Sequence[Any]],
+        name: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Tuple[List[SettlementDB], int, FacetCounts]:
+        """
+        Get a page of settlements matching the selected facet values, the total match
+        count and per-facet value counts (including population categories), all in one statement.
+        """
+        return faceted_article_search(self.db, SettlementDB, SETTLEMENT_FACETS, selected, project_id, name, skip, limit)
+
+    def get_location(self, article_id: int) -> Optional[Tuple[int, Optional[float], Optional[float]]]:
+        """Get (project ID, latitude, longitude) for a settlement by article ID."""
+        row = (
+            self.db.query(ArticleDB.project_id, SettlementDB.latitude, SettlementDB.longitude)
+            .join(ArticleDB, ArticleDB.id == SettlementDB.article_id)
+            .filter(SettlementDB.article_id == article_id)
+            .first()
+        )
+        return tuple(row) if row else None
+
+    def get_trade_rows(self, project_id: int) -> List[Tuple[Any, ...]]:
+        """Get (article ID, title, latitude, longitude, nearby settlement names, trade goods) for a project's settlements."""
+        query = (
+            self.db.query(
+                ArticleDB.id,
+                ArticleDB.title,
+                SettlementDB.latitude,
+                SettlementDB.longitude,
+                SettlementDB.settlement_data["nearby_settlements"],
+                SettlementDB.settlement_data["trade_goods"],
+            )
+            .join(ArticleDB, ArticleDB.id == SettlementDB.article_id)
+            .filter(ArticleDB.project_id == project_id)
+        )
+        return [tuple(row) for row in query.all()]
+
+    def get_trade_signature(self, project_id: int) -> Tuple[Any, ...]:
+        """
+        Get (count, latest article version) for a project's settlements. Settlement
+        writes touch their article, and article versions are taken in commit order.
+        """
+        return tuple(
+            self.db.query(func.count(SettlementDB.id), func.max(ArticleDB.change_version))
+            .join(ArticleDB, ArticleDB.id == SettlementDB.article_id)
+            .filter(ArticleDB.project_id == project_id)
+            .one()
+        )
+
+    def _map_query(self, project_id: int):
+        return (
+            select(*MAP_COLUMNS)
+            .join(ArticleDB, ArticleDB.id == SettlementDB.article_id)
+            .where(ArticleDB.project_id == project_id)
+        )
+
+    def get_in_bbox(
+        self, project_id: int, south: float, west: float, north: float, east: float, limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Get map markers for a project's settlements inside a viewport, largest first.
+
+        ``west > east`` means the viewport crosses the antimeridian.
+        """
+        if south > north:
+            return []
+        rows = self.db.execute(
+            self._map_query(project_id)
+            .where(bbox_filter(south, west, north, east))
+            .order_by(SettlementDB.population.desc().nulls_last(), ArticleDB.id)
+            .limit(limit)
+        ).mappings().all()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _exclude(article_id: Optional[int]) -> ColumnElement:
+        return ArticleDB.id != article_id if article_id is not None else true()
+
+    def get_within_radius(
+        self,
+        project_id: int,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        limit: Optional[int] = 100,
+        exclude_article_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get settlements within ``radius_km`` of a point, nearest first, with ``distance_km``."""
+        distance = distance_km_column(lat, lng)
+        query = (
+            self._map_query(project_id)
+            .add_columns(distance.label("distance_km"))
+            # The box uses the GiST index; the exact distance trims its corners
+            .where(bbox_filter(*radius_bbox(lat, lng, radius_km)), distance <= radius_km)
+            .where(self._exclude(exclude_article_id))
+            .order_by(distance, ArticleDB.id)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return [dict(row) for row in self.db.execute(query).mappings().all()]
+
+    def get_nearest(
+        self, project_id: int, lat: float, lng: float, k: int = 10, exclude_article_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the ``k`` settlements nearest to a point, with ``distance_km``.
+
+        A GiST-ordered scan finds the k nearest by planar degree distance; the
+        farthest of those bounds the true k-th great-circle distance, so a radius
+        query of that size is guaranteed to contain the exact answer.
+        """
+        candidates = self.db.execute(
+            self._map_query(project_id)
+            .add_columns(distance_km_column(lat, lng).label("distance_km"))
+            .where(SettlementDB.latitude.isnot(None), SettlementDB.longitude.isnot(None))
+            .where(self._exclude(exclude_article_id))
+            .order_by(SETTLEMENT_LOCATION.op("<->")(func.point(lng, lat)))
+            .limit(k)
+        ).mappings().all()
+        if not candidates:
+            return []
+        radius = max(row["distance_km"] for row in candidates)
+        # A hair of slack so floating-point rounding cannot drop the bounding settlement itself
+        return self.get_within_radius(project_id, lat, lng, radius * (1 + 1e-9) + 1e-9, k, exclude_article_id)
+
     def to_domain(self, db_obj: SettlementDB) -> Settlement:
         """Convert database model to domain model."""
         # Get the associated article
-        article_db = self.db.query(ArticleDB).filter(ArticleDB.id == db_obj.article_id).first()
+        article_db = db_obj.article
         if not article_db:
             raise ValueError(f"Article not found for settlement {db_obj.id}")
 
@@ -74,6 +333,8 @@ class SettlementRepository(BaseRepository[SettlementDB, Settlement]):
             content=content,
             article_type=ArticleType(article_db.article_type),
             project_id=article_db.project_id,
+            header_image_id=article_db.header_image_id,
+            spotify_url=article_db.spotify_url,
             created_at=article_db.created_at,
             updated_at=article_db.updated_at
         )
@@ -117,7 +378,7 @@ class SettlementRepository(BaseRepository[SettlementDB, Settlement]):
                 "footer_content": domain_obj.article.content.footer_content,
                 "summary": domain_obj.article.content.summary,
                 "tags": domain_obj.article.content.tags,
-                "metadata": domain_obj.article.content.metadata
+                "metadata": _storable_metadata(domain_obj.article.content.metadata)
             }
 
         article_db = ArticleDB(
@@ -162,6 +423,7 @@ class SettlementRepository(BaseRepository[SettlementDB, Settlement]):
             region=domain_obj.settlement_data.region,
             primary_industry=domain_obj.settlement_data.primary_industry
         )
+        settlement_db.latitude, settlement_db.longitude = coordinates_columns(domain_obj.settlement_data.coordinates)
 
         return article_db, settlement_db
 
@@ -175,6 +437,15 @@ class SettlementRepository(BaseRepository[SettlementDB, Settlement]):
         
         # Set the article_id on settlement
         settlement_db.article_id = article_db.id
+        settlement_db.location_id = LocationRepository(self.db).sync_settlement(
+            article_db.id, article_db.project_id, article_db.title, settlement_db.region, place_in_region=True
+        )
+        TimelineRepository(self.db).sync_article(
+            article_db.id, article_db.project_id, settlement_events(domain_obj.settlement_data)
+        )
+        ArticleLinkRepository(self.db).sync_article(
+            article_db.id, article_db.project_id, article_db.title, article_db.content
+        )
         
         # Create settlement
         created_settlement_db = self.create(settlement_db)
@@ -186,13 +457,16 @@ class SettlementRepository(BaseRepository[SettlementDB, Settlement]):
         if not domain_obj.id:
             return None
 
-        settlement_db = self.get_by_id(domain_obj.id)
+        # Domain IDs are article IDs
+        settlement_db = self.db.query(SettlementDB).filter(SettlementDB.article_id == domain_obj.id).first()
         if not settlement_db:
             return None
 
         # Update article
         article_db = self.db.query(ArticleDB).filter(ArticleDB.id == settlement_db.article_id).first()
         if article_db:
+            # Settlement changes count as article changes, so version checks see them
+            article_db.updated_at = func.now()
             article_db.title = domain_obj.article.title
             article_db.article_type = domain_obj.article.article_type.value
             
@@ -203,7 +477,7 @@ class SettlementRepository(BaseRepository[SettlementDB, Settlement]):
                     "footer_content": domain_obj.article.content.footer_content,
                     "summary": domain_obj.article.content.summary,
                     "tags": domain_obj.article.content.tags,
-                    "metadata": domain_obj.article.content.metadata
+                    "metadata": _storable_metadata(domain_obj.article.content.metadata)
                 }
 
         # Update settlement data
@@ -230,12 +504,24 @@ class SettlementRepository(BaseRepository[SettlementDB, Settlement]):
             "festivals": domain_obj.settlement_data.festivals
         }
 
+        region_changed = settlement_db.region != domain_obj.settlement_data.region
         settlement_db.settlement_data = settlement_data_dict
         settlement_db.settlement_type = domain_obj.settlement_data.settlement_type.value
         settlement_db.population = domain_obj.settlement_data.population
         settlement_db.government_type = domain_obj.settlement_data.government_type.value if domain_obj.settlement_data.government_type else None
         settlement_db.region = domain_obj.settlement_data.region
         settlement_db.primary_industry = domain_obj.settlement_data.primary_industry
+        settlement_db.latitude, settlement_db.longitude = coordinates_columns(domain_obj.settlement_data.coordinates)
+        if article_db:
+            settlement_db.location_id = LocationRepository(self.db).sync_settlement(
+                settlement_db.article_id, article_db.project_id, article_db.title, settlement_db.region, region_changed
+            )
+            TimelineRepository(self.db).sync_article(
+                settlement_db.article_id, article_db.project_id, settlement_events(domain_obj.settlement_data)
+            )
+            ArticleLinkRepository(self.db).sync_article(
+                settlement_db.article_id, article_db.project_id, article_db.title, article_db.content
+            )
 
         updated_settlement_db = self.update(settlement_db)
         return self.to_domain(updated_settlement_db)
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""
+Timeline repository for dated events derived from persons and settlements.
+
+Events are extracted from ``person_data`` (birth, death and important dates)
+and ``settlement_data`` (founding date) whenever an article is written, and
+rebuilt set-based for whole projects. Sort keys come from the project
+calendar; since many events share a date, bulk keying computes one key per
+distinct date string.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import BigInteger, String, bindparam, delete, insert, select, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+from app.db.models.article import ArticleDB
+from app.db.models.project import ProjectDB
+from app.db.models.timeline_event import TimelineEventDB
+from app.domain.models.calendar import Calendar
+from app.domain.models.person import PersonData
+from app.domain.models.settlement import SettlementData
+from .base_repository import BaseRepository
+
+# (kind, label, date text, position)
+TimelineEntry = Tuple[str, str, str, int]
+
+# Shared with the SQL below so single-article and bulk extraction agree
+_WHITESPACE = " \t\n\r"
+
+
+def _clean(value: Optional[str]) -> str:
+    return (value or "").strip(_WHITESPACE)
+
+
+def person_events(person_data: PersonData) -> List[TimelineEntry]:
+    """
+    Timeline entries for a person. Important dates that merely repeat the birth or
+    death date (as ``Person.set_birth_date`` records them) are skipped.
+    """
+    birth, death = _clean(person_data.birth_date), _clean(person_data.death_date)
+    events = [("birth", "Birth", birth, 0)] if birth else []
+    for position, item in enumerate(person_data.important_dates, start=1):
+        date, label = _clean(item.date), _clean(item.event).lower()
+        if date and item.event and (label, date) not in (("birth", birth), ("death", death)):
+            events.append(("event", item.event, date, position))
+    if death:
+        events.append(("death", "Death", death, 0))
+    return events
+
+
+def settlement_events(settlement_data: SettlementData) -> List[TimelineEntry]:
+    """Timeline entries for a settlement."""
+    founded = _clean(settlement_data.founded_date)
+    return [("founded", "Founded", founded, 0)] if founded else []
+
+
+# Every event in a project as (article_id, kind, label, date_text, position)
+_PROJECT_EVENTS_SQL = """
+    SELECT p.article_id, e.kind, e.label, e.date_text, e.position
+    FROM persons p
+    JOIN articles a ON a.id = p.article_id
+    CROSS JOIN LATERAL (
+        SELECT btrim(p.person_data->>'birth_date', E' \\t\\n\\r') AS birth,
+               btrim(p.person_data->>'death_date', E' \\t\\n\\r') AS death
+    ) d
+    CROSS JOIN LATERAL (
+        SELECT 'birth', 'Birth', d.birth, 0
+        UNION ALL
+        SELECT 'event', i.item->>'event', btrim(i.item->>'date', E' \\t\\n\\r'), i.position::integer
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(p.person_data->'important_dates') = 'array'
+                 THEN p.person_data->'important_dates' ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS i(item, position)
+        WHERE NOT coalesce(
+            (lower(btrim(i.item->>'event', E' \\t\\n\\r')) = 'birth' AND btrim(i.item->>'date', E' \\t\\n\\r') = d.birth)
+            OR (lower(btrim(i.item->>'event', E' \\t\\n\\r')) = 'death' AND btrim(i.item->>'date', E' \\t\\n\\r') = d.death),
+            false
+        )
+        UNION ALL
+        SELECT 'death', 'Death', d.death, 0
+    ) e(kind, label, date_text, position)
+    WHERE a.project_id = :project_id
+      AND coalesce(e.date_text, '') <> ''
+      AND coalesce(e.label, '') <> ''
+    UNION ALL
+    SELECT s.article_id, 'founded', 'Founded', btrim(s.settlement_data->>'founded_date', E' \\t\\n\\r'), 0
+    FROM settlements s
+    JOIN articles a ON a.id = s.article_id
+    WHERE a.project_id = :project_id
+      AND coalesce(btrim(s.settlement_data->>'founded_date', E' \\t\\n\\r'), '') <> ''
+"""
+
+
+def _keys_by_date(dates: List[str], calendar: Calendar) -> List[Any]:
+    """Bind parameters pairing each date with its sort key, for joining against ``unnest(:dates, :sort_keys)``."""
+    return [
+        bindparam("dates", list(dates), type_=ARRAY(String)),
+        bindparam("sort_keys", [calendar.sort_key(date) for date in dates], type_=ARRAY(BigInteger)),
+    ]
+
+
+class TimelineRepository(BaseRepository[TimelineEventDB, TimelineEventDB]):
+    """Repository for timeline events. Writes here do not commit."""
+
+    def __init__(self, db: Session):
+        super().__init__(db, TimelineEventDB)
+
+    def get_calendar(self, project_id: int) -> Calendar:
+        """Get a project's calendar (the default calendar if it has none)."""
+        config = self.db.execute(select(ProjectDB.calendar).where(ProjectDB.id == project_id)).scalar()
+        return Calendar.from_dict(config)
+
+    def sync_article(self, article_id: int, project_id: int, events: List[TimelineEntry]) -> None:
+        """Replace an article's events."""
+        self.db.execute(delete(TimelineEventDB).where(TimelineEventDB.article_id == article_id))
+        if not events:
+            return
+        calendar = self.get_calendar(project_id)
+        self.db.execute(
+            insert(TimelineEventDB),
+            [
+                {
+                    "project_id": project_id,
+                    "article_id": article_id,
+                    "kind": kind,
+                    "label": label,
+                    "date_text": date_text,
+                    "sort_key": calendar.sort_key(date_text),
+                    "position": position,
+                }
+                for kind, label, date_text, position in events
+            ],
+        )
+
+    def rebuild_project(self, project_id: int) -> None:
+        """
+        Re-extract every event in a project from its persons and settlements. Keys are
+        computed for the distinct dates first so each row is written once, already keyed.
+        """
+        params = {"project_id": project_id}
+        self.db.execute(delete(TimelineEventDB).where(TimelineEventDB.project_id == project_id))
+        dates = self.db.execute(
+            text(f"SELECT DISTINCT e.date_text FROM ({_PROJECT_EVENTS_SQL}) e"), params
+        ).scalars().all()
+        if not dates:
+            return
+        statement = text(f"""
+            INSERT INTO timeline_events (project_id, article_id, kind, label, date_text, sort_key, position)
+            SELECT :project_id, e.article_id, e.kind, e.label, e.date_text, k.sort_key, e.position
+            FROM ({_PROJECT_EVENTS_SQL}) e
+            JOIN unnest(:dates, :sort_keys) AS k(date_text, sort_key) ON k.date_text = e.date_text
+        """).bindparams(*_keys_by_date(dates, self.get_calendar(project_id)))
+        self.db.execute(statement, params)
+
+    def rekey_project(self, project_id: int, calendar: Optional[Calendar] = None) -> None:
+        """Recompute sort keys for a project, e.g. after its calendar changed."""
+        calendar = calendar or self.get_calendar(project_id)
+        dates = self.db.execute(
+            select(TimelineEventDB.date_text).where(TimelineEventDB.project_id == project_id).distinct()
+        ).scalars().all()
+        if not dates:
+            return
+        statement = text("""
+            UPDATE timeline_events t SET sort_key = k.sort_key
+            FROM unnest(:dates, :sort_keys) AS k(date_text, sort_key)
+            WHERE t.project_id = :project_id
+              AND t.date_text = k.date_text
+              AND t.sort_key IS DISTINCT FROM k.sort_key
+        """).bindparams(*_keys_by_date(dates, calendar))
+        self.db.execute(statement, {"project_id": project_id})
+
+    def get_page(
+        self,
+        project_id: int,
+        low: Optional[int] = None,
+        high: Optional[int] = None,
+        after: Optional[Tuple[int, int]] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get dated events in calendar order between two inclusive sort keys, starting
+        after the (sort_key, id) position of the previous page. Undated events are omitted.
+        """
+        conditions = [TimelineEventDB.project_id == project_id, TimelineEventDB.sort_key.is_not(None)]
+        if low is not None:
+            conditions.append(TimelineEventDB.sort_key >= low)
+        if high is not None:
+            conditions.append(TimelineEventDB.sort_key <= high)
+        if after is not None:
+            conditions.append(tuple_(TimelineEventDB.sort_key, TimelineEventDB.id) > tuple_(*after))
+        rows = self.db.execute(
+            select(
+                TimelineEventDB.id,
+                TimelineEventDB.article_id,
+                ArticleDB.title.label("article_title"),
+                ArticleDB.article_type,
+                TimelineEventDB.kind,
+                TimelineEventDB.label,
+                TimelineEventDB.date_text.label("date"),
+                TimelineEventDB.sort_key,
+            )
+            .join(ArticleDB, ArticleDB.id == TimelineEventDB.article_id)
+            .where(*conditions)
+            .order_by(TimelineEventDB.sort_key, TimelineEventDB.id)
+            .limit(limit)
+        ).mappings().all()
+        return [dict(row) for row in rows]
+
+    def to_domain(self, db_obj: TimelineEventDB) -> TimelineEventDB:
+        """Convert database model to domain model (identity)."""
+        return db_obj
+
+    def from_domain(self, domain_obj: TimelineEventDB) -> TimelineEventDB:
+        """Convert domain model to database model (identity)."""
+        return domain_obj
@@ -2,7 +2,8 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
-from .image import ImageResponse
+from .person import PersonDetailed
+from .settlement import SettlementDetailed
 
 
 class ArticleTypeEnum(str, Enum):
@@ -16,6 +17,24 @@ class ArticleTypeEnum(str, Enum):
     ORGANIZATION = "organization"
 
 
+class ArticleViewEnum(str, Enum):
+    """Representations available on article list endpoints."""
+    FULL = "full"
+    SUMMARY = "summary"
+
+
+class TagMatchEnum(str, Enum):
+    """How multiple tag filters combine."""
+    ALL = "all"
+    ANY = "any"
+
+
+class TagCount(BaseModel):
+    """Number of articles in a project carrying a tag."""
+    tag: str = Field(..., description="Tag, lower-cased")
+    count: int
+
+
 class ArticleContentSchema(BaseModel):
     """Schema for article content structure."""
     main_content: Optional[str] = Field(None, description="Main content of the article")
@@ -26,6 +45,20 @@ class ArticleContentSchema(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
 
+class ArticleHeaderImage(BaseModel):
+    """Header image details embedded in article responses."""
+    id: int
+    url: str = Field(..., description="URL to access the full image")
+    width: Optional[int] = Field(None, description="Image width in pixels")
+    height: Optional[int] = Field(None, description="Image height in pixels")
+    alt_text: Optional[str] = Field(None, description="Accessibility description")
+    placeholder: Optional[str] = Field(None, description="Average colour (#rrggbb) to show while loading")
+    thumbnail_url: Optional[str] = Field(None, description="URL of a downscaled thumbnail, if available")
+
+    class Config:
+        from_attributes = True
+
+
 class ArticleBase(BaseModel):
     """Base schema for article data."""
     title: str = Field(..., description="Title of the article")
@@ -53,7 +86,9 @@ class ArticleUpdate(BaseModel):
 class Article(ArticleBase):
     """Schema for article response."""
     id: int
-    header_image: Optional[ImageResponse] = Field(None, description="Header image details")
+    header_image: Optional[ArticleHeaderImage] = Field(
+        None, description="Header image details (only when requested with include_header_image)"
+    )
     created_at: datetime
     updated_at: datetime
 
@@ -67,9 +102,48 @@ class ArticleSummary(BaseModel):
     title: str
     article_type: ArticleTypeEnum
     project_id: int
+    summary: Optional[str] = Field(None, description="Summary or excerpt")
     word_count: int = Field(..., description="Approximate word count")
     created_at: datetime
     updated_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class ArticleFields(BaseModel):
+    """Article list row holding only the fields requested with ``fields`` (the ID is always included)."""
+    id: int
+
+    class Config:
+        extra = "allow"
+
+
+class ArticleReference(BaseModel):
+    """Schema for a reference to an article, e.g. a backlink or an autocomplete match."""
+    id: int
+    title: str
+    article_type: ArticleTypeEnum
+
+    class Config:
+        from_attributes = True
+
+
+class RelatedArticle(ArticleReference):
+    """Schema for an article recommended as related to another."""
+    score: float = Field(..., description="Cosine similarity of the two articles' text, from 0 to 1")
+
+
+class ArticleKindEnum(str, Enum):
+    """Most specific type an article is stored as."""
+    ARTICLE = "article"
+    PERSON = "person"
+    SETTLEMENT = "settlement"
+
+
+class TypedArticle(BaseModel):
+    """Schema for an article together with its person or settlement details."""
+    kind: ArticleKindEnum = Field(..., description="Which of person/settlement is populated, if any")
+    article: Article
+    person: Optional[PersonDetailed] = Field(None, description="Person details when kind is 'person'")
+    settlement: Optional[SettlementDetailed] = Field(None, description="Settlement details when kind is 'settlement'")
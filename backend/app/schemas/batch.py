@@ -0,0 +1,27 @@
+"""
+Batch fetch Pydantic schemas for API request/response validation.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Dict, Generic, List, Optional, TypeVar
+
+MAX_BATCH_SIZE = 500
+
+T = TypeVar("T")
+
+
+class BatchRequest(BaseModel):
+    """Schema for fetching many entities by ID in one request."""
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE, description="IDs to fetch")
+
+
+class BatchResponse(BaseModel, Generic[T]):
+    """Schema for batch fetch results."""
+    items: List[Optional[T]] = Field(..., description="Results in request order; null where an ID was not found")
+    missing: List[int] = Field(default_factory=list, description="Requested IDs that were not found")
+
+    @classmethod
+    def from_results(cls, ids: List[int], found: Dict[int, T]) -> "BatchResponse[T]":
+        """Arrange results keyed by ID into request order, marking the gaps."""
+        missing = [id for id in dict.fromkeys(ids) if id not in found]
+        return cls(items=[found.get(id) for id in ids], missing=missing)
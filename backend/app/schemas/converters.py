@@ -0,0 +1,90 @@
+"""
+Conversions from composite domain models to their flat API schemas.
+
+Persons and settlements are stored as an article plus type-specific data;
+their response schemas flatten the two, addressed by the article ID.
+"""
+
+from dataclasses import asdict
+from typing import Union
+
+from app.domain.models.article import Article
+from app.domain.models.person import Person
+from app.domain.models.settlement import Settlement
+from app.schemas.article import Article as ArticleSchema, ArticleKindEnum, TypedArticle
+from app.schemas.person import Person as PersonSchema, PersonDetailed
+from app.schemas.settlement import Settlement as SettlementSchema, SettlementDetailed
+
+
+def person_to_schema(person: Person) -> PersonSchema:
+    """Flatten a Person domain model into the standard person response."""
+    data = person.person_data
+    return PersonSchema(
+        id=person.article.id,
+        project_id=person.article.project_id,
+        name=person.article.title,
+        description=person.article.content.summary,
+        race=data.race,
+        gender=data.gender.value if data.gender else None,
+        age=data.age,
+        occupation=data.occupation,
+        current_location=data.current_location,
+        life_status=data.life_status.value,
+        created_at=person.article.created_at,
+        updated_at=person.article.updated_at,
+    )
+
+
+def settlement_to_schema(settlement: Settlement) -> SettlementSchema:
+    """Flatten a Settlement domain model into the standard settlement response."""
+    data = settlement.settlement_data
+    return SettlementSchema(
+        id=settlement.article.id,
+        project_id=settlement.article.project_id,
+        name=settlement.article.title,
+        description=settlement.article.content.summary,
+        settlement_type=data.settlement_type.value,
+        population=data.population,
+        government_type=data.government_type.value if data.government_type else None,
+        region=data.region,
+        ruler_name=data.ruler_name,
+        created_at=settlement.article.created_at,
+        updated_at=settlement.article.updated_at,
+    )
+
+
+def person_to_detailed_schema(person: Person) -> PersonDetailed:
+    """Flatten a Person domain model into the detailed person response."""
+    return PersonDetailed(
+        **{
+            **asdict(person.person_data),
+            **person_to_schema(person).model_dump(),
+        }
+    )
+
+
+def settlement_to_detailed_schema(settlement: Settlement) -> SettlementDetailed:
+    """Flatten a Settlement domain model into the detailed settlement response."""
+    return SettlementDetailed(
+        **{
+            **asdict(settlement.settlement_data),
+            **settlement_to_schema(settlement).model_dump(),
+        }
+    )
+
+
+def to_typed_article(entity: Union[Person, Settlement, Article]) -> TypedArticle:
+    """Wrap the result of a typed article read in its response schema."""
+    if isinstance(entity, Person):
+        return TypedArticle(
+            kind=ArticleKindEnum.PERSON,
+            article=ArticleSchema.model_validate(asdict(entity.article)),
+            person=person_to_detailed_schema(entity),
+        )
+    if isinstance(entity, Settlement):
+        return TypedArticle(
+            kind=ArticleKindEnum.SETTLEMENT,
+            article=ArticleSchema.model_validate(asdict(entity.article)),
+            settlement=settlement_to_detailed_schema(entity),
+        )
+    return TypedArticle(kind=ArticleKindEnum.ARTICLE, article=ArticleSchema.model_validate(asdict(entity)))
@@ -0,0 +1,15 @@
+"""
+Faceted search Pydantic schemas for API request/response validation.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Dict, List
+
+
+class FacetValue(BaseModel):
+    """Schema for one value of a facet and how many results it would match."""
+    value: str = Field(..., description="Facet value")
+    count: int = Field(..., description="Number of matches with this value, given the other selected facets")
+
+
+Facets = Dict[str, List[FacetValue]]
@@ -36,6 +36,7 @@ class ImageResponse(ImageBase):
     height: Optional[int] = Field(None, description="Image height in pixels")
     is_s3_stored: bool = Field(..., description="Whether stored in S3 or locally")
     s3_bucket: Optional[str] = Field(None, description="S3 bucket name if applicable")
+    placeholder_color: Optional[str] = Field(None, description="Average colour (#rrggbb) to show while loading")
     project_id: int = Field(..., description="ID of the project this image belongs to")
     created_at: datetime
     updated_at: datetime
@@ -67,4 +68,24 @@ class ImageListResponse(BaseModel):
     total: int
     page: int
     per_page: int
-    total_pages: int
\ No newline at end of file
+    total_pages: int
+
+class ImageStorageUsage(BaseModel):
+    """Schema for a project's image storage usage."""
+    project_id: int
+    total_images: int
+    total_size_bytes: int
+    total_size_mb: float
+
+class SimilarImage(BaseModel):
+    """A near-duplicate match for an image."""
+    image: ImageResponse
+    distance: int = Field(..., description="Hamming distance between perceptual hashes (0-64)")
+
+
+class SimilarImagesResponse(BaseModel):
+    """Schema for near-duplicate image search results."""
+    image_id: int
+    project_id: int
+    max_distance: int
+    results: list[SimilarImage]
@@ -0,0 +1,30 @@
+"""
+Background job Pydantic schemas for API responses.
+"""
+
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Any, Dict, Optional
+from enum import Enum
+
+
+class JobStatusEnum(str, Enum):
+    """Job status options for API."""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobResponse(BaseModel):
+    """Schema for background job status."""
+    id: str
+    name: str
+    status: JobStatusEnum
+    result: Optional[Dict[str, Any]] = Field(None, description="Job output once it has succeeded")
+    error: Optional[str] = Field(None, description="Error message if the job failed")
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,63 @@
+"""
+Location hierarchy Pydantic schemas for API validation.
+"""
+
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Optional
+from enum import Enum
+
+
+class LocationTypeEnum(str, Enum):
+    """Location type options for API."""
+    WORLD = "world"
+    CONTINENT = "continent"
+    REGION = "region"
+    SETTLEMENT = "settlement"
+    PLACE = "place"
+
+
+class LocationBase(BaseModel):
+    """Base schema for location data."""
+    name: str = Field(..., min_length=1, description="Name of the location")
+    location_type: LocationTypeEnum = Field(LocationTypeEnum.PLACE, description="Kind of location")
+    parent_id: Optional[int] = Field(None, description="ID of the enclosing location, null for a top-level location")
+
+
+class LocationCreate(LocationBase):
+    """Schema for creating a new location."""
+    project_id: int = Field(..., description="ID of the project this location belongs to")
+
+
+class LocationUpdate(BaseModel):
+    """Schema for updating a location; send parent_id null to make it top-level."""
+    name: Optional[str] = Field(None, min_length=1, description="Name of the location")
+    location_type: Optional[LocationTypeEnum] = Field(None, description="Kind of location")
+    parent_id: Optional[int] = Field(None, description="ID of the enclosing location")
+
+
+class Location(LocationBase):
+    """Standard schema for location response."""
+    id: int
+    project_id: int
+    article_id: Optional[int] = Field(None, description="Article ID of the settlement this location represents")
+    depth: int = Field(0, description="Number of enclosing locations")
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class LocationMember(BaseModel):
+    """Schema for a person or settlement placed somewhere in a location's subtree."""
+    id: int = Field(..., description="Article ID")
+    name: str
+    location_id: int = Field(..., description="The location it is linked to, at or below the queried one")
+    location_name: str
+
+
+class LocationMemberPage(BaseModel):
+    """Schema for a page of persons or settlements within a location."""
+    items: List[LocationMember]
+    total: int = Field(..., description="Number of matches anywhere within the location")
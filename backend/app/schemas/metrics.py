@@ -0,0 +1,23 @@
+"""
+Monitoring Pydantic schemas for API responses.
+"""
+
+from pydantic import BaseModel, Field
+
+
+class CacheStatsResponse(BaseModel):
+    """Schema for payload cache counters."""
+    hits: int
+    misses: int
+    hit_rate: float = Field(..., description="Hits as a fraction of all lookups")
+    evictions: int = Field(..., description="Entries dropped to stay within max_entries")
+    expirations: int = Field(..., description="Entries dropped after outliving the TTL")
+    invalidations: int = Field(..., description="Entities dropped because they were written")
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    shared_enabled: bool = Field(..., description="Whether a shared cache tier is attached")
+    shared_hits: int = Field(..., description="Local misses served from the shared tier")
+    shared_misses: int
+    invalidations_published: int = Field(..., description="Invalidations broadcast to other workers")
+    invalidations_received: int = Field(..., description="Invalidations received from other workers")
@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import List, Optional
 from enum import Enum
+from app.schemas.facets import Facets
 
 
 class GenderEnum(str, Enum):
@@ -130,4 +131,44 @@ class Person(PersonBase):
     updated_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+
+class PersonRelationshipEdge(BaseModel):
+    """Schema for a relationship between two persons."""
+    source_id: int = Field(..., description="ID of the person who lists the relationship")
+    target_id: Optional[int] = Field(None, description="ID of the related person, if the name matches one")
+    target_name: str = Field(..., description="Name of the related person as written")
+    relationship_type: str
+    description: Optional[str] = None
+    status: str
+
+    class Config:
+        from_attributes = True
+
+
+class PersonNode(BaseModel):
+    """Schema for a person in a relationship graph."""
+    id: int
+    name: str
+    depth: int = Field(..., description="Number of relationships away from the starting person")
+
+
+class PersonNetwork(BaseModel):
+    """Schema for the persons around a starting person and the relationships between them."""
+    root_id: int
+    nodes: List[PersonNode]
+    edges: List[PersonRelationshipEdge]
+
+
+class PersonPath(BaseModel):
+    """Schema for the shortest chain of relationships between two persons."""
+    nodes: List[PersonNode] = Field(..., description="Persons along the path, from start to end")
+    edges: List[PersonRelationshipEdge] = Field(..., description="A relationship between each consecutive pair")
+
+class PersonSearchResponse(BaseModel):
+    """Schema for a page of faceted person search results."""
+    items: List[Person] = Field(..., description="Persons on this page")
+    total: int = Field(..., description="Number of persons matching all filters")
+    facets: Facets = Field(..., description="Value counts per facet, each ignoring its own selection")
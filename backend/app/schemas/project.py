@@ -1,14 +1,29 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
+from .article import ArticleSummary
+from .image import ImageStorageUsage
 
 if TYPE_CHECKING:
     from .article import Article
 
 
+class CalendarEra(BaseModel):
+    name: str = Field(..., min_length=1, description="Era name or abbreviation as written in dates (e.g. 'DR')")
+    start_year: int = Field(0, description="Absolute year that year 0 of this era falls on")
+    reverse: bool = Field(False, description="Whether years count down towards start_year (e.g. BC)")
+
+
+class ProjectCalendar(BaseModel):
+    eras: List[CalendarEra] = Field(default_factory=list, description="Eras; BC/BCE/AD/CE when empty")
+    months: Optional[List[str]] = Field(None, max_length=99, description="Month names in order; Gregorian when unset")
+    default_era: Optional[str] = Field(None, description="Era assumed for dates that name none")
+
+
 class ProjectBase(BaseModel):
     name: str
     description: Optional[str] = None
+    calendar: Optional[ProjectCalendar] = Field(None, description="Calendar used to order dates on the timeline")
 
 
 class ProjectCreate(ProjectBase):
@@ -18,6 +33,7 @@ class ProjectCreate(ProjectBase):
 class ProjectUpdate(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
+    calendar: Optional[ProjectCalendar] = None
 
 
 class Project(ProjectBase):
@@ -29,6 +45,54 @@ class Project(ProjectBase):
     class Config:
         from_attributes = True
 
+class ProjectClone(BaseModel):
+    name: Optional[str] = Field(None, description="Name of the new project (defaults to '<name> (copy)')")
+
+
+class ProjectStats(BaseModel):
+    project_id: int
+    article_count: int = Field(..., description="Number of articles, including persons and settlements")
+    person_count: int
+    settlement_count: int
+    image_count: int
+    image_bytes: int = Field(..., description="Total size of the project's images in bytes")
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectOverview(BaseModel):
+    project_id: int
+    name: str
+    article_counts: Dict[str, int] = Field(..., description="Number of articles per article type")
+    recent_articles: List[ArticleSummary] = Field(..., description="Most recently updated articles, newest first")
+    person_life_status: Dict[str, int] = Field(..., description="Number of persons per life status")
+    settlement_types: Dict[str, int] = Field(..., description="Number of settlements per settlement type")
+    storage: ImageStorageUsage
+
+
+class TimelineEvent(BaseModel):
+    id: int
+    article_id: int
+    article_title: str
+    article_type: str
+    kind: str = Field(..., description="birth, death, event or founded")
+    label: str
+    date: str = Field(..., description="Date as written on the article")
+    sort_key: int = Field(..., description="Position on the project calendar")
+    year: int = Field(..., description="Absolute year on the project calendar")
+
+
+class TimelinePage(BaseModel):
+    items: List[TimelineEvent]
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to fetch the next page; null on the last page")
+
+
+class ProjectImportResult(BaseModel):
+    project_id: int = Field(..., description="ID of the newly created project")
+    counts: Dict[str, int] = Field(default_factory=dict, description="Imported row counts by record type")
+
+
 # Resolve forward references for Pydantic v2
 try:
     from .article import Article  # noqa: F401
@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from enum import Enum
+from app.schemas.facets import Facets
 
 
 class SettlementTypeEnum(str, Enum):
@@ -34,6 +35,12 @@ class GovernmentTypeEnum(str, Enum):
     DICTATORSHIP = "dictatorship"
 
 
+class Coordinates(BaseModel):
+    """Schema for a map position in degrees."""
+    lat: float = Field(..., ge=-90, le=90, description="Latitude")
+    lng: float = Field(..., ge=-180, le=180, description="Longitude")
+
+
 class SettlementBase(BaseModel):
     """Base schema for settlement data."""
     name: str = Field(..., description="Name of the settlement")
@@ -48,6 +55,7 @@ class SettlementBase(BaseModel):
 class SettlementCreate(SettlementBase):
     """Schema for creating a new settlement."""
     project_id: int = Field(..., description="ID of the project this settlement belongs to")
+    coordinates: Optional[Coordinates] = Field(None, description="Map position")
 
 
 class SettlementUpdate(BaseModel):
@@ -59,6 +67,7 @@ class SettlementUpdate(BaseModel):
     government_type: Optional[GovernmentTypeEnum] = Field(None, description="Type of government")
     region: Optional[str] = Field(None, description="Region or area where settlement is located")
     ruler_name: Optional[str] = Field(None, description="Name of the current ruler or leader")
+    coordinates: Optional[Coordinates] = Field(None, description="Map position")
 
 
 class SettlementDetailed(SettlementBase):
@@ -118,4 +127,82 @@ class SettlementSummary(BaseModel):
     population_category: str = Field(..., description="Population size category (tiny, small, medium, etc.)")
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class PopulationCategoryEnum(str, Enum):
+    """Population size categories for API."""
+    TINY = "tiny"
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
+    VERY_LARGE = "very_large"
+    MASSIVE = "massive"
+    UNKNOWN = "unknown"
+
+
+class PopulationBucket(BaseModel):
+    """Schema for one population category in a histogram."""
+    category: PopulationCategoryEnum
+    min_population: Optional[int] = Field(None, description="Smallest population in the category")
+    max_population: Optional[int] = Field(None, description="Exclusive upper bound, null if open-ended")
+    count: int = Field(..., description="Number of matching settlements in the category")
+
+
+class SettlementExplorerResponse(BaseModel):
+    """Schema for a page of settlement explorer results."""
+    items: List[Settlement] = Field(..., description="Settlements on this page")
+    total: int = Field(..., description="Number of settlements matching all filters")
+    facets: Facets = Field(..., description="Value counts per facet, each ignoring its own selection")
+    population_histogram: List[PopulationBucket] = Field(
+        ..., description="Matching settlements per population category, ignoring the population filter"
+    )
+
+
+class SettlementMapPoint(BaseModel):
+    """Schema for a settlement marker on the map."""
+    id: int
+    name: str
+    settlement_type: SettlementTypeEnum
+    population: Optional[int] = None
+    latitude: float
+    longitude: float
+
+    class Config:
+        from_attributes = True
+
+
+class SettlementDistance(SettlementMapPoint):
+    """Schema for a settlement marker with its distance from a query point."""
+    distance_km: float = Field(..., description="Great-circle distance in kilometres")
+
+
+class TradeRouteStop(BaseModel):
+    """Schema for a settlement along a trade route."""
+    id: int
+    name: str
+    distance_km: float = Field(..., description="Distance travelled from the start of the route")
+
+
+class TradeRoute(BaseModel):
+    """Schema for the shortest trade route between two settlements."""
+    stops: List[TradeRouteStop] = Field(..., description="Settlements along the route, from start to end")
+    hops: int
+    distance_km: float
+    estimated: bool = Field(..., description="True if a leg lacked coordinates and used the average leg length")
+
+
+class TradeComponent(BaseModel):
+    """Schema for a group of settlements connected by trade routes."""
+    size: int
+    settlement_ids: List[int]
+    trade_goods: List[str] = Field(..., description="Goods traded anywhere in the group")
+
+
+class TradeHub(BaseModel):
+    """Schema for a settlement ranked by its place in the trade network."""
+    id: int
+    name: str
+    degree: int = Field(..., description="Number of direct trade routes")
+    hub_score: float = Field(..., description="PageRank over routes weighted by inverse distance")
+    trade_goods: List[str] = []
@@ -1,8 +1,34 @@
+from dataclasses import asdict
 from sqlalchemy.orm import Session
+from app.core.cache import entity_cache
 from app.domain.models.article import Article, ArticleContent, ArticleType
-from app.repositories.article_repository import ArticleRepository
-from app.schemas.article import ArticleCreate, ArticleUpdate
-from typing import Optional, List
+from app.db.models.article import ArticleDB
+from app.domain.models.person import Person
+from app.domain.models.settlement import Settlement
+from app.repositories.article_link_repository import ArticleLinkRepository
+from app.repositories.article_repository import ArticleRepository, PROJECTABLE_COLUMNS, normalize_tag
+from app.repositories.location_repository import LocationRepository
+from app.repositories.person_repository import PersonRepository
+from app.repositories.settlement_repository import SettlementRepository
+from app.services import related_articles, title_index
+from app.services.image_service import to_header_image
+from app.schemas.article import (
+    Article as ArticleSchema, ArticleCreate, ArticleReference, ArticleSummary, ArticleUpdate, RelatedArticle, TagCount,
+)
+from typing import Any, Dict, Optional, List, Sequence, Tuple, Union
+
+ARTICLE_SUMMARY_FIELDS = ("id", "title", "article_type", "project_id", "summary", "word_count", "created_at", "updated_at")
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when a field projection names fields that can't be selected."""
+    pass
+
+
+def _tag_list(tags: Optional[Sequence[str]]) -> Optional[List[str]]:
+    """Drop blank tags; None when no filter is left."""
+    tags = [tag for tag in tags or [] if normalize_tag(tag)]
+    return tags or None
 
 
 class ArticleService:
@@ -10,22 +36,216 @@ class ArticleService:
 
     def __init__(self, db: Session):
         self.repository = ArticleRepository(db)
+        self.person_repository = PersonRepository(db)
+        self.settlement_repository = SettlementRepository(db)
+        self.location_repository = LocationRepository(db)
+        self.link_repository = ArticleLinkRepository(db)
 
-    def get_article(self, article_id: int) -> Optional[Article]:
+    def _to_domain(self, db_article: ArticleDB, include_header_image: bool = False) -> Article:
+        """Convert to domain, optionally embedding the already-loaded header image."""
+        article = self.repository.to_domain(db_article)
+        if include_header_image and db_article.header_image is not None:
+            article.header_image = to_header_image(db_article.header_image)
+        return article
+
+    def get_article(self, article_id: int, include_header_image: bool = False) -> Optional[Article]:
         """Get an article by ID."""
         db_article = self.repository.get_with_header_image(article_id)
         if db_article:
-            return self.repository.to_domain(db_article)
+            return self._to_domain(db_article, include_header_image)
         return None
 
-    def get_articles(self, project_id: Optional[int] = None, skip: int = 0, limit: int = 100) -> List[Article]:
-        """Get articles with optional project filtering."""
+    def get_typed_article(self, article_id: int) -> Optional[Union[Person, Settlement, Article]]:
+        """
+        Get an article as its most specific domain type.
+
+        Returns a Person or Settlement when the article has one, otherwise the
+        plain Article; the header image is embedded in every case.
+        """
+        db_article = self.repository.get_typed(article_id)
+        if db_article is None:
+            return None
+
+        if db_article.person is not None:
+            typed = self.person_repository.to_domain(db_article.person)
+        elif db_article.settlement is not None:
+            typed = self.settlement_repository.to_domain(db_article.settlement)
+        else:
+            return self._to_domain(db_article, include_header_image=True)
+
+        if db_article.header_image is not None:
+            typed.article.header_image = to_header_image(db_article.header_image)
+        return typed
+
+    def get_article_json(
+        self, article_id: int, version: Tuple[Any, ...], include_header_image: bool = False
+    ) -> Optional[bytes]:
+        """
+        Get an article serialized as JSON, served from the payload cache when the
+        cached copy matches ``version`` (as returned by get_article_version).
+        """
+        payload = entity_cache.get("article", article_id, version, variant=include_header_image)
+        if payload is not None:
+            return payload
+
+        article = self.get_article(article_id, include_header_image)
+        if article is None:
+            return None
+        payload = ArticleSchema.model_validate(asdict(article)).model_dump_json().encode("utf-8")
+        entity_cache.set("article", article_id, version, payload, variant=include_header_image)
+        return payload
+
+    def get_articles_by_ids(self, article_ids: List[int], include_header_image: bool = False) -> Dict[int, Article]:
+        """Get articles by ID with a single query, keyed by ID."""
+        db_articles = self.repository.get_by_ids_with_header_images(list(set(article_ids)))
+        return {db_article.id: self._to_domain(db_article, include_header_image) for db_article in db_articles}
+
+    def get_articles(
+        self,
+        project_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+        include_header_image: bool = False,
+        tags: Optional[Sequence[str]] = None,
+        match_all: bool = True,
+    ) -> List[Article]:
+        """Get articles with optional project and tag filtering."""
+        tags = _tag_list(tags)
         if project_id:
-            db_articles = self.repository.get_by_project_with_header_images(project_id, skip, limit)
+            db_articles = self.repository.get_by_project_with_header_images(project_id, skip, limit, tags, match_all)
+        elif include_header_image or tags:
+            db_articles = self.repository.get_all_with_header_images(skip, limit, tags, match_all)
         else:
             db_articles = self.repository.get_all(skip, limit)
         
-        return [self.repository.to_domain(db_article) for db_article in db_articles]
+        return [self._to_domain(db_article, include_header_image) for db_article in db_articles]
+
+    def get_article_summaries(
+        self,
+        project_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+        tags: Optional[Sequence[str]] = None,
+        match_all: bool = True,
+    ) -> List[ArticleSummary]:
+        """Get article summaries without loading article bodies."""
+        rows = self.repository.get_projection(
+            ARTICLE_SUMMARY_FIELDS, project_id, skip, limit, tags=_tag_list(tags), match_all=match_all
+        )
+        return [ArticleSummary.model_validate(row) for row in rows]
+
+    def get_recent_article_summaries(self, project_id: int, limit: int = 10) -> List[ArticleSummary]:
+        """Get summaries of a project's most recently updated articles."""
+        rows = self.repository.get_projection(ARTICLE_SUMMARY_FIELDS, project_id, 0, limit, newest_first=True)
+        return [ArticleSummary.model_validate(row) for row in rows]
+
+    def get_tag_counts(self, project_id: int, limit: int = 100) -> List[TagCount]:
+        """Get a project's most used tags with how many articles carry each."""
+        return [TagCount(tag=tag, count=count) for tag, count in self.repository.get_tag_counts(project_id, limit)]
+
+    def get_backlinks(self, article_id: int, skip: int = 0, limit: int = 100) -> List[ArticleReference]:
+        """Get the articles that link to an article."""
+        return [
+            ArticleReference(id=id, title=title, article_type=article_type)
+            for id, title, article_type in self.link_repository.get_backlinks(article_id, skip, limit)
+        ]
+
+    def _get_title_index(self, project_id: int) -> title_index.TitleIndex:
+        """Get the project's title index, patching or rebuilding it if articles changed since it was built."""
+        signature = self.repository.get_change_version(project_id)
+        index = title_index.get_cached_index(project_id)
+        if index is not None and index.signature == signature:
+            return index
+
+        count, _ = signature
+        if index is not None:
+            # Only articles written after the index's version need re-reading; if
+            # it then holds more articles than the project, some were deleted
+            index = index.with_rows(self.repository.get_titles(project_id, index.signature[1]), signature)
+            if len(index) == count:
+                title_index.store_index(project_id, index)
+                return index
+
+        index = title_index.TitleIndex(self.repository.get_titles(project_id), signature)
+        title_index.store_index(project_id, index)
+        return index
+
+    def autocomplete_titles(self, project_id: int, prefix: str, limit: int = 10) -> List[ArticleReference]:
+        """Get a project's articles whose title starts with a prefix, case-insensitively, in title order."""
+        if title_index.enabled():
+            rows = self._get_title_index(project_id).search(prefix, limit)
+        else:
+            rows = self.repository.get_titles_by_prefix(project_id, prefix, limit)
+        return [ArticleReference(id=id, title=title, article_type=article_type) for id, title, article_type in rows]
+
+    def _get_related_index(self, project_id: int) -> related_articles.RelatedArticleIndex:
+        """Get the project's article vectors, re-vectorizing articles changed since they were built."""
+        signature = self.repository.get_change_version(project_id)
+        index = related_articles.get_cached_index(project_id)
+        if index is not None and index.signature == signature:
+            return index
+
+        with related_articles.build_lock(project_id):
+            # Another request may have brought the index up to date while this one waited
+            index = related_articles.get_cached_index(project_id)
+            if index is not None and index.signature == signature:
+                return index
+
+            count, _ = signature
+            if index is not None:
+                index.update(self.repository.get_texts(project_id, index.signature[1]), signature)
+                if len(index) == count and not index.needs_rebuild():
+                    return index
+
+            index = related_articles.RelatedArticleIndex(self.repository.get_texts(project_id), signature)
+            related_articles.store_index(project_id, index)
+            return index
+
+    def get_related_articles(self, article_id: int, limit: int = 10) -> Optional[List[RelatedArticle]]:
+        """Get the articles in the same project whose text is most similar to an article's, best first."""
+        db_article = self.repository.get_by_id(article_id)
+        if not db_article:
+            return None
+        matches = self._get_related_index(db_article.project_id).related(article_id, limit) or []
+        # Looked up afresh, since the index may still hold articles another worker deleted
+        found = {db_match.id: db_match for db_match in self.repository.get_by_ids([id for id, _ in matches])}
+        return [
+            RelatedArticle(id=id, title=found[id].title, article_type=found[id].article_type, score=score)
+            for id, score in matches
+            if id in found
+        ]
+
+    def get_article_type_counts(self, project_id: int) -> Dict[str, int]:
+        """Count a project's articles per article type."""
+        return self.repository.count_by_type(project_id)
+
+    def get_article_fields(
+        self,
+        fields: Sequence[str],
+        project_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+        tags: Optional[Sequence[str]] = None,
+        match_all: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Get only the requested fields of each article; the ID is always included."""
+        unknown = [field for field in fields if field not in PROJECTABLE_COLUMNS]
+        if unknown:
+            raise InvalidFieldsError(
+                f"Unknown fields: {', '.join(unknown)}. Allowed fields: {', '.join(PROJECTABLE_COLUMNS)}"
+            )
+        selected = ["id"] + [field for field in dict.fromkeys(fields) if field != "id"]
+        return self.repository.get_projection(
+            selected, project_id, skip, limit, tags=_tag_list(tags), match_all=match_all
+        )
+
+    def get_article_version(self, article_id: int) -> Optional[Tuple[Any, ...]]:
+        """Get the cheap validator tuple for an article, or None if it doesn't exist."""
+        return self.repository.get_version(article_id)
+
+    def get_articles_version(self, project_id: Optional[int] = None) -> Tuple[Any, ...]:
+        """Get the aggregate validator tuple for an article listing."""
+        return self.repository.get_collection_version(project_id)
 
     def get_articles_by_type(self, article_type: str, skip: int = 0, limit: int = 100) -> List[Article]:
         """Get articles by type."""
@@ -64,6 +284,10 @@ class ArticleService:
         # Update fields that are provided
         if article_data.title is not None:
             current_article.title = article_data.title
+            self.location_repository.rename_for_article(article_id, article_data.title)
+            self.person_repository.resolve_relationship_targets(
+                article_id, current_article.project_id, article_data.title
+            )
         if article_data.content is not None:
             current_article.content = article_data.content
         if article_data.article_type is not None:
@@ -71,7 +295,9 @@ class ArticleService:
         if article_data.header_image_id is not None:
             current_article.header_image_id = article_data.header_image_id
 
-        return self.repository.update_from_domain(current_article)
+        article = self.repository.update_from_domain(current_article)
+        entity_cache.publish_invalidation("article", article_id)
+        return article
 
     def delete_article(self, article_id: int) -> Optional[Article]:
         """Delete an article."""
@@ -79,6 +305,8 @@ class ArticleService:
         article = self.get_article(article_id)
         if article:
             self.repository.delete(article_id)
+            related_articles.remove_article(article.project_id, article_id)
+            entity_cache.publish_invalidation("article", article_id)
         return article
 
 
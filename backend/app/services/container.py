@@ -11,6 +11,8 @@ from app.services.article_service import ArticleService
 from app.services.image_service import ImageService
 from app.services.person_service import PersonService
 from app.services.settlement_service import SettlementService
+from app.services.location_service import LocationService
+from app.services.timeline_service import TimelineService
 
 
 class ServiceContainer:
@@ -30,6 +32,8 @@ class ServiceContainer:
         self.images = ImageService(db)
         self.people = PersonService(db)
         self.settlements = SettlementService(db)
+        self.locations = LocationService(db)
+        self.timeline = TimelineService(db)
 
     @property
     def db(self) -> Session:
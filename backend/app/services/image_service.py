@@ -2,18 +2,29 @@
 Image service for handling image storage operations.
 """
 
+import io
 import os
 import uuid
 import shutil
-from typing import Optional, List, BinaryIO
+from typing import Any, Optional, List, BinaryIO, Tuple
 from pathlib import Path
 from PIL import Image
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.db.database import SessionLocal
 from app.repositories.image_repository import ImageRepository
 from app.db.models.image import ImageDB
-from app.schemas.image import ImageCreate, ImageUpdate, ImageResponse, ImageListResponse
+from app.domain.models.article import HeaderImage
+from app.schemas.image import (
+    ImageCreate,
+    ImageUpdate,
+    ImageResponse,
+    ImageListResponse,
+    SimilarImage,
+    SimilarImagesResponse,
+)
+from app.services import image_similarity
 
 
 class ImageStorageError(Exception):
@@ -21,6 +32,76 @@ class ImageStorageError(Exception):
     pass
 
 
+def get_image_url(image: ImageDB) -> str:
+    """Generate URL for accessing an image."""
+    if image.is_s3_stored and settings.S3_BASE_URL:
+        return f"{settings.S3_BASE_URL}/{image.file_path}"
+    # For local storage, return a relative URL that the API will serve
+    return f"{settings.API_V1_STR}/images/{image.filename}/file"
+
+
+def get_thumbnail_url(image: ImageDB) -> Optional[str]:
+    """Generate URL for an image's thumbnail (only served for local storage)."""
+    if image.is_s3_stored:
+        return None
+    return f"{settings.API_V1_STR}/images/{image.filename}/thumbnail"
+
+
+def get_thumbnail_path(filename: str) -> Path:
+    """Local path of the generated thumbnail for an image filename."""
+    thumbnail_name = f"{Path(filename).stem}_{settings.THUMBNAIL_SIZE}.webp"
+    return Path(settings.LOCAL_IMAGES_PATH) / "thumbnails" / thumbnail_name
+
+
+CLEANUP_BATCH_SIZE = 1000
+
+
+def cleanup_image_files(file_refs: List[Tuple[str, str, bool]]) -> dict:
+    """
+    Remove stored files for deleted image rows.
+
+    Meant to run as a background job after a set-based delete. Files still
+    referenced by another image row (e.g. a cloned project) are kept.
+    """
+    removed = kept = skipped = 0
+    db = SessionLocal()
+    try:
+        repository = ImageRepository(db)
+        for start in range(0, len(file_refs), CLEANUP_BATCH_SIZE):
+            batch = file_refs[start:start + CLEANUP_BATCH_SIZE]
+            still_referenced = repository.get_referenced_file_paths([file_path for file_path, _, _ in batch])
+            for file_path, filename, is_s3_stored in batch:
+                if file_path in still_referenced:
+                    kept += 1
+                elif is_s3_stored:
+                    # S3 deletion is not implemented yet
+                    skipped += 1
+                else:
+                    for path in (file_path, get_thumbnail_path(filename)):
+                        try:
+                            os.remove(path)
+                        except FileNotFoundError:
+                            pass
+                    removed += 1
+    finally:
+        db.close()
+
+    return {"removed": removed, "kept": kept, "skipped": skipped}
+
+
+def to_header_image(image: ImageDB) -> HeaderImage:
+    """Build the embeddable header image details for an already-loaded image row."""
+    return HeaderImage(
+        id=image.id,
+        url=get_image_url(image),
+        width=image.width,
+        height=image.height,
+        alt_text=image.alt_text,
+        placeholder=image.placeholder_color,
+        thumbnail_url=get_thumbnail_url(image),
+    )
+
+
 class ImageService:
     """Service for managing image operations."""
 
@@ -48,6 +129,15 @@ class ImageService:
         except Exception:
             return None, None
 
+    def _get_placeholder_color(self, file_content: bytes) -> Optional[str]:
+        """Get the image's average colour as a hex string for loading placeholders."""
+        try:
+            with Image.open(io.BytesIO(file_content)) as img:
+                red, green, blue = img.convert("RGB").resize((1, 1), Image.Resampling.BOX).getpixel((0, 0))
+                return f"#{red:02x}{green:02x}{blue:02x}"
+        except Exception:
+            return None
+
     def _validate_image_file(self, file_content: bytes, mime_type: str) -> None:
         """Validate image file size and type."""
         # Check file size
@@ -76,6 +166,10 @@ class ImageService:
         # For now, we'll raise an error to indicate it needs implementation
         raise NotImplementedError("S3 storage not yet implemented. Please install boto3 and implement S3 upload logic.")
 
+    def _thumbnail_path(self, image: ImageDB) -> Path:
+        """Local path of an image's generated thumbnail."""
+        return get_thumbnail_path(image.filename)
+
     def _delete_local(self, file_path: str) -> None:
         """Delete local image file."""
         try:
@@ -122,6 +216,9 @@ class ImageService:
             # For S3, we'd need to analyze the image before upload
             width, height = None, None
 
+        perceptual_hash = image_similarity.compute_dhash_from_bytes(file_content)
+        placeholder_color = self._get_placeholder_color(file_content)
+
         # Create database record
         image_data = {
             "filename": filename,
@@ -134,14 +231,30 @@ class ImageService:
             "alt_text": alt_text,
             "is_s3_stored": is_s3_stored,
             "s3_bucket": s3_bucket,
+            "perceptual_hash": perceptual_hash,
+            "placeholder_color": placeholder_color,
             "project_id": project_id,
         }
 
-        return self.repository.create(image_data)
+        image = self.repository.create(ImageDB(**image_data))
+        image_similarity.invalidate_index(project_id)
+        return image
 
     def get_image(self, image_id: int) -> Optional[ImageDB]:
         """Get image by ID."""
-        return self.repository.get(image_id)
+        return self.repository.get_by_id(image_id)
+
+    def get_image_version(self, image_id: int) -> Optional[Tuple[Any, ...]]:
+        """Get the cheap validator tuple for an image, or None if it doesn't exist."""
+        return self.repository.get_version(image_id)
+
+    def get_images_version(self, project_id: int) -> Tuple[Any, ...]:
+        """Get the aggregate validator tuple for a project's image listing."""
+        return self.repository.get_collection_version(ImageDB.project_id == project_id)
+
+    def get_images_by_ids(self, image_ids: List[int]) -> dict[int, ImageDB]:
+        """Get images by ID with a single query, keyed by ID."""
+        return {image.id: image for image in self.repository.get_by_ids(list(set(image_ids)))}
 
     def get_image_by_filename(self, filename: str) -> Optional[ImageDB]:
         """Get image by filename."""
@@ -152,7 +265,7 @@ class ImageService:
     ) -> ImageListResponse:
         """Get paginated list of images for a project."""
         images = self.repository.get_by_project_id(project_id, skip, limit)
-        total = self.repository.count_by_project_id(project_id)
+        total, _ = self.repository.get_project_totals(project_id)
         
         total_pages = (total + limit - 1) // limit if total > 0 else 0
         current_page = (skip // limit) + 1
@@ -171,25 +284,87 @@ class ImageService:
 
     def delete_image(self, image_id: int) -> bool:
         """Delete image and its file."""
-        image = self.repository.get(image_id)
+        image = self.repository.get_by_id(image_id)
         if not image:
             return False
 
-        # Delete the file
-        if image.is_s3_stored:
-            if image.s3_bucket:
-                self._delete_s3(image.file_path, image.s3_bucket)
-        else:
-            self._delete_local(image.file_path)
+        # Delete the file, unless another image row (e.g. in a cloned project) still uses it
+        is_file_shared = self.repository.count_by_file_path(image.file_path) > 1
+        if not is_file_shared:
+            if image.is_s3_stored:
+                if image.s3_bucket:
+                    self._delete_s3(image.file_path, image.s3_bucket)
+            else:
+                self._delete_local(image.file_path)
+                self._delete_local(str(self._thumbnail_path(image)))
 
         # Delete database record
-        return self.repository.delete(image_id)
+        project_id = image.project_id
+        deleted = self.repository.delete(image_id)
+        image_similarity.invalidate_index(project_id)
+        return deleted is not None
+
+    def _backfill_perceptual_hashes(self, project_id: int) -> None:
+        """Hash locally stored images uploaded before perceptual hashing existed."""
+        unhashed = self.repository.get_unhashed_local_by_project_id(project_id)
+        if not unhashed:
+            return
+
+        for image in unhashed:
+            try:
+                with Image.open(image.file_path) as img:
+                    image.perceptual_hash = image_similarity.compute_dhash(img)
+            except Exception:
+                continue
+        self.db.commit()
+
+    def _get_hash_index(self, project_id: int) -> image_similarity.PerceptualHashIndex:
+        """Get the project's hash index, rebuilding it if images changed since it was built."""
+        signature = self.repository.get_hash_signature_by_project_id(project_id)
+        index = image_similarity.get_cached_index(project_id, signature)
+        if index is not None:
+            return index
+
+        self._backfill_perceptual_hashes(project_id)
+        index = image_similarity.PerceptualHashIndex(
+            self.repository.get_hashes_by_project_id(project_id), signature
+        )
+        image_similarity.store_index(project_id, index)
+        return index
+
+    def find_similar_images(
+        self, project_id: int, image_id: int, max_distance: int = 10, limit: int = 20
+    ) -> Optional[SimilarImagesResponse]:
+        """Find near-duplicates of an image within its project by perceptual hash distance."""
+        image = self.repository.get_by_id(image_id)
+        if not image or image.project_id != project_id:
+            return None
+
+        index = self._get_hash_index(project_id)
+        # The index build may have backfilled this image's hash
+        if image.perceptual_hash is None:
+            self.db.refresh(image)
+        if image.perceptual_hash is None:
+            raise ImageStorageError("Image could not be hashed for similarity search")
+
+        matches = index.query(image.perceptual_hash, max_distance, limit, exclude_id=image.id)
+        images_by_id = {img.id: img for img in self.repository.get_by_ids([match_id for match_id, _ in matches])}
+
+        return SimilarImagesResponse(
+            image_id=image.id,
+            project_id=project_id,
+            max_distance=max_distance,
+            results=[
+                SimilarImage(image=ImageResponse.from_orm(images_by_id[match_id]), distance=distance)
+                for match_id, distance in matches
+                if match_id in images_by_id
+            ],
+        )
 
     def get_project_storage_usage(self, project_id: int) -> dict:
         """Get storage usage statistics for a project."""
-        total_images = self.repository.count_by_project_id(project_id)
-        total_size = self.repository.get_total_size_by_project_id(project_id)
-        
+        total_images, total_size = self.repository.get_project_totals(project_id)
+
         return {
             "project_id": project_id,
             "total_images": total_images,
@@ -199,8 +374,26 @@ class ImageService:
 
     def get_image_url(self, image: ImageDB) -> str:
         """Generate URL for accessing an image."""
-        if image.is_s3_stored and settings.S3_BASE_URL:
-            return f"{settings.S3_BASE_URL}/{image.file_path}"
-        else:
-            # For local storage, return a relative URL that the API will serve
-            return f"/api/v1/images/{image.filename}/file"
\ No newline at end of file
+        return get_image_url(image)
+
+    def get_thumbnail_path(self, image: ImageDB) -> str:
+        """Get the local thumbnail path for an image, generating it on first request."""
+        if image.is_s3_stored:
+            raise ImageStorageError("Thumbnails are only generated for locally stored images")
+
+        thumbnail_path = self._thumbnail_path(image)
+        if thumbnail_path.exists():
+            return str(thumbnail_path)
+
+        thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with Image.open(image.file_path) as img:
+                img.thumbnail((settings.THUMBNAIL_SIZE, settings.THUMBNAIL_SIZE))
+                # Write to a temp name first so concurrent requests never serve a partial file
+                temp_path = thumbnail_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+                img.save(temp_path, format="WEBP")
+                os.replace(temp_path, thumbnail_path)
+        except Exception as e:
+            raise ImageStorageError(f"Failed to generate thumbnail: {str(e)}")
+
+        return str(thumbnail_path)
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Perceptual hashing and near-duplicate lookup for images.
+
+Each image gets a 64-bit difference hash (dHash) which is stable across
+re-encodes, resizes and small crops. Hashes for a project are kept in a
+packed uint64 array so a similarity query is a single vectorized XOR +
+popcount over the whole project.
+"""
+
+import io
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+HASH_SIZE = 8  # 8x8 comparisons -> 64-bit hash
+_SIGN_BIT = 1 << 63
+_UINT64_RANGE = 1 << 64
+
+
+def compute_dhash(image: Image.Image) -> int:
+    """Compute a 64-bit dHash for a PIL image, returned as a signed int64."""
+    grayscale = image.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.LANCZOS)
+    pixels = np.asarray(grayscale, dtype=np.int16)
+    bits = pixels[:, 1:] > pixels[:, :-1]
+    value = int.from_bytes(np.packbits(bits).tobytes(), "big")
+    # PostgreSQL BIGINT is signed, so store the two's complement form
+    return value - _UINT64_RANGE if value & _SIGN_BIT else value
+
+
+def compute_dhash_from_bytes(file_content: bytes) -> Optional[int]:
+    """Compute a dHash from raw image bytes, or None if the image can't be decoded."""
+    try:
+        with Image.open(io.BytesIO(file_content)) as img:
+            return compute_dhash(img)
+    except Exception:
+        return None
+
+
+class PerceptualHashIndex:
+    """In-memory index of perceptual hashes for a single project."""
+
+    def __init__(self, entries: Iterable[Tuple[int, int]], signature: Tuple[int, int]):
+        pairs = list(entries)
+        self.signature = signature
+        self._ids = np.fromiter((image_id for image_id, _ in pairs), dtype=np.int64, count=len(pairs))
+        self._hashes = np.fromiter(
+            (phash for _, phash in pairs), dtype=np.int64, count=len(pairs)
+        ).view(np.uint64)
+
+    def __len__(self) -> int:
+        return int(self._ids.shape[0])
+
+    def query(
+        self, phash: int, max_distance: int, limit: int, exclude_id: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """Return (image_id, hamming_distance) pairs within max_distance, closest first."""
+        if not len(self):
+            return []
+
+        target = np.array([phash], dtype=np.int64).view(np.uint64)[0]
+        distances = np.bitwise_count(self._hashes ^ target)
+        mask = distances <= max_distance
+        if exclude_id is not None:
+            mask &= self._ids != exclude_id
+
+        candidates = np.flatnonzero(mask)
+        if candidates.size > limit:
+            nearest = np.argpartition(distances[candidates], limit - 1)[:limit]
+            candidates = candidates[nearest]
+        order = candidates[np.argsort(distances[candidates], kind="stable")]
+        return [(int(self._ids[i]), int(distances[i])) for i in order]
+
+
+_indexes: dict[int, PerceptualHashIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_cached_index(project_id: int, signature: Tuple[int, int]) -> Optional[PerceptualHashIndex]:
+    """Return the cached index for a project if it is still current."""
+    with _indexes_lock:
+        index = _indexes.get(project_id)
+    if index is not None and index.signature == signature:
+        return index
+    return None
+
+
+def store_index(project_id: int, index: PerceptualHashIndex) -> None:
+    """Cache a freshly built index for a project."""
+    with _indexes_lock:
+        _indexes[project_id] = index
+
+
+def invalidate_index(project_id: int) -> None:
+    """Drop the cached index for a project."""
+    with _indexes_lock:
+        _indexes.pop(project_id, None)
@@ -0,0 +1,22 @@
+"""
+Rebuilding of derived per-project indexes.
+
+Some tables are derived from article and person data and are normally kept in
+sync by repository writes. Bulk paths that insert rows directly with SQL
+(project import and clone) call ``reindex_project`` afterwards instead.
+"""
+
+from sqlalchemy.orm import Session
+
+from app.repositories.article_link_repository import ArticleLinkRepository
+from app.repositories.location_repository import LocationRepository
+from app.repositories.person_repository import PersonRepository
+from app.repositories.timeline_repository import TimelineRepository
+
+
+def reindex_project(db: Session, project_id: int) -> None:
+    """Rebuild every derived index for a project in the current transaction (the caller commits)."""
+    PersonRepository(db).rebuild_relationships(project_id)
+    LocationRepository(db).link_project(project_id)
+    TimelineRepository(db).rebuild_project(project_id)
+    ArticleLinkRepository(db).rebuild_project(project_id)
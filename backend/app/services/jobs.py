@@ -0,0 +1,85 @@
+"""
+Minimal in-process background job runner.
+
+Jobs run on a small thread pool and their status is kept in memory so the
+API can hand out a job ID and let clients poll for completion. Status is
+per-process; it is meant for best-effort housekeeping work, not durable queues.
+"""
+
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+MAX_TRACKED_JOBS = 1000
+
+
+class JobStatus(Enum):
+    """Lifecycle states of a background job."""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """A background job and its outcome."""
+    id: str
+    name: str
+    status: JobStatus = JobStatus.PENDING
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+
+class JobRunner:
+    """Runs callables in the background and tracks their status."""
+
+    def __init__(self, max_workers: int = 2):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jobs")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, name: str, func: Callable[[], Optional[Dict[str, Any]]]) -> Job:
+        """Schedule a job and return it immediately."""
+        job = Job(id=str(uuid.uuid4()), name=name)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, func)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a tracked job by ID."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, func: Callable[[], Optional[Dict[str, Any]]]) -> None:
+        job.status = JobStatus.RUNNING
+        try:
+            job.result = func()
+            job.status = JobStatus.SUCCEEDED
+        except Exception as e:
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+        finally:
+            job.finished_at = datetime.utcnow()
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs once too many are tracked."""
+        if len(self._jobs) < MAX_TRACKED_JOBS:
+            return
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished_at is not None),
+            key=lambda job: job.finished_at,
+        )
+        for job in finished[: len(self._jobs) - MAX_TRACKED_JOBS + 1]:
+            del self._jobs[job.id]
+
+
+job_runner = JobRunner()
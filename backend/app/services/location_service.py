@@ -0,0 +1,113 @@
+"""
+Location service for the location hierarchy and subtree queries.
+"""
+
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.db.models.location import LocationDB
+from app.repositories.location_repository import LocationRepository
+from app.schemas.location import (
+    Location as LocationSchema, LocationCreate, LocationMember, LocationMemberPage, LocationUpdate,
+)
+
+
+class InvalidLocationError(ValueError):
+    """Raised when a location change would break the hierarchy."""
+    pass
+
+
+class LocationService:
+    """Service layer for the location hierarchy."""
+
+    def __init__(self, db: Session):
+        self.repository = LocationRepository(db)
+
+    @staticmethod
+    def _to_schema(location: LocationDB, depth: int) -> LocationSchema:
+        return LocationSchema(
+            id=location.id,
+            project_id=location.project_id,
+            name=location.name,
+            location_type=location.location_type,
+            parent_id=location.parent_id,
+            article_id=location.article_id,
+            depth=depth,
+            created_at=location.created_at,
+            updated_at=location.updated_at,
+        )
+
+    def _check_parent(self, project_id: int, parent_id: Optional[int]) -> None:
+        if parent_id is None:
+            return
+        parent = self.repository.get_by_id(parent_id)
+        if parent is None or parent.project_id != project_id:
+            raise InvalidLocationError("Parent location not found in this project")
+
+    def get_locations(self, project_id: int) -> List[LocationSchema]:
+        """Get a project's whole hierarchy as a flat list in tree order."""
+        return [self._to_schema(location, depth) for location, depth in self.repository.get_by_project(project_id)]
+
+    def get_location(self, location_id: int) -> Optional[LocationSchema]:
+        """Get a location by ID."""
+        location = self.repository.get_by_id(location_id)
+        if location is None:
+            return None
+        return self._to_schema(location, self.repository.get_depth(location_id))
+
+    def get_ancestors(self, location_id: int) -> List[LocationSchema]:
+        """Get the locations enclosing a location, outermost first."""
+        ancestors = self.repository.get_ancestors(location_id)
+        return [self._to_schema(location, depth) for depth, location in enumerate(ancestors)]
+
+    def create_location(self, location_data: LocationCreate) -> LocationSchema:
+        """Create a location, optionally inside another one."""
+        self._check_parent(location_data.project_id, location_data.parent_id)
+        location = self.repository.add_node(
+            location_data.project_id, location_data.name.strip(), location_data.location_type.value, location_data.parent_id
+        )
+        self.repository.db.commit()
+        return self.get_location(location.id)
+
+    def update_location(self, location_id: int, location_data: LocationUpdate) -> Optional[LocationSchema]:
+        """Rename, retype or move a location (with everything inside it)."""
+        location = self.repository.get_by_id(location_id)
+        if location is None:
+            return None
+
+        if location_data.name is not None and location_data.name.strip() != location.name:
+            if location.article_id is not None:
+                raise InvalidLocationError("Settlement locations are named after their settlement")
+            location.name = location_data.name.strip()
+        if location_data.location_type is not None:
+            location.location_type = location_data.location_type.value
+        if "parent_id" in location_data.model_fields_set and location_data.parent_id != location.parent_id:
+            self._check_parent(location.project_id, location_data.parent_id)
+            try:
+                self.repository.move(location, location_data.parent_id)
+            except ValueError as e:
+                self.repository.db.rollback()
+                raise InvalidLocationError(str(e))
+
+        self.repository.db.commit()
+        return self.get_location(location_id)
+
+    def delete_location(self, location_id: int) -> bool:
+        """Delete a location; the locations inside it move up to its parent."""
+        location = self.repository.get_by_id(location_id)
+        if location is None:
+            return False
+        self.repository.remove(location)
+        self.repository.db.commit()
+        return True
+
+    def get_persons_within(
+        self, location_id: int, skip: int = 0, limit: int = 100, birthplace: bool = False
+    ) -> LocationMemberPage:
+        """Get persons living (or born) anywhere within a location."""
+        rows, total = self.repository.get_persons_within(location_id, skip, limit, birthplace)
+        return LocationMemberPage(items=[LocationMember(**row) for row in rows], total=total)
+
+    def get_settlements_within(self, location_id: int, skip: int = 0, limit: int = 100) -> LocationMemberPage:
+        """Get settlements anywhere within a location."""
+        rows, total = self.repository.get_settlements_within(location_id, skip, limit)
+        return LocationMemberPage(items=[LocationMember(**row) for row in rows], total=total)
@@ -3,11 +3,16 @@ Person service for business logic operations.
 """
 
 from sqlalchemy.orm import Session
-from app.domain.models.person import Person, PersonData, Gender, LifeStatus
+from app.core.cache import entity_cache
+from app.domain.models.person import Person, PersonData, Gender, LifeStatus, FAMILY_RELATIONSHIP_TYPES
 from app.domain.models.article import Article, ArticleContent, ArticleType
+from app.repositories.facets import FacetCounts
+from app.repositories.person_relationship_repository import PersonRelationshipRepository
 from app.repositories.person_repository import PersonRepository
-from app.schemas.person import PersonCreate, PersonUpdate
-from typing import Optional, List
+from app.schemas.person import (
+    PersonCreate, PersonNetwork, PersonNode, PersonPath, PersonRelationshipEdge, PersonUpdate,
+)
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 
 
 class PersonService:
@@ -15,6 +20,19 @@ class PersonService:
 
     def __init__(self, db: Session):
         self.repository = PersonRepository(db)
+        self.relationship_repository = PersonRelationshipRepository(db)
+
+    def _publish_invalidation(self, person_id: int, person: Optional[Person]) -> None:
+        """Tell other workers that a person and its article changed."""
+        entity_cache.publish_invalidation("person", person_id)
+        if person is not None:
+            entity_cache.publish_invalidation("article", person.article.id)
+
+    def _save(self, person_id: int, person: Person) -> Optional[Person]:
+        """Persist an updated person and broadcast the change."""
+        updated = self.repository.update_from_domain(person)
+        self._publish_invalidation(person_id, updated)
+        return updated
 
     def get_person(self, person_id: int) -> Optional[Person]:
         """Get a person by ID."""
@@ -23,11 +41,32 @@ class PersonService:
             return self.repository.to_domain(db_person)
         return None
 
+    def get_persons_by_article_ids(self, article_ids: List[int]) -> Dict[int, Person]:
+        """Get persons by article ID with a single query, keyed by article ID."""
+        db_persons = self.repository.get_by_article_ids(list(set(article_ids)))
+        return {db_person.article_id: self.repository.to_domain(db_person) for db_person in db_persons}
+
     def get_persons(self, skip: int = 0, limit: int = 100) -> List[Person]:
         """Get all persons with pagination."""
         db_persons = self.repository.get_all(skip, limit)
         return [self.repository.to_domain(db_person) for db_person in db_persons]
 
+    def search_persons(
+        self,
+        project_id: int,
+        selected: Dict[str, Sequence[Any]],
+        name: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Tuple[List[Person], int, FacetCounts]:
+        """Get a page of persons in a project matching the selected facets, with total and facet counts."""
+        db_persons, total, facets = self.repository.faceted_search(project_id, selected, name, skip, limit)
+        return [self.repository.to_domain(db_person) for db_person in db_persons], total, facets
+
+    def get_life_status_counts(self, project_id: int) -> Dict[str, int]:
+        """Count a project's persons per life status."""
+        return self.repository.count_by_life_status(project_id)
+
     def get_persons_by_race(self, race: str, skip: int = 0, limit: int = 100) -> List[Person]:
         """Get persons by race."""
         db_persons = self.repository.get_by_race(race, skip, limit)
@@ -89,7 +128,7 @@ class PersonService:
         if person_data.current_location is not None:
             current_person.person_data.current_location = person_data.current_location
 
-        return self.repository.update_from_domain(current_person)
+        return self._save(person_id, current_person)
 
     def delete_person(self, person_id: int) -> Optional[Person]:
         """Delete a person."""
@@ -97,6 +136,7 @@ class PersonService:
         person = self.get_person(person_id)
         if person:
             self.repository.delete(person_id)
+            self._publish_invalidation(person_id, person)
         return person
 
     def add_important_date(self, person_id: int, date: str, event: str, 
@@ -105,7 +145,7 @@ class PersonService:
         person = self.get_person(person_id)
         if person:
             person.add_important_date(date, event, description, location)
-            return self.repository.update_from_domain(person)
+            return self._save(person_id, person)
         return None
 
     def add_relationship(self, person_id: int, other_person_name: str, 
@@ -114,5 +154,104 @@ class PersonService:
         person = self.get_person(person_id)
         if person:
             person.add_relationship(other_person_name, relationship_type, description)
-            return self.repository.update_from_domain(person)
-        return None
\ No newline at end of file
+            return self._save(person_id, person)
+        return None
+
+    def person_exists(self, article_id: int) -> bool:
+        """Check whether a person with this article ID exists."""
+        return bool(self.repository.get_by_article_ids([article_id]))
+
+    def get_relationships(self, article_id: int, types: Optional[Sequence[str]] = None) -> List[PersonRelationshipEdge]:
+        """Get the relationships a person lists and those other persons list with them."""
+        edges = self.relationship_repository.get_edges_for(article_id, types)
+        return [self._to_edge(edge) for edge in edges]
+
+    def get_network(
+        self, article_id: int, depth: int = 2, types: Optional[Sequence[str]] = None
+    ) -> PersonNetwork:
+        """Get everyone within ``depth`` relationships of a person and the relationships among them."""
+        depths = self.relationship_repository.get_reachable(article_id, depth, types)
+        return PersonNetwork(
+            root_id=article_id,
+            nodes=self._to_nodes(depths),
+            edges=[self._to_edge(edge) for edge in self.relationship_repository.get_edges_among(list(depths), types)],
+        )
+
+    def get_family_tree(self, article_id: int, depth: int = 3) -> PersonNetwork:
+        """Get a person's relatives through family relationships, up to ``depth`` generations or links away."""
+        return self.get_network(article_id, depth, FAMILY_RELATIONSHIP_TYPES)
+
+    def find_path(self, from_id: int, to_id: int, max_depth: int = 6) -> Optional[PersonPath]:
+        """
+        Find the shortest chain of relationships between two persons, or None within ``max_depth`` links.
+
+        Searches outward from both ends at once, always expanding the smaller
+        frontier, so each step is one indexed query over a few thousand IDs at most.
+        """
+        forward: Dict[int, Optional[int]] = {from_id: None}
+        backward: Dict[int, Optional[int]] = {to_id: None}
+        forward_frontier, backward_frontier = {from_id}, {to_id}
+        meeting = from_id if from_id == to_id else None
+
+        for _ in range(max_depth):
+            if meeting is not None or not forward_frontier or not backward_frontier:
+                break
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meeting = self._expand(forward_frontier, forward, backward)
+            else:
+                backward_frontier, meeting = self._expand(backward_frontier, backward, forward)
+
+        if meeting is None:
+            return None
+
+        path = []
+        node = meeting
+        while node is not None:
+            path.append(node)
+            node = forward[node]
+        path.reverse()
+        node = backward[meeting]
+        while node is not None:
+            path.append(node)
+            node = backward[node]
+
+        between = {}
+        for edge in self.relationship_repository.get_edges_among(path):
+            between.setdefault(frozenset((edge.source_article_id, edge.target_article_id)), edge)
+        return PersonPath(
+            nodes=self._to_nodes({node: index for index, node in enumerate(path)}),
+            edges=[self._to_edge(between[frozenset(pair)]) for pair in zip(path, path[1:])],
+        )
+
+    def _expand(
+        self, frontier: set, parents: Dict[int, Optional[int]], other: Dict[int, Optional[int]]
+    ) -> Tuple[set, Optional[int]]:
+        """Advance one side of the path search by one link; returns the new frontier and any meeting point."""
+        next_frontier = set()
+        meeting = None
+        for node, neighbor in sorted(self.relationship_repository.get_adjacent(list(frontier))):
+            if neighbor in parents:
+                continue
+            parents[neighbor] = node
+            next_frontier.add(neighbor)
+            if meeting is None and neighbor in other:
+                meeting = neighbor
+        return next_frontier, meeting
+
+    def _to_nodes(self, depths: Dict[int, int]) -> List[PersonNode]:
+        names = self.relationship_repository.get_names(list(depths))
+        return [
+            PersonNode(id=node, name=names.get(node, ""), depth=depth)
+            for node, depth in sorted(depths.items(), key=lambda item: (item[1], item[0]))
+        ]
+
+    @staticmethod
+    def _to_edge(edge) -> PersonRelationshipEdge:
+        return PersonRelationshipEdge(
+            source_id=edge.source_article_id,
+            target_id=edge.target_article_id,
+            target_name=edge.target_name,
+            relationship_type=edge.relationship_type,
+            description=edge.description,
+            status=edge.status,
+        )
@@ -0,0 +1,161 @@
+"""
+Project export service for streaming a whole project as NDJSON.
+
+The export is a sequence of JSON records, one per line:
+
+    {"type": "header", "format": "mythosengine-project", "version": 1, ...}
+    {"type": "project", "data": {...}}
+    {"type": "image", "data": {...}}        (one per image)
+    {"type": "article", "data": {...}}      (one per article)
+    {"type": "person", "data": {...}}       (one per person)
+    {"type": "settlement", "data": {...}}   (one per settlement)
+    {"type": "location", "data": {...}}     (one per location hierarchy node)
+
+Rows keep their original IDs; importers are expected to remap them. When
+images are bundled, the NDJSON is written as ``project.ndjson`` inside a tar
+stream followed by each image file under ``images/<filename>``.
+"""
+
+import json
+import os
+import tarfile
+import tempfile
+import time
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List
+
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.repositories.export_repository import ProjectExportRepository
+
+EXPORT_FORMAT = "mythosengine-project"
+EXPORT_FORMAT_VERSION = 1
+NDJSON_MEMBER_NAME = "project.ndjson"
+IMAGES_MEMBER_PREFIX = "images/"
+
+# NDJSON larger than this is spilled to disk while building a tar bundle
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values that the json module doesn't handle natively."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    return json.dumps(record, default=_json_default, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class _ChunkSink:
+    """Write-only file object that collects bytes for a streaming response."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        yield from chunks
+
+
+class ProjectExportService:
+    """Streams project exports using its own session so it outlives the request scope."""
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+
+    def _iter_records(self, db: Session, project_id: int) -> Iterator[Dict[str, Any]]:
+        repository = ProjectExportRepository(db)
+
+        project = repository.get_project_row(project_id)
+        if project is None:
+            return
+
+        yield {
+            "type": "header",
+            "format": EXPORT_FORMAT,
+            "version": EXPORT_FORMAT_VERSION,
+            "exported_at": datetime.utcnow().isoformat() + "Z",
+        }
+        yield {"type": "project", "data": project}
+        for row in repository.stream_images(project_id):
+            yield {"type": "image", "data": row}
+        for row in repository.stream_articles(project_id):
+            yield {"type": "article", "data": row}
+        for row in repository.stream_persons(project_id):
+            yield {"type": "person", "data": row}
+        for row in repository.stream_settlements(project_id):
+            yield {"type": "settlement", "data": row}
+        for row in repository.stream_locations(project_id):
+            yield {"type": "location", "data": row}
+
+    def _iter_ndjson_with_session(self, db: Session, project_id: int) -> Iterator[bytes]:
+        # A single repeatable-read transaction gives every table the same snapshot
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        buffer: List[bytes] = []
+        buffered = 0
+        for record in self._iter_records(db, project_id):
+            line = _encode_record(record)
+            buffer.append(line)
+            buffered += len(line)
+            if buffered >= _CHUNK_SIZE:
+                yield b"".join(buffer)
+                buffer, buffered = [], 0
+        if buffer:
+            yield b"".join(buffer)
+
+    def iter_ndjson(self, project_id: int) -> Iterator[bytes]:
+        """Stream the project as NDJSON bytes."""
+        db = self.session_factory()
+        try:
+            yield from self._iter_ndjson_with_session(db, project_id)
+        finally:
+            db.close()
+
+    def iter_ndjson_gzip(self, project_id: int) -> Iterator[bytes]:
+        """Stream the project as gzip-compressed NDJSON bytes."""
+        compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        for chunk in self.iter_ndjson(project_id):
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    def iter_tar(self, project_id: int, compress: bool = False) -> Iterator[bytes]:
+        """Stream the project NDJSON plus local image files as a (optionally gzip'd) tar."""
+        db = self.session_factory()
+        sink = _ChunkSink()
+        try:
+            with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as spool:
+                for chunk in self._iter_ndjson_with_session(db, project_id):
+                    spool.write(chunk)
+                size = spool.tell()
+                spool.seek(0)
+
+                with tarfile.open(fileobj=sink, mode="w|gz" if compress else "w|") as archive:
+                    info = tarfile.TarInfo(NDJSON_MEMBER_NAME)
+                    info.size = size
+                    info.mtime = int(time.time())
+                    archive.addfile(info, spool)
+                    yield from sink.drain()
+
+                    for image in ProjectExportRepository(db).stream_images(project_id):
+                        if image["is_s3_stored"] or not os.path.isfile(image["file_path"]):
+                            continue
+                        archive.add(image["file_path"], arcname=f"{IMAGES_MEMBER_PREFIX}{image['filename']}")
+                        yield from sink.drain()
+                yield from sink.drain()
+        finally:
+            db.close()
@@ -0,0 +1,416 @@
+"""
+Project import service for loading NDJSON/tar exports with PostgreSQL COPY.
+
+Accepts everything produced by the export endpoint: plain NDJSON, gzip'd
+NDJSON, or a (gzip'd) tar bundle with ``project.ndjson`` and image files.
+Records are stream-parsed into COPY buffers, loaded into temporary staging
+tables, and then moved into the real tables with set-based INSERT ... SELECT
+statements that assign fresh IDs. Everything happens in one transaction, so a
+failed import leaves no trace.
+"""
+
+import gzip
+import io
+import json
+import os
+import tarfile
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.domain.models.calendar import Calendar
+from app.services.indexing import reindex_project
+from app.services.project_export_service import (
+    EXPORT_FORMAT,
+    IMAGES_MEMBER_PREFIX,
+    NDJSON_MEMBER_NAME,
+)
+
+PROGRESS_INTERVAL = 10000
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+ProgressCallback = Callable[[str, Dict[str, int]], None]
+
+
+class ProjectImportError(Exception):
+    """Raised when an import stream is malformed or cannot be loaded."""
+    pass
+
+
+# Staging table columns per record type: (column name, SQL type, export key)
+_STAGING_COLUMNS: Dict[str, List[Tuple[str, str, str]]] = {
+    "image": [
+        ("old_id", "integer", "id"),
+        ("filename", "varchar", "filename"),
+        ("original_filename", "varchar", "original_filename"),
+        ("file_path", "varchar", "file_path"),
+        ("file_size", "integer", "file_size"),
+        ("mime_type", "varchar", "mime_type"),
+        ("width", "integer", "width"),
+        ("height", "integer", "height"),
+        ("alt_text", "text", "alt_text"),
+        ("is_s3_stored", "boolean", "is_s3_stored"),
+        ("s3_bucket", "varchar", "s3_bucket"),
+        ("perceptual_hash", "bigint", "perceptual_hash"),
+        ("placeholder_color", "varchar", "placeholder_color"),
+        ("created_at", "timestamptz", "created_at"),
+        ("updated_at", "timestamptz", "updated_at"),
+    ],
+    "article": [
+        ("old_id", "integer", "id"),
+        ("title", "varchar", "title"),
+        ("content", "jsonb", "content"),
+        ("article_type", "varchar", "article_type"),
+        ("header_image_old_id", "integer", "header_image_id"),
+        ("spotify_url", "varchar", "spotify_url"),
+        ("created_at", "timestamptz", "created_at"),
+        ("updated_at", "timestamptz", "updated_at"),
+    ],
+    "person": [
+        ("article_old_id", "integer", "article_id"),
+        ("person_data", "jsonb", "person_data"),
+        ("race", "varchar", "race"),
+        ("gender", "varchar", "gender"),
+        ("life_status", "varchar", "life_status"),
+        ("occupation", "varchar", "occupation"),
+        ("current_location", "varchar", "current_location"),
+    ],
+    "settlement": [
+        ("article_old_id", "integer", "article_id"),
+        ("settlement_data", "jsonb", "settlement_data"),
+        ("settlement_type", "varchar", "settlement_type"),
+        ("population", "integer", "population"),
+        ("government_type", "varchar", "government_type"),
+        ("region", "varchar", "region"),
+        ("primary_industry", "varchar", "primary_industry"),
+        ("latitude", "double precision", "latitude"),
+        ("longitude", "double precision", "longitude"),
+    ],
+    "location": [
+        ("old_id", "integer", "id"),
+        ("name", "varchar", "name"),
+        ("location_type", "varchar", "location_type"),
+        ("parent_old_id", "integer", "parent_id"),
+        ("article_old_id", "integer", "article_id"),
+    ],
+}
+
+_STAGING_TABLES = {
+    "image": "import_images",
+    "article": "import_articles",
+    "person": "import_persons",
+    "settlement": "import_settlements",
+    "location": "import_locations",
+}
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value: Any, sql_type: str) -> str:
+    """Encode a value for COPY text format."""
+    if value is None:
+        return "\\N"
+    if sql_type == "jsonb":
+        value = json.dumps(value, separators=(",", ":"))
+    elif sql_type == "boolean":
+        value = "t" if value else "f"
+    return str(value).translate(_COPY_ESCAPES)
+
+
+@dataclass
+class ImportResult:
+    """Summary of a completed import."""
+    project_id: int
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+class _CopyBuffer:
+    """Accumulates COPY rows for one staging table, spilling to disk when large."""
+
+    def __init__(self, columns: List[Tuple[str, str, str]]):
+        self.columns = columns
+        self.rows = 0
+        self._file = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE, mode="w+b")
+
+    def write(self, data: Dict[str, Any]) -> None:
+        line = "\t".join(_copy_value(data.get(key), sql_type) for _, sql_type, key in self.columns)
+        self._file.write(line.encode("utf-8") + b"\n")
+        self.rows += 1
+
+    def reader(self) -> BinaryIO:
+        self._file.seek(0)
+        return self._file
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _read_up_to(stream: BinaryIO, size: int) -> bytes:
+    """Read ``size`` bytes, or up to the end of the stream if it is shorter."""
+    chunks = []
+    while size > 0:
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+class _PrefixedReader(io.RawIOBase):
+    """A stream that replays bytes already read from the front of another one."""
+
+    def __init__(self, prefix: bytes, rest: BinaryIO):
+        self._prefix = prefix
+        self._rest = rest
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._prefix:
+            data, self._prefix = self._prefix[:len(buffer)], self._prefix[len(buffer):]
+        else:
+            data = self._rest.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class ProjectImportService:
+    """Service for importing project exports into a new project."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _open_stream(self, fileobj: BinaryIO) -> Tuple[Optional[tarfile.TarFile], BinaryIO]:
+        """Detect gzip/tar wrapping and return (tar archive or None, byte stream)."""
+        # A tar header is one 512-byte block; it is read in full (streams may return
+        # short reads) and replayed ahead of the rest
+        header = _read_up_to(fileobj, 512)
+        stream: BinaryIO = io.BufferedReader(_PrefixedReader(header, fileobj))
+        if header[:2] == b"\x1f\x8b":
+            unzipped = gzip.GzipFile(fileobj=stream, mode="rb")
+            header = _read_up_to(unzipped, 512)
+            stream = io.BufferedReader(_PrefixedReader(header, unzipped))
+        if header[257:262] == b"ustar":
+            return tarfile.open(fileobj=stream, mode="r|"), stream
+        return None, stream
+
+    def _iter_records(self, lines: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+        has_header = False
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ProjectImportError(f"Invalid JSON on line {line_number}: {e}")
+            if not has_header:
+                if record.get("type") != "header" or record.get("format") != EXPORT_FORMAT:
+                    raise ProjectImportError("Not a MythosEngine project export")
+                has_header = True
+            yield record
+
+    def _store_image_file(self, source: BinaryIO, original_name: str) -> Tuple[str, str]:
+        """Copy bundled image bytes into local storage under a fresh filename."""
+        Path(settings.LOCAL_IMAGES_PATH).mkdir(parents=True, exist_ok=True)
+        filename = f"{uuid.uuid4()}{Path(original_name).suffix.lower()}"
+        file_path = os.path.join(settings.LOCAL_IMAGES_PATH, filename)
+        with open(file_path, "wb") as target:
+            while chunk := source.read(1024 * 1024):
+                target.write(chunk)
+        return filename, file_path
+
+    def _report(self, progress: Optional[ProgressCallback], stage: str, counts: Dict[str, int]) -> None:
+        if progress:
+            progress(stage, dict(counts))
+
+    def _copy(self, table: str, buffer: _CopyBuffer) -> None:
+        columns = ", ".join(name for name, _, _ in buffer.columns)
+        dbapi_connection = self.db.connection().connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN", buffer.reader())
+
+    def _create_staging_tables(self) -> None:
+        for record_type, table in _STAGING_TABLES.items():
+            columns = ", ".join(f"{name} {sql_type}" for name, sql_type, _ in _STAGING_COLUMNS[record_type])
+            self.db.execute(text(f"CREATE TEMP TABLE {table} ({columns}, new_id integer) ON COMMIT DROP"))
+        self.db.execute(text(
+            "CREATE TEMP TABLE import_image_files "
+            "(old_filename varchar, new_filename varchar, new_path varchar) ON COMMIT DROP"
+        ))
+
+    def _swap_in(self, project: Dict[str, Any], project_name: Optional[str]) -> int:
+        """Move staged rows into the real tables with fresh IDs, returning the new project ID."""
+        calendar = project.get("calendar")
+        project_id = self.db.execute(
+            text(
+                "INSERT INTO projects (name, description, calendar) "
+                "VALUES (:name, :description, CAST(:calendar AS jsonb)) RETURNING id"
+            ),
+            {
+                "name": project_name or project.get("name") or "Imported project",
+                "description": project.get("description"),
+                "calendar": json.dumps(calendar) if calendar is not None else None,
+            },
+        ).scalar_one()
+
+        self.db.execute(text("CREATE INDEX ON import_images (old_id)"))
+        self.db.execute(text("CREATE INDEX ON import_articles (old_id)"))
+        self.db.execute(text("ANALYZE import_images"))
+        self.db.execute(text("ANALYZE import_articles"))
+
+        self.db.execute(text("""
+            UPDATE import_images i
+            SET filename = f.new_filename, file_path = f.new_path, is_s3_stored = false, s3_bucket = NULL
+            FROM import_image_files f
+            WHERE f.old_filename = i.filename
+        """))
+        self.db.execute(text("UPDATE import_images SET new_id = nextval(pg_get_serial_sequence('images', 'id'))"))
+        self.db.execute(text("""
+            INSERT INTO images (id, filename, original_filename, file_path, file_size, mime_type, width, height,
+                                alt_text, is_s3_stored, s3_bucket, perceptual_hash, placeholder_color,
+                                created_at, updated_at, project_id)
+            SELECT new_id, filename, original_filename, file_path, file_size, mime_type, width, height,
+                   alt_text, is_s3_stored, s3_bucket, perceptual_hash, placeholder_color,
+                   coalesce(created_at, now()), coalesce(updated_at, now()), :project_id
+            FROM import_images
+        """), {"project_id": project_id})
+
+        self.db.execute(text("UPDATE import_articles SET new_id = nextval(pg_get_serial_sequence('articles', 'id'))"))
+        self.db.execute(text("""
+            INSERT INTO articles (id, title, content, article_type, project_id, header_image_id, spotify_url,
+                                  created_at, updated_at)
+            SELECT a.new_id, a.title, coalesce(a.content, '{}'::jsonb), coalesce(a.article_type, 'general'),
+                   :project_id, i.new_id, a.spotify_url, coalesce(a.created_at, now()), coalesce(a.updated_at, now())
+            FROM import_articles a
+            LEFT JOIN import_images i ON i.old_id = a.header_image_old_id
+        """), {"project_id": project_id})
+
+        self.db.execute(text("""
+            INSERT INTO persons (article_id, person_data, race, gender, life_status, occupation, current_location)
+            SELECT a.new_id, coalesce(p.person_data, '{}'::jsonb), p.race, p.gender,
+                   coalesce(p.life_status, 'unknown'), p.occupation, p.current_location
+            FROM import_persons p
+            JOIN import_articles a ON a.old_id = p.article_old_id
+        """))
+        self.db.execute(text("""
+            INSERT INTO settlements (article_id, settlement_data, settlement_type, population, government_type,
+                                     region, primary_industry, latitude, longitude)
+            SELECT a.new_id, coalesce(s.settlement_data, '{}'::jsonb), s.settlement_type, s.population,
+                   s.government_type, s.region, s.primary_industry,
+                   CASE WHEN c.lat IS NOT NULL AND c.lng IS NOT NULL THEN c.lat END,
+                   CASE WHEN c.lat IS NOT NULL AND c.lng IS NOT NULL THEN c.lng END
+            FROM import_settlements s
+            JOIN import_articles a ON a.old_id = s.article_old_id
+            -- Exports made before the coordinate columns existed only have them in settlement_data.
+            -- The casts are nested in CASE, as AND gives no evaluation order, and the range check
+            -- uses numeric since huge JSON numbers overflow float8
+            CROSS JOIN LATERAL (
+                SELECT coalesce(s.latitude,
+                           CASE WHEN jsonb_typeof(s.settlement_data->'coordinates'->'lat') = 'number' THEN
+                               CASE WHEN abs((s.settlement_data->'coordinates'->>'lat')::numeric) <= 90
+                                    THEN (s.settlement_data->'coordinates'->>'lat')::float8 END
+                           END) AS lat,
+                       coalesce(s.longitude,
+                           CASE WHEN jsonb_typeof(s.settlement_data->'coordinates'->'lng') = 'number' THEN
+                               CASE WHEN abs((s.settlement_data->'coordinates'->>'lng')::numeric) <= 180
+                                    THEN (s.settlement_data->'coordinates'->>'lng')::float8 END
+                           END) AS lng
+            ) c
+        """))
+
+        # Persons and settlements are linked to these when the project is reindexed
+        self.db.execute(text("UPDATE import_locations SET new_id = nextval(pg_get_serial_sequence('locations', 'id'))"))
+        # Nameless nodes are skipped; their children are kept as top-level nodes
+        self.db.execute(text("""
+            INSERT INTO locations (id, project_id, name, location_type, parent_id, article_id)
+            SELECT l.new_id, :project_id, l.name, coalesce(l.location_type, 'place'), p.new_id, a.new_id
+            FROM import_locations l
+            LEFT JOIN import_locations p ON p.old_id = l.parent_old_id AND p.name IS NOT NULL
+            LEFT JOIN import_articles a ON a.old_id = l.article_old_id
+            WHERE l.name IS NOT NULL
+        """), {"project_id": project_id})
+        return project_id
+
+    def import_project(
+        self,
+        fileobj: BinaryIO,
+        project_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> ImportResult:
+        """Import an export stream as a new project."""
+        buffers = {record_type: _CopyBuffer(columns) for record_type, columns in _STAGING_COLUMNS.items()}
+        image_files = _CopyBuffer([("old_filename", "varchar", "old"), ("new_filename", "varchar", "new"),
+                                   ("new_path", "varchar", "path")])
+        written_files: List[str] = []
+        counts = {record_type: 0 for record_type in buffers}
+        project: Optional[Dict[str, Any]] = None
+
+        def consume(lines: Iterable[bytes]) -> None:
+            nonlocal project
+            for record in self._iter_records(lines):
+                record_type = record.get("type")
+                if record_type == "project":
+                    project = record.get("data") or {}
+                elif record_type in buffers:
+                    buffers[record_type].write(record.get("data") or {})
+                    counts[record_type] += 1
+                    if sum(counts.values()) % PROGRESS_INTERVAL == 0:
+                        self._report(progress, "parsing", counts)
+
+        try:
+            archive, stream = self._open_stream(fileobj)
+            if archive is None:
+                consume(stream)
+            else:
+                for member in archive:
+                    if not member.isfile():
+                        continue
+                    member_file = archive.extractfile(member)
+                    if member.name == NDJSON_MEMBER_NAME:
+                        consume(member_file)
+                    elif member.name.startswith(IMAGES_MEMBER_PREFIX):
+                        old_filename = member.name[len(IMAGES_MEMBER_PREFIX):]
+                        new_filename, new_path = self._store_image_file(member_file, old_filename)
+                        written_files.append(new_path)
+                        image_files.write({"old": old_filename, "new": new_filename, "path": new_path})
+                archive.close()
+
+            if project is None:
+                raise ProjectImportError("Export contains no project record")
+            try:
+                Calendar.from_dict(project.get("calendar"))
+            except (AttributeError, TypeError, ValueError) as e:
+                raise ProjectImportError(f"Invalid project calendar: {e}")
+            self._report(progress, "parsed", counts)
+
+            self._create_staging_tables()
+            for record_type, buffer in buffers.items():
+                self._copy(_STAGING_TABLES[record_type], buffer)
+                self._report(progress, f"staged {record_type}s", counts)
+            self._copy("import_image_files", image_files)
+
+            project_id = self._swap_in(project, project_name)
+            reindex_project(self.db, project_id)
+            self.db.commit()
+            self._report(progress, "done", counts)
+            return ImportResult(project_id=project_id, counts=counts)
+        except Exception:
+            self.db.rollback()
+            for path in written_files:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            raise
+        finally:
+            for buffer in buffers.values():
+                buffer.close()
+            image_files.close()
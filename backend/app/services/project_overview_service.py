@@ -0,0 +1,63 @@
+"""
+Project overview service for the project landing page.
+
+The overview combines several independent aggregates. Each one runs in a
+worker thread on its own pooled session, so the response takes as long as the
+slowest query rather than the sum of all of them.
+"""
+
+import asyncio
+from typing import Callable, Optional, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.schemas.project import ProjectOverview
+from app.services.container import ServiceContainer
+
+T = TypeVar("T")
+
+RECENT_ARTICLES_LIMIT = 10
+
+
+class ProjectOverviewService:
+    """Assembles project overviews from concurrent queries on separate sessions."""
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+
+    def _query(self, query: Callable[[ServiceContainer], T]) -> T:
+        db = self.session_factory()
+        try:
+            return query(ServiceContainer(db))
+        finally:
+            db.close()
+
+    async def _run(self, query: Callable[[ServiceContainer], T]) -> T:
+        return await run_in_threadpool(self._query, query)
+
+    async def get_overview(
+        self, project_id: int, recent_limit: int = RECENT_ARTICLES_LIMIT
+    ) -> Optional[ProjectOverview]:
+        """Get the project overview, or None if the project doesn't exist."""
+        project, article_counts, recent_articles, person_life_status, settlement_types, storage = await asyncio.gather(
+            self._run(lambda services: services.projects.get_project(project_id)),
+            self._run(lambda services: services.articles.get_article_type_counts(project_id)),
+            self._run(lambda services: services.articles.get_recent_article_summaries(project_id, recent_limit)),
+            self._run(lambda services: services.people.get_life_status_counts(project_id)),
+            self._run(lambda services: services.settlements.get_settlement_type_counts(project_id)),
+            self._run(lambda services: services.images.get_project_storage_usage(project_id)),
+        )
+        if project is None:
+            return None
+
+        return ProjectOverview(
+            project_id=project.id,
+            name=project.name,
+            article_counts=article_counts,
+            recent_articles=recent_articles,
+            person_life_status=person_life_status,
+            settlement_types=settlement_types,
+            storage=storage,
+        )
@@ -1,8 +1,32 @@
+from dataclasses import asdict
 from sqlalchemy.orm import Session
-from app.domain.models.project import Project
+from app.core.cache import entity_cache
+from app.domain.models.calendar import Calendar
+from app.domain.models.project import Project, ProjectStats
+from app.repositories.image_repository import ImageRepository
 from app.repositories.project_repository import ProjectRepository
-from app.schemas.project import ProjectCreate, ProjectUpdate
-from typing import Optional, List
+from app.repositories.timeline_repository import TimelineRepository
+from app.services import image_similarity, related_articles, title_index, trade_network
+from app.services.image_service import cleanup_image_files
+from app.services.indexing import reindex_project
+from app.services.jobs import Job, job_runner
+from app.schemas.project import Project as ProjectSchema, ProjectCalendar, ProjectCreate, ProjectUpdate
+from typing import Any, Dict, Optional, List, Tuple
+
+
+class InvalidCalendarError(ValueError):
+    """Raised when a project calendar can't be used to order dates."""
+    pass
+
+
+def _calendar_config(calendar: Optional[ProjectCalendar]) -> Optional[Dict[str, Any]]:
+    """Validate a calendar from the API and return it in its stored form."""
+    if calendar is None:
+        return None
+    try:
+        return Calendar.from_dict(calendar.model_dump()).to_dict()
+    except ValueError as e:
+        raise InvalidCalendarError(str(e))
 
 
 class ProjectService:
@@ -10,6 +34,8 @@ class ProjectService:
 
     def __init__(self, db: Session):
         self.repository = ProjectRepository(db)
+        self.image_repository = ImageRepository(db)
+        self.timeline_repository = TimelineRepository(db)
 
     def get_project(self, project_id: int) -> Optional[Project]:
         """Get a project by ID."""
@@ -18,6 +44,22 @@ class ProjectService:
             return self.repository.to_domain(db_project)
         return None
 
+    def get_project_json(self, project_id: int, version: Tuple[Any, ...]) -> Optional[bytes]:
+        """
+        Get a project serialized as JSON, served from the payload cache when the
+        cached copy matches ``version`` (as returned by get_project_version).
+        """
+        payload = entity_cache.get("project", project_id, version)
+        if payload is not None:
+            return payload
+
+        project = self.get_project(project_id)
+        if project is None:
+            return None
+        payload = ProjectSchema.model_validate(asdict(project)).model_dump_json().encode("utf-8")
+        entity_cache.set("project", project_id, version, payload)
+        return payload
+
     def get_project_by_name(self, name: str) -> Optional[Project]:
         """Get a project by name."""
         db_project = self.repository.get_by_name(name)
@@ -30,6 +72,18 @@ class ProjectService:
         db_projects = self.repository.get_all(skip, limit)
         return [self.repository.to_domain(db_project) for db_project in db_projects]
 
+    def get_project_version(self, project_id: int) -> Optional[Tuple[Any, ...]]:
+        """Get the cheap validator tuple for a project, or None if it doesn't exist."""
+        return self.repository.get_version(project_id)
+
+    def get_projects_version(self) -> Tuple[Any, ...]:
+        """Get the aggregate validator tuple for the project listing."""
+        return self.repository.get_collection_version()
+
+    def get_project_stats(self, project_id: int) -> Optional[ProjectStats]:
+        """Get a project's row counts and image storage totals without counting rows."""
+        return self.repository.get_stats(project_id)
+
     def search_projects(self, name_pattern: str, skip: int = 0, limit: int = 100) -> List[Project]:
         """Search projects by name pattern."""
         db_projects = self.repository.search_by_name(name_pattern, skip, limit)
@@ -40,7 +94,8 @@ class ProjectService:
         # Convert schema to domain model
         domain_project = Project(
             name=project_data.name,
-            description=project_data.description
+            description=project_data.description,
+            calendar=_calendar_config(project_data.calendar)
         )
 
         return self.repository.create_from_domain(domain_project)
@@ -57,14 +112,52 @@ class ProjectService:
             current_project.name = project_data.name
         if project_data.description is not None:
             current_project.description = project_data.description
+        if project_data.calendar is not None:
+            current_project.calendar = _calendar_config(project_data.calendar)
+            # Re-keyed in the same transaction as the calendar change
+            self.timeline_repository.rekey_project(project_id, current_project.get_calendar())
 
-        return self.repository.update_from_domain(current_project)
-
-    def delete_project(self, project_id: int) -> Optional[Project]:
-        """Delete a project."""
-        # Get the project before deletion
-        project = self.get_project(project_id)
-        if project:
-            self.repository.delete(project_id)
+        project = self.repository.update_from_domain(current_project)
+        entity_cache.publish_invalidation("project", project_id)
         return project
 
+    def clone_project(self, project_id: int, name: Optional[str] = None) -> Optional[Project]:
+        """Fork a project, copying all of its content server-side."""
+        source = self.get_project(project_id)
+        if not source:
+            return None
+
+        db = self.repository.db
+        try:
+            db_project = self.repository.clone(project_id, name or f"{source.name} (copy)")
+            if db_project is None:
+                return None
+            # Committed together with the copy, so a failed reindex leaves no half-indexed project
+            reindex_project(db, db_project.id)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return self.repository.to_domain(db_project)
+
+    def delete_project(self, project_id: int) -> Optional[Job]:
+        """
+        Delete a project and all of its content.
+
+        Rows are removed by the database in one cascading delete; stored image
+        files are cleaned up by the returned background job.
+        """
+        image_files = self.image_repository.get_file_refs_by_project_id(project_id)
+        if not self.repository.delete_cascading(project_id):
+            return None
+
+        image_similarity.invalidate_index(project_id)
+        related_articles.invalidate_index(project_id)
+        title_index.invalidate_index(project_id)
+        trade_network.invalidate_network(project_id)
+        entity_cache.publish_invalidation("project", project_id)
+        return job_runner.submit(
+            f"delete-project-{project_id}-files",
+            lambda: cleanup_image_files(image_files),
+        )
+
@@ -0,0 +1,227 @@
+"""
+Related-article recommendations from hashed bag-of-words vectors.
+
+Each article's title, text and tags are tokenized and folded into a fixed-width
+vector with signed feature hashing (no vocabulary to maintain), weighted by
+1 + log(term frequency) and by inverse document frequency, and L2-normalized.
+A project's vectors are held as one float32 matrix, so finding the articles
+closest to one of them is a single matrix-vector product of cosine scores and a
+partial sort.
+
+IDF weights are computed when a project's matrix is built and kept fixed while
+changed articles are re-vectorized in place; they drift only slowly, and every
+full rebuild refreshes them, as does deleting enough articles that their
+emptied rows make up a sizeable part of the matrix. Indexes are stamped with
+the project's change version like the title index, and a bounded number of
+projects is kept per worker; a project's index is built by one request at a time.
+"""
+
+import math
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+TITLE_WEIGHT = 2  # Title words count as if they appeared this many times
+TEXT_FIELDS = ("main_content", "sidebar_content", "footer_content", "summary")
+DEAD_ROW_FRACTION = 0.25  # Rebuild once rows of removed articles reach this share of the matrix
+
+_TOKEN = re.compile(r"[^\W\d_]{3,}")
+_STOPWORDS = frozenset("""
+    about above after again against all also and any are because been before being below between both but
+    can could did does doing down during each few for from further had has have having her here hers herself
+    him himself his how into its itself just more most much must nor not now off once only other our ours
+    ourselves out over own same she should some such than that the their theirs them themselves then there
+    these they this those through too under until very was were what when where which while who whom why
+    will with would you your yours yourself yourselves
+""".split())
+
+# (id, title, content) as stored
+ArticleText = Tuple[int, str, Optional[Dict[str, Any]]]
+
+
+def _terms(title: str, content: Optional[Dict[str, Any]]) -> Counter:
+    """Term counts for an article's title, text fields and tags."""
+    parts = [title] * TITLE_WEIGHT
+    if content:
+        parts.extend(str(content[field]) for field in TEXT_FIELDS if content.get(field))
+        parts.extend(str(tag) for tag in content.get("tags") or [])
+    return Counter(
+        token for token in _TOKEN.findall(" ".join(parts).lower()) if token not in _STOPWORDS
+    )
+
+
+def _features(
+    terms: Counter, buckets: Dict[str, Tuple[int, float]], dimensions: int
+) -> Tuple[List[int], List[float]]:
+    """Bucket indexes and signed 1 + log(tf) values for an article's terms."""
+    indexes, values = [], []
+    for term, count in terms.items():
+        bucket = buckets.get(term)
+        if bucket is None:
+            # One CRC picks both the bucket and the sign, so collisions tend to cancel out
+            digest = zlib.crc32(term.encode("utf-8"))
+            bucket = buckets[term] = (digest % dimensions, 1.0 if digest & 0x80000000 else -1.0)
+        indexes.append(bucket[0])
+        values.append(bucket[1] * (1.0 + math.log(count)))
+    return indexes, values
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+class RelatedArticleIndex:
+    """
+    Article vectors of one project. Rows are patched in place under a lock; a
+    concurrent reader may see a row mid-update, which only skews that one score.
+    Removed articles keep their row, zeroed, so they never score above zero.
+    """
+
+    def __init__(self, articles: Iterable[ArticleText], signature: Hashable):
+        self.signature = signature
+        self.dimensions = settings.RELATED_VECTOR_DIMENSIONS
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[int, float]] = {}
+
+        rows, indexes, values, ids = [], [], [], []
+        for row, (article_id, title, content) in enumerate(articles):
+            bucket_indexes, bucket_values = _features(_terms(title, content), self._buckets, self.dimensions)
+            rows.extend([row] * len(bucket_indexes))
+            indexes.extend(bucket_indexes)
+            values.extend(bucket_values)
+            ids.append(article_id)
+
+        count = len(ids)
+        matrix = np.zeros((max(count, 16), self.dimensions), dtype=np.float32)
+        np.add.at(
+            matrix,
+            (np.array(rows, dtype=np.int64), np.array(indexes, dtype=np.int64)),
+            np.array(values, dtype=np.float32),
+        )
+
+        document_frequency = np.count_nonzero(matrix[:count], axis=0)
+        self._idf = (np.log((1.0 + count) / (1.0 + document_frequency)) + 1.0).astype(np.float32)
+        matrix *= self._idf
+        self._matrix = _normalize(matrix)
+        self._ids = np.zeros(matrix.shape[0], dtype=np.int64)
+        self._ids[:count] = ids
+        self._count = count
+        self._positions = {article_id: row for row, article_id in enumerate(ids)}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def needs_rebuild(self) -> bool:
+        """Whether enough rows are held for removed articles that rebuilding would pay off."""
+        return self._count - len(self._positions) > DEAD_ROW_FRACTION * self._count
+
+    def _vector(self, title: str, content: Optional[Dict[str, Any]]) -> np.ndarray:
+        vector = np.zeros((1, self.dimensions), dtype=np.float32)
+        indexes, values = _features(_terms(title, content), self._buckets, self.dimensions)
+        np.add.at(vector[0], indexes, values)
+        vector *= self._idf
+        return _normalize(vector)[0]
+
+    def update(self, articles: Iterable[ArticleText], signature: Hashable) -> None:
+        """Re-vectorize changed articles and add new ones, growing the matrix by doubling."""
+        with self._lock:
+            for article_id, title, content in articles:
+                vector = self._vector(title, content)
+                row = self._positions.get(article_id)
+                if row is None:
+                    if self._count == self._matrix.shape[0]:
+                        self._grow()
+                    row = self._count
+                    self._count += 1
+                    self._ids[row] = article_id
+                    self._positions[article_id] = row
+                self._matrix[row] = vector
+            self.signature = signature
+
+    def _grow(self) -> None:
+        capacity = self._matrix.shape[0] * 2
+        matrix = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        matrix[:self._count] = self._matrix[:self._count]
+        ids = np.zeros(capacity, dtype=np.int64)
+        ids[:self._count] = self._ids[:self._count]
+        self._matrix, self._ids = matrix, ids
+
+    def remove(self, article_id: int) -> None:
+        """Stop recommending a deleted article; its row is left empty."""
+        with self._lock:
+            row = self._positions.pop(article_id, None)
+            if row is not None:
+                self._matrix[row] = 0.0
+
+    def related(self, article_id: int, limit: int) -> Optional[List[Tuple[int, float]]]:
+        """
+        The articles most similar to one, as (article ID, cosine score) pairs, best
+        first and by article ID among equal scores; None if the article isn't in the index.
+        Articles scoring zero or less are omitted.
+        """
+        row = self._positions.get(article_id)
+        if row is None:
+            return None
+        count = self._count
+        matrix, ids = self._matrix[:count], self._ids[:count]
+
+        # One pass over the matrix dominates; rows are contiguous, so BLAS streams them
+        scores = matrix @ matrix[row]
+        scores[row] = 0.0
+        # Everything tied with the cut-off score is kept, so ties resolve by ID rather than partition order
+        cutoff = np.partition(scores, count - limit)[count - limit] if count > limit else -np.inf
+        top = np.flatnonzero((scores >= cutoff) & (scores > 1e-6))
+        order = top[np.lexsort((ids[top], -scores[top]))][:limit]
+        return [(int(ids[i]), float(scores[i])) for i in order]
+
+
+_indexes: "OrderedDict[int, RelatedArticleIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+_build_locks: Dict[int, threading.Lock] = {}
+
+
+def build_lock(project_id: int) -> threading.Lock:
+    """Lock held while a project's index is refreshed or built, so concurrent requests don't each build one."""
+    with _indexes_lock:
+        return _build_locks.setdefault(project_id, threading.Lock())
+
+
+def get_cached_index(project_id: int) -> Optional[RelatedArticleIndex]:
+    """Return the cached index for a project, current or not; check its signature before use."""
+    with _indexes_lock:
+        index = _indexes.get(project_id)
+        if index is not None:
+            _indexes.move_to_end(project_id)
+        return index
+
+
+def store_index(project_id: int, index: RelatedArticleIndex) -> None:
+    """Cache an index for a project, evicting the least recently used projects if full."""
+    with _indexes_lock:
+        _indexes[project_id] = index
+        _indexes.move_to_end(project_id)
+        while len(_indexes) > settings.RELATED_CACHE_PROJECTS:
+            _indexes.popitem(last=False)
+
+
+def remove_article(project_id: int, article_id: int) -> None:
+    """Drop a deleted article from the project's cached index, if there is one."""
+    with _indexes_lock:
+        index = _indexes.get(project_id)
+    if index is not None:
+        index.remove(article_id)
+
+
+def invalidate_index(project_id: int) -> None:
+    """Drop the cached index for a project."""
+    with _indexes_lock:
+        _indexes.pop(project_id, None)
+        _build_locks.pop(project_id, None)
@@ -3,11 +3,17 @@ Settlement service for business logic operations.
 """
 
 from sqlalchemy.orm import Session
-from app.domain.models.settlement import Settlement, SettlementData, SettlementType, GovernmentType
+from app.core.cache import entity_cache
+from app.domain.models.settlement import (
+    Settlement, SettlementData, SettlementType, GovernmentType,
+    UNKNOWN_POPULATION_CATEGORY, population_category_ranges,
+)
 from app.domain.models.article import Article, ArticleContent, ArticleType
+from app.repositories.facets import FacetCounts
 from app.repositories.settlement_repository import SettlementRepository
-from app.schemas.settlement import SettlementCreate, SettlementUpdate
-from typing import Optional, List
+from app.schemas.settlement import SettlementCreate, SettlementUpdate, TradeComponent, TradeHub, TradeRoute, TradeRouteStop
+from app.services import trade_network
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 
 
 class SettlementService:
@@ -16,6 +22,48 @@ class SettlementService:
     def __init__(self, db: Session):
         self.repository = SettlementRepository(db)
 
+    def _publish_invalidation(self, settlement_id: int, settlement: Optional[Settlement]) -> None:
+        """Tell other workers that a settlement and its article changed."""
+        entity_cache.publish_invalidation("settlement", settlement_id)
+        if settlement is not None:
+            entity_cache.publish_invalidation("article", settlement.article.id)
+
+    def _save(self, settlement_id: int, settlement: Settlement) -> Optional[Settlement]:
+        """Persist an updated settlement and broadcast the change."""
+        updated = self.repository.update_from_domain(settlement)
+        self._publish_invalidation(settlement_id, updated)
+        if updated is not None:
+            self._invalidate_trade_network(updated.article.project_id)
+        return updated
+
+    @staticmethod
+    def _to_trade_settlement(row: Tuple[Any, ...]) -> trade_network.TradeSettlement:
+        _, name, latitude, longitude, nearby, trade_goods = row
+        return trade_network.TradeSettlement(
+            name=name,
+            latitude=latitude,
+            longitude=longitude,
+            nearby=tuple(nearby or ()),
+            trade_goods=tuple(trade_goods or ()),
+        )
+
+    def _get_trade_network(self, project_id: int) -> trade_network.TradeNetwork:
+        """Get the project's trade network, rebuilding it if settlements changed since it was built."""
+        signature = self.repository.get_trade_signature(project_id)
+        network = trade_network.get_cached_network(project_id, signature)
+        if network is not None:
+            return network
+
+        settlements = {row[0]: self._to_trade_settlement(row) for row in self.repository.get_trade_rows(project_id)}
+        network = trade_network.TradeNetwork(settlements, signature)
+        trade_network.store_network(project_id, network)
+        return network
+
+    @staticmethod
+    def _invalidate_trade_network(project_id: int) -> None:
+        """Drop a project's cached trade network; the next read rebuilds it outside the cache lock."""
+        trade_network.invalidate_network(project_id)
+
     def get_settlement(self, settlement_id: int) -> Optional[Settlement]:
         """Get a settlement by ID."""
         db_settlement = self.repository.get_by_id(settlement_id)
@@ -23,11 +71,127 @@ class SettlementService:
             return self.repository.to_domain(db_settlement)
         return None
 
+    def get_settlements_by_article_ids(self, article_ids: List[int]) -> Dict[int, Settlement]:
+        """Get settlements by article ID with a single query, keyed by article ID."""
+        db_settlements = self.repository.get_by_article_ids(list(set(article_ids)))
+        return {db_settlement.article_id: self.repository.to_domain(db_settlement) for db_settlement in db_settlements}
+
     def get_settlements(self, skip: int = 0, limit: int = 100) -> List[Settlement]:
         """Get all settlements with pagination."""
         db_settlements = self.repository.get_all(skip, limit)
         return [self.repository.to_domain(db_settlement) for db_settlement in db_settlements]
 
+    def explore_settlements(
+        self,
+        project_id: int,
+        selected: Dict[str, Sequence[Any]],
+        name: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Tuple[List[Settlement], int, FacetCounts, List[Dict[str, Any]]]:
+        """
+        Get a page of settlements in a project matching the selected facets, with the total,
+        facet counts and a population histogram covering every category in size order.
+        """
+        db_settlements, total, facets = self.repository.faceted_search(project_id, selected, name, skip, limit)
+        category_counts = {item["value"]: item["count"] for item in facets.pop("population_category", [])}
+        histogram = [
+            {"category": category, "min_population": lower, "max_population": upper, "count": category_counts.get(category, 0)}
+            for category, lower, upper in population_category_ranges()
+        ]
+        histogram.append({
+            "category": UNKNOWN_POPULATION_CATEGORY,
+            "min_population": None,
+            "max_population": None,
+            "count": category_counts.get(UNKNOWN_POPULATION_CATEGORY, 0),
+        })
+        settlements = [self.repository.to_domain(db_settlement) for db_settlement in db_settlements]
+        return settlements, total, facets, histogram
+
+    def get_map_settlements(
+        self, project_id: int, south: float, west: float, north: float, east: float, limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Get map markers for the settlements inside a viewport (``west > east`` crosses the antimeridian)."""
+        return self.repository.get_in_bbox(project_id, south, west, north, east, limit)
+
+    def get_settlements_within(
+        self, project_id: int, lat: float, lng: float, radius_km: float, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Get settlements within a radius of a point, nearest first."""
+        return self.repository.get_within_radius(project_id, lat, lng, radius_km, limit)
+
+    def get_nearest_settlements(self, project_id: int, lat: float, lng: float, k: int = 10) -> List[Dict[str, Any]]:
+        """Get the k settlements nearest to a point."""
+        return self.repository.get_nearest(project_id, lat, lng, k)
+
+    def get_settlements_near(self, article_id: int, k: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the k settlements nearest to a settlement, excluding itself.
+
+        Returns None if the settlement does not exist and an empty list if it has no coordinates.
+        """
+        location = self.repository.get_location(article_id)
+        if location is None:
+            return None
+        project_id, lat, lng = location
+        if lat is None or lng is None:
+            return []
+        return self.repository.get_nearest(project_id, lat, lng, k, exclude_article_id=article_id)
+
+    def settlement_exists(self, article_id: int) -> bool:
+        """Check whether a settlement exists by article ID."""
+        return self.repository.get_location(article_id) is not None
+
+    def get_trade_route(self, from_id: int, to_id: int) -> Optional[TradeRoute]:
+        """Get the shortest trade route between two settlements (by article ID), or None if unconnected."""
+        start = self.repository.get_location(from_id)
+        end = self.repository.get_location(to_id)
+        if start is None or end is None or start[0] != end[0]:
+            return None
+        network = self._get_trade_network(start[0])
+        route = network.shortest_route(from_id, to_id)
+        if route is None:
+            return None
+        article_ids, distances, estimated = route
+        return TradeRoute(
+            stops=[
+                TradeRouteStop(id=article_id, name=network.settlements[article_id].name, distance_km=distance)
+                for article_id, distance in zip(article_ids, distances)
+            ],
+            hops=len(article_ids) - 1,
+            distance_km=distances[-1],
+            estimated=estimated,
+        )
+
+    def get_trade_components(self, project_id: int, min_size: int = 2) -> List[TradeComponent]:
+        """Get the groups of settlements connected by trade routes, largest first."""
+        network = self._get_trade_network(project_id)
+        components = []
+        for members in network.components():
+            if len(members) < min_size:
+                break
+            goods = {good for article_id in members for good in network.settlements[article_id].trade_goods}
+            components.append(TradeComponent(size=len(members), settlement_ids=members, trade_goods=sorted(goods)))
+        return components
+
+    def get_trade_hubs(self, project_id: int, limit: int = 20) -> List[TradeHub]:
+        """Get the settlements with the most (and shortest) trade routes, by hub score."""
+        network = self._get_trade_network(project_id)
+        return [
+            TradeHub(
+                id=article_id,
+                name=network.settlements[article_id].name,
+                degree=degree,
+                hub_score=score,
+                trade_goods=list(network.settlements[article_id].trade_goods),
+            )
+            for article_id, degree, score in network.hubs(limit)
+        ]
+
+    def get_settlement_type_counts(self, project_id: int) -> Dict[str, int]:
+        """Count a project's settlements per settlement type."""
+        return self.repository.count_by_type(project_id)
+
     def get_settlements_by_type(self, settlement_type: str, skip: int = 0, limit: int = 100) -> List[Settlement]:
         """Get settlements by type."""
         db_settlements = self.repository.get_by_type(settlement_type, skip, limit)
@@ -65,8 +229,12 @@ class SettlementService:
             domain_settlement.article.content.summary = settlement_data.description
         if settlement_data.region:
             domain_settlement.settlement_data.region = settlement_data.region
+        if settlement_data.coordinates:
+            domain_settlement.set_coordinates(settlement_data.coordinates.lat, settlement_data.coordinates.lng)
 
-        return self.repository.create_from_domain(domain_settlement)
+        created = self.repository.create_from_domain(domain_settlement)
+        self._invalidate_trade_network(created.article.project_id)
+        return created
 
     def update_settlement(self, settlement_id: int, settlement_data: SettlementUpdate) -> Optional[Settlement]:
         """Update an existing settlement."""
@@ -90,8 +258,10 @@ class SettlementService:
             current_settlement.settlement_data.region = settlement_data.region
         if settlement_data.ruler_name is not None:
             current_settlement.settlement_data.ruler_name = settlement_data.ruler_name
+        if settlement_data.coordinates is not None:
+            current_settlement.set_coordinates(settlement_data.coordinates.lat, settlement_data.coordinates.lng)
 
-        return self.repository.update_from_domain(current_settlement)
+        return self._save(settlement_id, current_settlement)
 
     def delete_settlement(self, settlement_id: int) -> Optional[Settlement]:
         """Delete a settlement."""
@@ -99,6 +269,8 @@ class SettlementService:
         settlement = self.get_settlement(settlement_id)
         if settlement:
             self.repository.delete(settlement_id)
+            self._publish_invalidation(settlement_id, settlement)
+            self._invalidate_trade_network(settlement.article.project_id)
         return settlement
 
     def add_notable_feature(self, settlement_id: int, feature: str) -> Optional[Settlement]:
@@ -106,7 +278,7 @@ class SettlementService:
         settlement = self.get_settlement(settlement_id)
         if settlement:
             settlement.add_notable_feature(feature)
-            return self.repository.update_from_domain(settlement)
+            return self._save(settlement_id, settlement)
         return None
 
     def add_trade_good(self, settlement_id: int, good: str) -> Optional[Settlement]:
@@ -114,7 +286,7 @@ class SettlementService:
         settlement = self.get_settlement(settlement_id)
         if settlement:
             settlement.add_trade_good(good)
-            return self.repository.update_from_domain(settlement)
+            return self._save(settlement_id, settlement)
         return None
 
     def set_ruler(self, settlement_id: int, ruler_name: str) -> Optional[Settlement]:
@@ -122,7 +294,7 @@ class SettlementService:
         settlement = self.get_settlement(settlement_id)
         if settlement:
             settlement.set_ruler(ruler_name)
-            return self.repository.update_from_domain(settlement)
+            return self._save(settlement_id, settlement)
         return None
 
     def add_nearby_settlement(self, settlement_id: int, nearby_settlement_name: str) -> Optional[Settlement]:
@@ -130,5 +302,5 @@ class SettlementService:
         settlement = self.get_settlement(settlement_id)
         if settlement:
             settlement.add_nearby_settlement(nearby_settlement_name)
-            return self.repository.update_from_domain(settlement)
+            return self._save(settlement_id, settlement)
         return None
\ No newline at end of file
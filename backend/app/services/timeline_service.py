@@ -0,0 +1,71 @@
+"""
+Timeline service for paging through a project's dated events.
+"""
+
+from sqlalchemy.orm import Session
+from app.domain.models.calendar import KEY_YEAR
+from app.repositories.timeline_repository import TimelineRepository
+from app.schemas.project import TimelineEvent, TimelinePage
+from typing import Optional, Tuple
+
+
+class InvalidTimelineQueryError(ValueError):
+    """Raised when a timeline bound or cursor can't be read."""
+    pass
+
+
+def _encode_cursor(sort_key: int, event_id: int) -> str:
+    return f"{sort_key}:{event_id}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, int]:
+    try:
+        sort_key, event_id = cursor.split(":")
+        return int(sort_key), int(event_id)
+    except ValueError:
+        raise InvalidTimelineQueryError(f"Invalid cursor '{cursor}'")
+
+
+class TimelineService:
+    """Service layer for the per-project timeline of dated events."""
+
+    def __init__(self, db: Session):
+        self.repository = TimelineRepository(db)
+
+    def get_timeline(
+        self,
+        project_id: int,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> TimelinePage:
+        """
+        Get a page of events in calendar order. ``date_from`` and ``date_to`` are dates
+        on the project calendar and are inclusive of the whole period they name, so
+        from=1400&to=1450 covers every event dated 1400 through 1450.
+        """
+        calendar = self.repository.get_calendar(project_id)
+        low = high = None
+        if date_from:
+            bounds = calendar.key_range(date_from)
+            if bounds is None:
+                raise InvalidTimelineQueryError(f"Can't read a year from '{date_from}'")
+            low = bounds[0]
+        if date_to:
+            bounds = calendar.key_range(date_to)
+            if bounds is None:
+                raise InvalidTimelineQueryError(f"Can't read a year from '{date_to}'")
+            high = bounds[1]
+
+        after = _decode_cursor(cursor) if cursor else None
+        # One extra row tells us whether another page follows
+        rows = self.repository.get_page(project_id, low, high, after, limit + 1)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1]["sort_key"], rows[-1]["id"])
+        return TimelinePage(
+            items=[TimelineEvent(year=row["sort_key"] // KEY_YEAR, **row) for row in rows],
+            next_cursor=next_cursor,
+        )
@@ -0,0 +1,95 @@
+"""
+In-memory title index for autocomplete.
+
+Each project's article titles are held as a list sorted by lower-cased title, so
+a prefix lookup is a binary search plus a short slice. Indexes are built lazily
+on first use and stamped with the project's change version (article count and
+article version); when the version moves on, only the articles written since are
+re-read and patched in, and a full rebuild happens only if articles were removed.
+A bounded number of projects is kept per worker, least recently used first out.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Hashable, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+# (id, title, article_type)
+TitleRow = Tuple[int, str, str]
+
+
+class TitleIndex:
+    """Sorted titles of one project's articles."""
+
+    def __init__(self, rows: Iterable[TitleRow], signature: Hashable):
+        self.signature = signature
+        self._entries: List[Tuple[str, int, str, str]] = sorted(
+            (title.lower(), article_id, title, article_type) for article_id, title, article_type in rows
+        )
+        self._keys = {entry[1]: entry[0] for entry in self._entries}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, prefix: str, limit: int) -> List[TitleRow]:
+        """Titles starting with ``prefix`` (case-insensitively), in lower-cased title order."""
+        prefix = prefix.lower()
+        matches = []
+        position = bisect_left(self._entries, (prefix,))
+        while position < len(self._entries) and len(matches) < limit:
+            key, article_id, title, article_type = self._entries[position]
+            if not key.startswith(prefix):
+                break
+            matches.append((article_id, title, article_type))
+            position += 1
+        return matches
+
+    def with_rows(self, rows: Iterable[TitleRow], signature: Hashable) -> "TitleIndex":
+        """A copy with the given articles added or replaced; the original is left untouched for concurrent readers."""
+        index = TitleIndex.__new__(TitleIndex)
+        index.signature = signature
+        index._entries = list(self._entries)
+        index._keys = dict(self._keys)
+        for article_id, title, article_type in rows:
+            old_key = index._keys.get(article_id)
+            if old_key is not None:
+                position = bisect_left(index._entries, (old_key, article_id))
+                del index._entries[position]
+            insort(index._entries, (title.lower(), article_id, title, article_type))
+            index._keys[article_id] = title.lower()
+        return index
+
+
+_indexes: "OrderedDict[int, TitleIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    """Whether title indexes are kept in memory at all (otherwise the database prefix index is used)."""
+    return settings.AUTOCOMPLETE_CACHE_PROJECTS > 0
+
+
+def get_cached_index(project_id: int) -> Optional[TitleIndex]:
+    """Return the cached index for a project, current or not; check its signature before use."""
+    with _indexes_lock:
+        index = _indexes.get(project_id)
+        if index is not None:
+            _indexes.move_to_end(project_id)
+        return index
+
+
+def store_index(project_id: int, index: TitleIndex) -> None:
+    """Cache an index for a project, evicting the least recently used projects if full."""
+    with _indexes_lock:
+        _indexes[project_id] = index
+        _indexes.move_to_end(project_id)
+        while len(_indexes) > settings.AUTOCOMPLETE_CACHE_PROJECTS:
+            _indexes.popitem(last=False)
+
+
+def invalidate_index(project_id: int) -> None:
+    """Drop the cached index for a project."""
+    with _indexes_lock:
+        _indexes.pop(project_id, None)
@@ -0,0 +1,252 @@
+"""
+Trade network analytics over a project's settlements.
+
+Two settlements are linked when either lists the other in ``nearby_settlements``
+(matched case-insensitively by title). Links are weighted by great-circle
+distance when both ends have coordinates, and by the mean known link length
+otherwise. The graph is held in CSR arrays (``indptr``/``indices``/``weights``)
+and analytics are computed lazily, once per network.
+
+Networks are cached per project and stamped with the project's settlement
+signature; a network whose signature has moved on, or that a settlement write
+in this worker dropped, is rebuilt whole on next use. There is deliberately no
+incremental update. The CSR arrays, the fallback link weight, components and
+hub scores all depend on the whole graph, so a patch would redo most of a
+build. It would also only be correct if the cached network were built from
+exactly the state before the write, which a per-worker cache cannot tell apart
+from one that missed another worker's change.
+"""
+
+import heapq
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+DAMPING = 0.85
+_MAX_ITERATIONS = 100
+_TOLERANCE = 1e-10
+
+
+@dataclass(frozen=True)
+class TradeSettlement:
+    """The parts of a settlement the trade network is built from."""
+    name: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    nearby: Tuple[str, ...] = ()
+    trade_goods: Tuple[str, ...] = ()
+
+
+def _name_key(name: Any) -> Optional[str]:
+    if not isinstance(name, str):
+        return None
+    return name.strip().lower() or None
+
+
+class TradeNetwork:
+    """Undirected, weighted settlement graph for one project, keyed by article ID."""
+
+    def __init__(self, settlements: Dict[int, TradeSettlement], signature: Hashable):
+        self.settlements = settlements
+        self.signature = signature
+        self.ids = np.array(sorted(settlements), dtype=np.int64)
+        self._positions = {article_id: position for position, article_id in enumerate(self.ids.tolist())}
+        self._build_edges()
+        self._lists: Optional[Tuple[List[int], List[int], List[float], List[bool]]] = None
+        self._components: Optional[List[List[int]]] = None
+        self._hub_scores: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return int(self.ids.shape[0])
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.indices.shape[0]) // 2
+
+    def _build_edges(self) -> None:
+        n = len(self)
+        ids = self.ids.tolist()
+
+        # Duplicate titles resolve to the lowest article ID
+        by_name: Dict[str, int] = {}
+        for position, article_id in enumerate(ids):
+            key = _name_key(self.settlements[article_id].name)
+            if key is not None:
+                by_name.setdefault(key, position)
+
+        pairs = set()
+        for position, article_id in enumerate(ids):
+            for name in self.settlements[article_id].nearby:
+                other = by_name.get(_name_key(name))
+                if other is not None and other != position:
+                    pairs.add((min(position, other), max(position, other)))
+
+        ordered = sorted(pairs)
+        first = np.fromiter((a for a, _ in ordered), dtype=np.int64, count=len(ordered))
+        second = np.fromiter((b for _, b in ordered), dtype=np.int64, count=len(ordered))
+
+        lat = np.array([self._coordinate(article_id, "latitude") for article_id in ids], dtype=np.float64)
+        lng = np.array([self._coordinate(article_id, "longitude") for article_id in ids], dtype=np.float64)
+        distance = self._haversine(lat[first], lng[first], lat[second], lng[second])
+        known = ~np.isnan(distance)
+        fallback = float(distance[known].mean()) if known.any() else 1.0
+        distance[~known] = fallback
+
+        # Store each link in both directions, grouped by source position
+        sources = np.concatenate([first, second])
+        targets = np.concatenate([second, first])
+        order = np.lexsort((targets, sources))
+        self.indices = targets[order]
+        self.weights = np.concatenate([distance, distance])[order]
+        self.known = np.concatenate([known, known])[order]
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=self.indptr[1:])
+
+    def _coordinate(self, article_id: int, field: str) -> float:
+        value = getattr(self.settlements[article_id], field)
+        return np.nan if value is None else value
+
+    @staticmethod
+    def _haversine(lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray) -> np.ndarray:
+        lat1, lng1, lat2, lng2 = (np.radians(values) for values in (lat1, lng1, lat2, lng2))
+        a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+    def _adjacency_lists(self) -> Tuple[List[int], List[int], List[float], List[bool]]:
+        # Python lists index far faster than NumPy scalars inside traversal loops
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist(), self.weights.tolist(), self.known.tolist())
+        return self._lists
+
+    def shortest_route(self, from_id: int, to_id: int) -> Optional[Tuple[List[int], List[float], bool]]:
+        """
+        Shortest route between two settlements as (article IDs, cumulative distances, estimated),
+        or None if they are not connected. ``estimated`` is set when a link lacked coordinates.
+        """
+        start, goal = self._positions.get(from_id), self._positions.get(to_id)
+        if start is None or goal is None:
+            return None
+        indptr, indices, weights, _ = self._adjacency_lists()
+
+        distances = {start: 0.0}
+        previous: Dict[int, int] = {}
+        heap = [(0.0, start)]
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if node == goal:
+                break
+            if distance > distances[node]:
+                continue
+            for edge in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[edge]
+                candidate = distance + weights[edge]
+                if candidate < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = candidate
+                    previous[neighbor] = node
+                    heapq.heappush(heap, (candidate, neighbor))
+        if goal not in distances:
+            return None
+
+        path = [goal]
+        while path[-1] != start:
+            path.append(previous[path[-1]])
+        path.reverse()
+        estimated = any(not self._edge_known(a, b) for a, b in zip(path, path[1:]))
+        return [int(self.ids[node]) for node in path], [distances[node] for node in path], estimated
+
+    def _edge_known(self, source: int, target: int) -> bool:
+        indptr, indices, _, known = self._adjacency_lists()
+        for edge in range(indptr[source], indptr[source + 1]):
+            if indices[edge] == target:
+                return known[edge]
+        return False
+
+    def components(self) -> List[List[int]]:
+        """Connected groups of settlements as article IDs, largest first."""
+        if self._components is None:
+            indptr, indices, _, _ = self._adjacency_lists()
+            ids = self.ids.tolist()
+            seen = [False] * len(self)
+            components = []
+            for root in range(len(self)):
+                if seen[root]:
+                    continue
+                seen[root] = True
+                members, stack = [], [root]
+                while stack:
+                    node = stack.pop()
+                    members.append(ids[node])
+                    for neighbor in indices[indptr[node]:indptr[node + 1]]:
+                        if not seen[neighbor]:
+                            seen[neighbor] = True
+                            stack.append(neighbor)
+                components.append(sorted(members))
+            components.sort(key=lambda members: (-len(members), members[0]))
+            self._components = components
+        return self._components
+
+    def degrees(self) -> np.ndarray:
+        """Number of links per settlement, aligned with ``ids``."""
+        return np.diff(self.indptr)
+
+    def hub_scores(self) -> np.ndarray:
+        """
+        PageRank per settlement, aligned with ``ids``, with links weighted by inverse
+        distance so settlements with many short routes score highest. Scores sum to 1.
+        """
+        if self._hub_scores is None:
+            n = len(self)
+            if n == 0:
+                self._hub_scores = np.zeros(0)
+                return self._hub_scores
+            sources = np.repeat(np.arange(n), np.diff(self.indptr))
+            strength = 1.0 / np.maximum(self.weights, 1e-3)
+            out_strength = np.bincount(sources, weights=strength, minlength=n)
+            dangling = out_strength == 0
+            share = strength / np.where(out_strength == 0, 1.0, out_strength)[sources]
+
+            scores = np.full(n, 1.0 / n)
+            for _ in range(_MAX_ITERATIONS):
+                spread = np.bincount(self.indices, weights=scores[sources] * share, minlength=n)
+                updated = (1 - DAMPING) / n + DAMPING * (spread + scores[dangling].sum() / n)
+                converged = np.abs(updated - scores).sum() < _TOLERANCE
+                scores = updated
+                if converged:
+                    break
+            self._hub_scores = scores
+        return self._hub_scores
+
+    def hubs(self, limit: int) -> List[Tuple[int, int, float]]:
+        """The top settlements by hub score as (article ID, degree, score)."""
+        scores = self.hub_scores()
+        degrees = self.degrees()
+        order = np.lexsort((self.ids, -scores))[:limit]
+        return [(int(self.ids[i]), int(degrees[i]), float(scores[i])) for i in order]
+
+
+_networks: Dict[int, TradeNetwork] = {}
+_networks_lock = threading.Lock()
+
+
+def get_cached_network(project_id: int, signature: Hashable) -> Optional[TradeNetwork]:
+    """Return the cached network for a project if it is still current."""
+    with _networks_lock:
+        network = _networks.get(project_id)
+    if network is not None and network.signature == signature:
+        return network
+    return None
+
+
+def store_network(project_id: int, network: TradeNetwork) -> None:
+    """Cache a freshly built network for a project."""
+    with _networks_lock:
+        _networks[project_id] = network
+
+
+def invalidate_network(project_id: int) -> None:
+    """Drop the cached network for a project."""
+    with _networks_lock:
+        _networks.pop(project_id, None)
@@ -0,0 +1,42 @@
+"""
+Import a project export (NDJSON, gzip'd NDJSON or tar bundle) from the command line.
+
+Usage: python import_project.py path/to/project-1.ndjson.gz [--name "New name"]
+"""
+import argparse
+import sys
+import time
+
+from app.db.database import SessionLocal
+from app.services.project_import_service import ProjectImportService, ProjectImportError
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import a MythosEngine project export")
+    parser.add_argument("path", help="Export file, or '-' to read from stdin")
+    parser.add_argument("--name", help="Name for the new project (defaults to the exported name)")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+
+    def report(stage, counts):
+        total = sum(counts.values())
+        elapsed = max(time.monotonic() - started, 1e-6)
+        print(f"[{elapsed:7.1f}s] {stage}: {total} rows ({total / elapsed:,.0f} rows/s) {counts}", file=sys.stderr)
+
+    db = SessionLocal()
+    try:
+        source = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+        with source:
+            result = ProjectImportService(db).import_project(source, project_name=args.name, progress=report)
+    except ProjectImportError as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print(f"Imported project {result.project_id}: {result.counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import pytest
+
+from app.domain.models.calendar import Calendar, Era
+
+DEFAULT = Calendar()
+HARPTOS = Calendar(
+    eras=[Era("DR"), Era("Before Reckoning", 1, True)],
+    months=["Hammer", "Alturiak", "Ches"],
+    default_era="DR",
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("1425", (1425, 0, 0)),
+        ("June 1425", (1425, 6, 0)),
+        ("jun 1425", (1425, 6, 0)),
+        ("15 June 1425", (1425, 6, 15)),
+        ("June 15th, 1425", (1425, 6, 15)),
+        ("3rd of March 1425", (1425, 3, 3)),
+        ("Summer 1425", (1425, 6, 0)),
+        ("Spring, 1425", (1425, 3, 0)),
+        ("Fall of 476", (476, 9, 0)),
+        ("1425-06-15", (1425, 6, 15)),
+        ("1425-06", (1425, 6, 0)),
+        ("-44-03-15", (-44, 3, 15)),
+        ("200 BC", (-199, 0, 0)),
+        ("1 BCE", (0, 0, 0)),
+        ("March 44 BC", (-43, 3, 0)),
+        ("March 5 AD", (5, 3, 0)),
+    ],
+)
+def test_parse_default_calendar(text, expected):
+    assert DEFAULT.parse(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # Words that are not beside a number are not months or seasons
+        ("Fall of Rome, 476", (476, 0, 0)),
+        ("It may have been 1425", (1425, 0, 0)),
+        # A lone day-sized number beside a month is a day, so there is no year
+        ("March 5", None),
+        ("5 March", None),
+        # Seasons have no days
+        ("Winter 12", (12, 12, 0)),
+        ("", None),
+        ("   ", None),
+        (None, None),
+        ("the long winter", None),
+    ],
+)
+def test_parse_ambiguous_dates(text, expected):
+    assert DEFAULT.parse(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("15 Hammer 1372 DR", (1372, 1, 15)),
+        ("Ches 1372", (1372, 3, 0)),
+        ("1372", (1372, 0, 0)),
+        ("1372-02-03", (1372, 2, 3)),
+        ("200 Before Reckoning", (-199, 0, 0)),
+        ("Hammer 3", None),
+        ("Hammer 3 DR", (3, 1, 0)),
+    ],
+)
+def test_parse_project_calendar(text, expected):
+    assert HARPTOS.parse(text) == expected
+
+
+def test_reverse_era_counts_back_from_its_start():
+    calendar = Calendar(eras=[Era("BE", 500, True), Era("AE", 500)])
+    assert calendar.parse("200 BE") == (300, 0, 0)
+    assert calendar.parse("200 AE") == (700, 0, 0)
+    assert calendar.sort_key("201 BE") < calendar.sort_key("200 BE") < calendar.sort_key("1 AE")
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("1425", (14250000, 14259999)),
+        ("June 1425", (14250600, 14250699)),
+        ("15 June 1425", (14250615, 14250615)),
+        ("1425-06-15", (14250615, 14250615)),
+        ("200 BC", (-1990000, -1980001)),
+        ("March 5", None),
+    ],
+)
+def test_key_range(text, expected):
+    assert DEFAULT.key_range(text) == expected
+
+
+def test_sort_keys_order_partial_dates_before_precise_ones():
+    keys = [DEFAULT.sort_key(text) for text in ["200 BC", "1425", "Spring 1425", "3 March 1425", "June 1425"]]
+    assert keys == sorted(keys)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"eras": [{"name": "DR"}, {"name": "dr"}]},
+        {"months": [f"Month {n}" for n in range(100)]},
+        {"months": ["Hammer", " "]},
+        {"eras": [{"name": "DR"}], "default_era": "AD"},
+    ],
+)
+def test_invalid_calendars_are_rejected(config):
+    with pytest.raises(ValueError):
+        Calendar.from_dict(config)
+
+
+def test_calendar_round_trips_through_dict():
+    assert Calendar.from_dict(HARPTOS.to_dict()).to_dict() == HARPTOS.to_dict()
@@ -0,0 +1,111 @@
+import json
+from dataclasses import asdict
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.domain.models.person import ImportantDate, PersonData
+from app.domain.models.settlement import SettlementData, SettlementType
+from app.repositories.timeline_repository import _PROJECT_EVENTS_SQL, person_events, settlement_events
+
+# (person data, the events person_events should give for it)
+PERSON_CASES = [
+    (
+        PersonData(
+            birth_date=" 1425 ",
+            death_date="1490",
+            important_dates=[
+                ImportantDate(date="1425", event="Birth"),
+                ImportantDate(date=" 1490\n", event="death "),
+                ImportantDate(date="Summer 1450", event="Coronation"),
+                ImportantDate(date="", event="Wedding"),
+                ImportantDate(date="1460", event=" "),
+            ],
+        ),
+        [
+            ("birth", "Birth", "1425", 0),
+            ("event", "Coronation", "Summer 1450", 3),
+            ("event", " ", "1460", 5),
+            ("death", "Death", "1490", 0),
+        ],
+    ),
+    (
+        PersonData(death_date="\t1400\t", important_dates=[ImportantDate(date="1350", event="Birth")]),
+        [("event", "Birth", "1350", 1), ("death", "Death", "1400", 0)],
+    ),
+    # Only ASCII whitespace is trimmed, on both sides
+    (
+        PersonData(birth_date="\u00a01425", important_dates=[ImportantDate(date="1425", event="Birth")]),
+        [("birth", "Birth", "\u00a01425", 0), ("event", "Birth", "1425", 1)],
+    ),
+    (PersonData(birth_date="  ", death_date="", important_dates=[]), []),
+]
+
+SETTLEMENT_CASES = [
+    (SettlementData(SettlementType.TOWN, founded_date="  Spring 1100 "), [("founded", "Founded", "Spring 1100", 0)]),
+    (SettlementData(SettlementType.TOWN, founded_date=" "), []),
+    (SettlementData(SettlementType.TOWN), []),
+]
+
+
+@pytest.mark.parametrize("person_data, expected", PERSON_CASES)
+def test_person_events(person_data, expected):
+    assert person_events(person_data) == expected
+
+
+@pytest.mark.parametrize("settlement_data, expected", SETTLEMENT_CASES)
+def test_settlement_events(settlement_data, expected):
+    assert settlement_events(settlement_data) == expected
+
+
+@pytest.fixture(scope="module")
+def connection():
+    engine = create_engine(settings.database_url)
+    try:
+        connection = engine.connect()
+    except OperationalError:
+        pytest.skip("PostgreSQL is not available")
+    transaction = connection.begin()
+    # Temporary tables shadow the real ones, so only the columns the query reads are needed
+    connection.execute(text("CREATE TEMPORARY TABLE articles (id integer, project_id integer) ON COMMIT DROP"))
+    connection.execute(text("CREATE TEMPORARY TABLE persons (article_id integer, person_data jsonb) ON COMMIT DROP"))
+    connection.execute(
+        text("CREATE TEMPORARY TABLE settlements (article_id integer, settlement_data jsonb) ON COMMIT DROP")
+    )
+    yield connection
+    transaction.rollback()
+    connection.close()
+    engine.dispose()
+
+
+def _project_events(connection, table, article_id, data):
+    connection.execute(text("INSERT INTO articles VALUES (:id, :id)"), {"id": article_id})
+    connection.execute(
+        text(f"INSERT INTO {table} VALUES (:id, CAST(:data AS jsonb))"), {"id": article_id, "data": json.dumps(data)}
+    )
+    rows = connection.execute(text(_PROJECT_EVENTS_SQL), {"project_id": article_id}).all()
+    return sorted(tuple(row[1:]) for row in rows)
+
+
+@pytest.mark.parametrize("case", range(len(PERSON_CASES)))
+def test_person_events_match_project_sql(connection, case):
+    person_data, _ = PERSON_CASES[case]
+    stored = {
+        "birth_date": person_data.birth_date,
+        "death_date": person_data.death_date,
+        "important_dates": [asdict(item) for item in person_data.important_dates],
+    }
+    assert _project_events(connection, "persons", 1000 + case, stored) == sorted(
+        person_events(person_data)
+    )
+
+
+@pytest.mark.parametrize("case", range(len(SETTLEMENT_CASES)))
+def test_settlement_events_match_project_sql(connection, case):
+    settlement_data, _ = SETTLEMENT_CASES[case]
+    stored = {"founded_date": settlement_data.founded_date}
+    assert _project_events(connection, "settlements", 2000 + case, stored) == sorted(
+        settlement_events(settlement_data)
+    )
@@ -1,11 +1,25 @@
 import { apiClient } from './client'
-import type { Article, ArticleCreate, ArticleUpdate } from '@/types/article'
+import type { Article, ArticleCreate, ArticleSummary, ArticleUpdate, BatchResponse } from '@/types/article'
 
 export const ArticlesApi = {
-	list: (params?: { project_id?: number; skip?: number; limit?: number }) =>
-		apiClient.get<Article[]>('/articles', { query: params }),
+	list: (params?: {
+		project_id?: number
+		skip?: number
+		limit?: number
+		include_header_image?: boolean
+	}) => apiClient.get<Article[]>('/articles', { query: params }),
 
-	get: (articleId: number) => apiClient.get<Article>(`/articles/${articleId}`),
+	listSummaries: (params?: { project_id?: number; skip?: number; limit?: number }) =>
+		apiClient.get<ArticleSummary[]>('/articles', { query: { ...params, view: 'summary' } }),
+
+	get: (articleId: number, params?: { include_header_image?: boolean }) =>
+		apiClient.get<Article>(`/articles/${articleId}`, { query: params }),
+
+	getMany: (articleIds: number[], params?: { include_header_image?: boolean }) =>
+		apiClient.post<BatchResponse<Article>>(
+			`/articles/batch${params?.include_header_image ? '?include_header_image=true' : ''}`,
+			{ ids: articleIds },
+		),
 
 	create: (input: ArticleCreate) => apiClient.post<Article>('/articles', input),
 
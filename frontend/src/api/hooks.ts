@@ -60,6 +60,13 @@ export function useArticles(params?: { project_id?: number; skip?: number; limit
 	})
 }
 
+export function useArticleSummaries(params?: { project_id?: number; skip?: number; limit?: number }) {
+	return useQuery({
+		queryKey: queryKeys.articles.summaries(params),
+		queryFn: () => ArticlesApi.listSummaries(params),
+	})
+}
+
 export function useArticle(articleId: number) {
 	return useQuery({
 		queryKey: queryKeys.articles.detail(articleId),
@@ -12,5 +12,6 @@ export const ProjectsApi = {
 	update: (projectId: number, input: ProjectUpdate) =>
 		apiClient.put<Project>(`/projects/${projectId}`, input),
 
-	delete: (projectId: number) => apiClient.delete<{ message: string }>(`/projects/${projectId}`),
+	delete: (projectId: number) =>
+		apiClient.delete<{ message: string; job_id: string }>(`/projects/${projectId}`),
 }
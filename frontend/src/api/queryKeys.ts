@@ -7,6 +7,8 @@ export const queryKeys = {
 	articles: {
 		all: ['articles'] as const,
 		list: (params?: { project_id?: number; skip?: number; limit?: number }) => ['articles', 'list', params ?? {}] as const,
+		summaries: (params?: { project_id?: number; skip?: number; limit?: number }) =>
+			['articles', 'summaries', params ?? {}] as const,
 		detail: (articleId: number) => ['articles', 'detail', articleId] as const,
 	},
 }
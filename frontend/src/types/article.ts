@@ -34,11 +34,22 @@ export interface Image {
   height?: number | null;
   is_s3_stored: boolean;
   s3_bucket?: string | null;
+  placeholder_color?: string | null;
   project_id: number;
   created_at: string;
   updated_at: string;
 }
 
+export interface ArticleHeaderImage {
+  id: number;
+  url: string;
+  width?: number | null;
+  height?: number | null;
+  alt_text?: string | null;
+  placeholder?: string | null;
+  thumbnail_url?: string | null;
+}
+
 export interface Article {
   id: number;
   title: string;
@@ -46,7 +57,7 @@ export interface Article {
   article_type: ArticleType;
   project_id: number;
   header_image_id?: number | null;
-  header_image?: Image | null;
+  header_image?: ArticleHeaderImage | null;
   spotify_url?: string | null;
   created_at: string;
   updated_at: string;
@@ -69,11 +80,17 @@ export interface ArticleUpdate {
   spotify_url?: string | null;
 }
 
+export interface BatchResponse<T> {
+  items: (T | null)[];
+  missing: number[];
+}
+
 export interface ArticleSummary {
   id: number;
   title: string;
   article_type: ArticleType;
   project_id: number;
+  summary?: string | null;
   word_count: number;
   created_at: string;
   updated_at: string;